@@ -0,0 +1,239 @@
+"""
+Geometry benchmark suite for the drawing package.
+
+Every config builder, the two meander builders and the pyaedt exporter are run
+with representative and scaled-up parameters. Each case records its best wall
+time over several cold runs (all cell caches cleared), its peak traced memory,
+and the polygon and vertex counts of the result. Results are written to JSON and
+optionally compared against a stored baseline; the script exits with a non-zero
+status when a case regresses by more than the threshold, so it can gate CI jobs.
+
+Usage:
+    python benchmarks/geometry.py --output results.json
+    python benchmarks/geometry.py --baseline benchmarks/geometry_baseline.json --threshold 0.25
+    python benchmarks/geometry.py --filter transmon --repeat 5
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+from typing import Callable
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(REPO_ROOT / "src"), str(REPO_ROOT)]
+
+import gdsfactory as gf
+
+from drawing.export_to_pyaedt.config import ExportConfig
+from drawing.export_to_pyaedt.parser import parse_component_multi
+from drawing.junction import (
+    AntisymmetricJunctionConfig, FunnelrArmConfig, RegularArmConfig, SymmetricJunctionConfig, TArmConfig,
+)
+from drawing.junction_chain import JunctionChainConfig
+from drawing.meander.euler import meander_euler
+from drawing.meander.optimal_turn import meander_optimal_turn
+from drawing.shared import clear_config_cell_cache
+from drawing.snail import SnailConfig
+from drawing.squid import SquidConfig
+from drawing.transmon import AntennaConfig, PadConfig, TaperConfig, TransmonConfig
+from drawing.wafer import WaferRegularSplitConfig
+
+# Metrics compared against the baseline. Counts are deterministic, so any increase
+# beyond the threshold is a real change of the generated geometry.
+COMPARED_METRICS = ("time", "peak_memory", "polygons", "vertices")
+
+
+def _export_case(component_factory: Callable[[], gf.Component], port: str, tolerance: float = 0) -> Callable:
+    def run():
+        component = component_factory()
+        config = ExportConfig(name="bench", port=port, orientation="X", surface_orientation="Z", tolerance=tolerance)
+        parse_component_multi(component, config)
+        return component
+    return run
+
+
+def _with_port(component: gf.Component) -> gf.Component:
+    # The exporter aligns on a port, which the merged transmon does not expose
+    c = gf.Component()
+    c << component
+    c.add_port("origin", center=(component.dxmin, component.dcenter[1]), width=1, orientation=180, layer=(1, 0))
+    return c
+
+
+def benchmark_cases() -> dict[str, Callable[[], gf.Component]]:
+    """
+    Returns:
+        dict[str, Callable]: Case name to a function building the benchmarked component.
+    """
+    cases = {
+        "pad": lambda: PadConfig().build(),
+        "pad_scaled": lambda: PadConfig(width=2000, length=1000, radius=50).build(),
+        "taper": lambda: TaperConfig().build(),
+        "antenna": lambda: AntennaConfig().build(),
+        "antenna_scaled": lambda: AntennaConfig(length=2000, width=50, radius=500).build(),
+        "squid": lambda: SquidConfig().build(),
+        "snail": lambda: SnailConfig().build(),
+        "snail_chain_200": lambda: JunctionChainConfig(element=SnailConfig(), count=200).build(),
+        "transmon": lambda: TransmonConfig().build(),
+        "transmon_scaled": lambda: TransmonConfig(pad=PadConfig(width=500, length=400, radius=50)).build(),
+        "meander_euler": lambda: meander_euler(),
+        "meander_euler_scaled": lambda: meander_euler(
+            wire_width=100, height=1025, padding_length=2400, spacing=300, num_turns=60, radius=100,
+        ),
+        "meander_optimal_turn": lambda: meander_optimal_turn(),
+        "meander_optimal_turn_scaled": lambda: meander_optimal_turn(num_turns=90),
+        "wafer_regular_split": lambda: WaferRegularSplitConfig().build(),
+        "export_meander": _export_case(
+            lambda: meander_euler(wire_width=10, height=1025, padding_length=2400, spacing=300, num_turns=60, radius=100),
+            port="e1",
+        ),
+        "export_meander_simplified": _export_case(
+            lambda: meander_euler(wire_width=10, height=1025, padding_length=2400, spacing=300, num_turns=60, radius=100),
+            port="e1",
+            tolerance=0.1,
+        ),
+        "export_transmon": _export_case(lambda: _with_port(TransmonConfig().build()), port="origin"),
+    }
+
+    arms = {"regular": RegularArmConfig, "funnel": FunnelrArmConfig, "t": TArmConfig}
+    junctions = {"symmetric": SymmetricJunctionConfig, "antisymmetric": AntisymmetricJunctionConfig}
+    for junction_name, junction in junctions.items():
+        for arm_name, arm in arms.items():
+            cases[f"junction_{junction_name}_{arm_name}"] = (
+                lambda junction=junction, arm=arm: junction(arm=arm()).build()
+            )
+    return cases
+
+
+def clear_caches() -> None:
+    """
+    Drops every cached cell so that a run measures a cold build.
+    """
+    clear_config_cell_cache()
+    gf.clear_cache()
+    gc.collect()
+
+
+def count_geometry(component: gf.Component) -> tuple[int, int]:
+    """
+    Returns:
+        tuple[int, int]: Number of polygons and vertices of the flattened component.
+    """
+    polygons = [p for layer_polygons in component.get_polygons_points().values() for p in layer_polygons]
+    return len(polygons), sum(len(p) for p in polygons)
+
+
+def run_case(build: Callable[[], gf.Component], repeat: int) -> dict:
+    """
+    Measures one benchmark case.
+
+    Args:
+        build (Callable): Function building the component.
+        repeat (int): Number of timed cold runs, the best one counts.
+
+    Returns:
+        dict: The measured metrics, or the error message if the case failed.
+    """
+    try:
+        times = []
+        for _ in range(repeat):
+            clear_caches()
+            start = time.perf_counter()
+            component = build()
+            times.append(time.perf_counter() - start)
+        # Clearing the caches destroys the cells, so the result is counted right away
+        polygons, vertices = count_geometry(component)
+
+        # Memory is traced in a separate run, tracing slows the build down
+        clear_caches()
+        tracemalloc.start()
+        build()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    except Exception as e:
+        tracemalloc.stop()
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    return {"time": min(times), "peak_memory": peak_memory, "polygons": polygons, "vertices": vertices}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Lists the metrics of the results exceeding the baseline by more than the threshold.
+
+    Args:
+        results (dict): Case name to metrics of the current run.
+        baseline (dict): Case name to metrics of the baseline run.
+        threshold (float): Allowed relative increase, e.g. 0.25 for 25 %.
+
+    Returns:
+        list[str]: One message per regression.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if "error" in metrics and "error" not in reference:
+            regressions.append(f"{name}: fails with {metrics['error']}")
+            continue
+        for metric in COMPARED_METRICS:
+            if metric not in metrics or metric not in reference:
+                continue
+            if metrics[metric] > reference[metric] * (1 + threshold):
+                regressions.append(f"{name}: {metric} {reference[metric]:.6g} -> {metrics[metric]:.6g}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, help="Path of the JSON file the results are written to.")
+    parser.add_argument("--baseline", type=Path, help="JSON results of a previous run to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression per metric.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of cold runs per case, the best one counts.")
+    parser.add_argument("--filter", default="", help="Only run the cases whose name contains this string.")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    gf.gpdk.PDK.activate()
+
+    results = {}
+    for name, build in benchmark_cases().items():
+        if args.filter not in name:
+            continue
+        metrics = run_case(build, args.repeat)
+        results[name] = metrics
+        if "error" in metrics:
+            print(f"{name:<32} ERROR {metrics['error']}")
+        else:
+            print(
+                f"{name:<32} {metrics['time'] * 1000:9.2f} ms  {metrics['peak_memory'] / 2 ** 20:8.2f} MiB"
+                f"  {metrics['polygons']:6d} polygons  {metrics['vertices']:8d} vertices"
+            )
+
+    if args.output is not None:
+        report = {
+            "python": platform.python_version(),
+            "gdsfactory": gf.__version__,
+            "cases": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["cases"]
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
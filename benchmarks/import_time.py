@@ -0,0 +1,71 @@
+"""
+Cold import-time benchmark for the drawing package.
+
+Each statement is timed in a fresh interpreter several times and the best run
+is compared against its budget. The script exits with a non-zero status when a
+budget is exceeded, so it can gate CI jobs and worker images. It also fails when
+the lazy export table of the package root disagrees with the subpackages.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget-package 0.2 --budget-config 4 --repeat 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_TIMER = "import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+
+
+def cold_import_time(statement: str, repeat: int) -> float:
+    """
+    Returns the best wall time in seconds of running an import statement in a fresh interpreter.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT / "src"), str(REPO_ROOT), env.get("PYTHONPATH")]))
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(statement=statement)],
+            env=env, check=True, capture_output=True, text=True,
+        )
+        times.append(float(out.stdout.strip().splitlines()[-1]))
+    return min(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-package", type=float, default=0.2, help="Budget in seconds for `import drawing`.")
+    parser.add_argument("--budget-config", type=float, default=4.0, help="Budget in seconds for `from drawing import PadConfig`.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of cold runs per statement, the best one counts.")
+    args = parser.parse_args()
+
+    checks = [
+        ("import drawing", args.budget_package),
+        ("from drawing import PadConfig", args.budget_config),
+    ]
+
+    failed = False
+    for statement, budget in checks:
+        elapsed = cold_import_time(statement, args.repeat)
+        status = "ok" if elapsed <= budget else "OVER BUDGET"
+        failed |= elapsed > budget
+        print(f"{statement:<36} {elapsed:7.3f}s  (budget {budget:.3f}s)  {status}")
+
+    sys.path[:0] = [str(REPO_ROOT / "src"), str(REPO_ROOT)]
+    import drawing
+
+    for mismatch in drawing._export_mismatches():
+        failed = True
+        print(f"export mismatch: {mismatch}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterable
+import csv
+import os
+import shutil
+import threading
 import gdsfactory as gf
 import json
+from drawing.shared.layout_export import LayoutFileReport, write_layout
 
-def create_wafer_dir(gds: gf.Component, dir_name: str, design_json: str) -> None:
+# Root of the wafer directories, set DRAWING_OUTPUT_ROOT to write to the group share
+DEFAULT_OUTPUT_ROOT = Path(os.environ.get("DRAWING_OUTPUT_ROOT", Path.home() / "Fabrication"))
+
+RESISTANCE_CSV_HEADER = ("Sample", "Point", "Resistance (Ohm)")
+
+def create_wafer_dir(
+    gds: gf.Component,
+    dir_name: str,
+    design_json: str,
+    output_root: str | Path | None = None,
+    max_workers: int = 4,
+    layout_suffixes: tuple[str, ...] = (".gds",),
+) -> Path:
     """
     Creates a nested directory structure for wafer design files and saves the GDS file and design JSON.
+
+    The GDS file, data.json, resistance.csv and resistance_test_junctions.csv are
+    written concurrently, so that a slow GDS write on a network share does not hold
+    back the metadata. They are written into a staging directory next to the wafer
+    directory first, which is renamed into place once every file is complete; when
+    the wafer directory already exists, every file replaces its previous version
+    atomically. A crash never leaves a partially written file in the wafer directory.
+
     Args:
         gds (gf.Component): The GDS component to be saved.
         dir_name (str): The name of the main directory to be created.
         design_json (str): The design JSON content to be saved in the Design directory.
+        output_root (str | Path | None): Directory the wafer directory is created in.
+            Defaults to DEFAULT_OUTPUT_ROOT, the DRAWING_OUTPUT_ROOT environment variable
+            or ~/Fabrication.
+        max_workers (int): Number of files written at the same time.
+        layout_suffixes (tuple[str, ...]): Layout files to write, ".gds" and/or ".oas". OASIS
+            files store the repeated dies as repetitions and are much smaller. The size and
+            write time of every layout file are printed, to compare the formats.
+    Returns:
+        Path: The wafer directory.
     example for design_json:
     {
   "wafer name": "20250907_",
@@ -105,39 +141,70 @@ def create_wafer_dir(gds: gf.Component, dir_name: str, design_json: str) -> None
     """
 
 
-    # Specify the nested directory structure
-    main_dir_path = Path("I:\\SergeR_Group\\Notes\\Fabrication\\" + dir_name)
+    main_dir_path = Path(output_root if output_root is not None else DEFAULT_OUTPUT_ROOT).joinpath(dir_name)
+    staging_dir_path = main_dir_path.with_name(f".{dir_name}.partial")
+    # Leftovers of an interrupted run
+    shutil.rmtree(staging_dir_path, ignore_errors=True)
+
+    design_data: dict = json.loads(design_json)
+    writers: dict[str, Callable[[Path], object]] = {
+        **{f"Design/{dir_name}{suffix}": lambda path: _write_layout_locked(gds, path) for suffix in layout_suffixes},
+        "Design/data.json": lambda path: path.write_text(design_json, encoding="utf-8"),
+        "Resistance/resistance.csv": lambda path: _write_csv(path, _sample_resistance_rows(design_data)),
+        "Resistance/resistance_test_junctions.csv": lambda path: _write_csv(
+            path, _test_junction_resistance_rows(design_data)
+        ),
+    }
+
+    try:
+        for name in writers:
+            staging_dir_path.joinpath(name).parent.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(write, staging_dir_path.joinpath(name)) for name, write in writers.items()]
+            reports = [result for result in (future.result() for future in futures) if isinstance(result, LayoutFileReport)]
+
+        if not main_dir_path.exists():
+            staging_dir_path.rename(main_dir_path)
+        else:
+            for name in writers:
+                main_dir_path.joinpath(name).parent.mkdir(parents=True, exist_ok=True)
+                os.replace(staging_dir_path.joinpath(name), main_dir_path.joinpath(name))
+    finally:
+        shutil.rmtree(staging_dir_path, ignore_errors=True)
 
-    # Create nested directories
-    main_dir_path.mkdir(parents=True, exist_ok=True)
     print(f"Nested directories '{main_dir_path}' created successfully.")
+    for report in reports:
+        print(f"{report.path.name}: {report.size} bytes written in {report.write_time:.3f} s.")
+    return main_dir_path
 
-    design_dir_path = main_dir_path.joinpath("Design")
-    design_dir_path.mkdir(parents=True, exist_ok=True)
-    print(f"Nested directories '{design_dir_path}' created successfully.")
 
-    gds.write_gds(design_dir_path.joinpath(dir_name + ".gds"), with_metadata=False)
+_layout_write_lock = threading.Lock()
 
-    with design_dir_path.joinpath("data.json").open("w", encoding ="utf-8") as f:
-        f.write(design_json)
-    
-    resistance_dir_path = main_dir_path.joinpath("Resistance")
-    resistance_dir_path.mkdir(parents=True, exist_ok=True)
-    print(f"Nested directories '{resistance_dir_path}' created successfully.")
 
-    rCsv: str = "Sample,Point,Resistance (Ohm)\n"
-    design_data: dict = json.loads(design_json)
+def _write_layout_locked(gds: gf.Component, path: Path) -> LayoutFileReport:
+    # Writing renames duplicate cells of the layout, the layout files are written one at a time
+    with _layout_write_lock:
+        return write_layout(gds, path)
+
+
+def _write_csv(path: Path, rows: Iterable[tuple]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(RESISTANCE_CSV_HEADER)
+        writer.writerows(rows)
+
+
+def _sample_resistance_rows(design_data: dict) -> Iterable[tuple]:
     for sample in design_data["samples"]:
-        sample_name: str = sample["name"]
         for rmp in sample["resistance measurement points"]:
-            rCsv += f"{sample_name},{rmp['name']},\n"
+            yield sample["name"], rmp["name"], ""
 
-    with resistance_dir_path.joinpath("resistance.csv").open("w", encoding ="utf-8") as f:
-        f.write(rCsv)
 
-    rTJCsv: str = "Sample,Point,Resistance (Ohm)\n"
-    with resistance_dir_path.joinpath("resistance_test_junctions.csv").open("w", encoding ="utf-8") as f:
-        f.write(rTJCsv)
+def _test_junction_resistance_rows(design_data: dict) -> Iterable[tuple]:
+    # One row per junction of every test junction field, named by its field and grid position
+    for index, test_junctions in enumerate(design_data["test junctions"], start=1):
+        for junction in test_junctions.get("JUNCTIONS", []):
+            yield f"Test junctions {index}", junction["name"], ""
 
 def create_design_json(wafer_name: str,
                        wafer_material: str,
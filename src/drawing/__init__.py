@@ -1,9 +1,105 @@
-from .transmon import *
-from .snail import *
-from .squid import *
-from .wafer import *
-from .junction import *
-from .shared import *
-from .sample import *
-from .test_junctions import *
-from .resonator import *
\ No newline at end of file
+"""
+Transmon layout library built on gdsfactory.
+
+The public names of every subpackage are available from the package root, e.g.
+`from drawing import TransmonConfig`. Subpackages are imported lazily on first
+attribute access, so importing the package is cheap and a script only pays for
+the modules it actually uses.
+"""
+import importlib
+import types
+from typing import TYPE_CHECKING
+
+_SUBPACKAGE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "transmon": (
+        "PadConfig", "TaperConfig", "AntennaConfig", "TransmonConfig",
+        "SweepResult", "sweep_transmon", "expand_grid", "apply_flat_overrides",
+    ),
+    "snail": ("SnailConfig",),
+    "squid": ("SquidConfig",),
+    "junction_chain": ("JunctionChainConfig",),
+    "wafer": (
+        "WaferConfig", "BaseCutIndicatorConfig", "UniformCutIndicatorConfig", "WaferRegularSplitConfig",
+        "BaseAlignCrossConfig", "EBeamAlignCrossConfig", "LaserAlignCrossConfig", "StepAndRepeatWaferConfig",
+    ),
+    "junction": (
+        "BaseJunctionConfig", "BaseArmConfig", "RegularArmConfig", "SymmetricJunctionConfig",
+        "AntisymmetricJunctionConfig", "FunnelrArmConfig", "TArmConfig",
+    ),
+    "shared": (
+        "merge_decorator", "preserve_hierarchy", "hierarchy_preserved", "config_cell", "clear_config_cell_cache",
+        "smooth_corners", "merge_referenced_shapes",
+        "DEFAULT_LAYER", "JUNCTION_FOCUS_LAYER", "JUNCTION_PICTURE_LAYER", "DRC_MARKER_LAYER", "ONE_INCH_IN_MICROMETER",
+        "array_mirror_x", "array_mirror_y", "BuildCache", "default_build_cache",
+        "BuildGraph", "BuildNode", "default_build_graph", "LayoutFileReport", "write_layout", "compare_layout_formats",
+        "PolygonStore", "FlatPolygons",
+        "set_arc_tolerance", "get_arc_tolerance", "reset_arc_tolerance", "arc_points", "circle_angle_resolution",
+        "euler_npoints", "BuildProfiler", "profile_build", "profiled",
+    ),
+    "sample": ("BaseSampleConfig", "twoResonatorsTwoTransmonSampleConfig"),
+    "test_junctions": ("BaseTestJunctionsConfig", "FiveTestJunctionsConfig"),
+    "resonator": ("BaseResonatorConfig", "MeanderResonatorConfig"),
+    "config_table": ("LoadedConfigs", "load_configs", "read_table"),
+    "drc": ("DesignRules", "DrcResult", "check_design_rules"),
+}
+
+_LAZY_ATTRIBUTES = {name: subpackage for subpackage, names in _SUBPACKAGE_EXPORTS.items() for name in names}
+
+__all__ = [*_SUBPACKAGE_EXPORTS, *_LAZY_ATTRIBUTES]
+
+if TYPE_CHECKING:
+    from .transmon import *
+    from .snail import *
+    from .squid import *
+    from .junction_chain import *
+    from .wafer import *
+    from .junction import *
+    from .shared import *
+    from .sample import *
+    from .test_junctions import *
+    from .resonator import *
+    from .config_table import *
+    from .drc import *
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGE_EXPORTS:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+        # Cache on the module so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    if not name.startswith("_"):
+        # Any other submodule, e.g. drawing.meander, is reachable as an attribute too
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+def _export_mismatches() -> list[str]:
+    """
+    Imports every subpackage and returns one message per difference between `_SUBPACKAGE_EXPORTS` and the public
+    names the subpackage actually provides. Packages must match their `__init__` exactly; plain modules must only
+    define every listed name.
+    """
+    mismatches = []
+    for subpackage, names in _SUBPACKAGE_EXPORTS.items():
+        module = importlib.import_module(f".{subpackage}", __name__)
+        public = {
+            key for key, value in vars(module).items()
+            if not key.startswith("_") and not isinstance(value, types.ModuleType)
+        }
+        for name in sorted(set(names) - public):
+            mismatches.append(f"{subpackage}: {name!r} is listed but not defined")
+        if hasattr(module, "__path__"):
+            for name in sorted(public - set(names)):
+                mismatches.append(f"{subpackage}: {name!r} is exported by its __init__ but not listed")
+    return mismatches
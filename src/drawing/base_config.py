@@ -1,6 +1,10 @@
-from pydantic import BaseModel, ConfigDict, field_serializer
+import hashlib
+from pathlib import Path
+from typing import Any
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_serializer
 import gdsfactory as gf
-from .shared import DEFAULT_LAYER
+from .shared import DEFAULT_LAYER, BuildCache, default_build_cache, profiled, LayoutFileReport, write_layout
+from .shared.build_graph import tracked
 class BaseConfig(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
     """
@@ -11,6 +15,29 @@ class BaseConfig(BaseModel):
     """
     layer: gf.typings.LayerSpec = DEFAULT_LAYER
 
+    # Structural hash of a frozen configuration, computed on first use
+    _structural_hash: str | None = PrivateAttr(None)
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Instruments the build method and the gf.cell builders of every configuration
+        class, so that they are recorded inside drawing.shared.profile_build(). Build
+        methods are also recorded in the build graph, see drawing.shared.BuildGraph,
+        unless config_cell already records them.
+        """
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if name == "build" and callable(attribute):
+                build_name = f"{cls.__name__}.build"
+                if not hasattr(attribute, "build_name"):
+                    attribute = tracked(attribute, name=build_name)
+                setattr(cls, name, profiled(attribute, name=build_name))
+            elif isinstance(attribute, staticmethod) and getattr(attribute.__func__, "is_gf_cell", False):
+                setattr(cls, name, staticmethod(profiled(attribute.__func__, name=f"{cls.__name__}.{name}")))
+            elif callable(attribute) and getattr(attribute, "is_gf_cell", False):
+                # gf.cell applied on top of @staticmethod yields a plain function
+                setattr(cls, name, profiled(attribute, name=f"{cls.__name__}.{name}"))
+
     def build(self) -> gf.Component:
         """
         Builds the GDS component based on the configuration.
@@ -18,15 +45,142 @@ class BaseConfig(BaseModel):
             gf.Component: The GDS component.
         """
         raise NotImplementedError("Subclasses should implement build(self) method.")
+
+    def build_cached(self, cache: BuildCache | None = None) -> gf.Component:
+        """
+        Builds the GDS component through the persistent on-disk build cache.
+        Identical configurations are loaded from disk instead of being rebuilt,
+        also across Python processes.
+        Args:
+            cache (BuildCache | None): Cache to use. Defaults to the shared cache in DEFAULT_CACHE_DIR.
+        Returns:
+            gf.Component: The GDS component.
+        """
+        if cache is None:
+            cache = default_build_cache()
+        return cache.get_or_build(self)
     
+    def write_layout(self, path: str | Path, with_metadata: bool = False) -> LayoutFileReport:
+        """
+        Builds the GDS component and writes it to a GDS or OASIS file, chosen from the file extension.
+        OASIS files store repeated placements as repetitions and are compressed.
+        Args:
+            path (str | Path): Path of a .gds or .oas file.
+            with_metadata (bool): Whether to write the gdsfactory metadata (ports, settings).
+        Returns:
+            LayoutFileReport: The written file with its size and write time.
+        """
+        return write_layout(self.build(), path, with_metadata=with_metadata)
+
     def clone(self) -> "BaseConfig":
         """
         Clones the configuration.
+        Frozen configurations made only of immutable values share their fields
+        with the clone instead of deep-copying them.
         Returns:
             BaseConfig: A new instance of the configuration with the same attributes.
         """
+        if self.is_immutable():
+            return self.model_copy()
         return self.model_copy(deep=True)
-    
+
+    def with_updates(self, updates: dict[str, Any] | None = None, **fields: Any) -> "BaseConfig":
+        """
+        Returns a copy of the configuration with some fields replaced.
+        Fields of sub-configurations are addressed by dotted paths, e.g.
+        {"junction.arm.width": 0.2}. Every sub-configuration on the way to an
+        updated field is copied once, all the others are shared with this
+        configuration. The copies are validated like new configurations, so the
+        new values are coerced to their field types and model validators run.
+        Args:
+            updates (dict[str, Any] | None): Dotted field path to its new value.
+            **fields: Top level field name to its new value.
+        Returns:
+            BaseConfig: The updated configuration.
+        Raises:
+            KeyError: If a path does not resolve to a field.
+            pydantic.ValidationError: If an updated configuration is invalid.
+        """
+        updates = {**(updates or {}), **fields}
+        direct: dict[str, Any] = {}
+        nested: dict[str, dict[str, Any]] = {}
+        for path, value in updates.items():
+            name, _, rest = path.partition(".")
+            if name not in type(self).model_fields:
+                raise KeyError(f"{name!r} is not a field of {type(self).__name__}.")
+            if rest:
+                nested.setdefault(name, {})[rest] = value
+            else:
+                direct[name] = value
+        for name, sub_updates in nested.items():
+            sub_config = direct.get(name, getattr(self, name))
+            if not isinstance(sub_config, BaseConfig):
+                raise KeyError(f"{name!r} of {type(self).__name__} is not a configuration.")
+            direct[name] = sub_config.with_updates(sub_updates)
+        if not direct:
+            return self
+        # Unchanged sub-configurations are instances and are not revalidated
+        return type(self).model_validate({**dict(self), **direct})
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> "BaseConfig":
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy._structural_hash = None
+        return copy
+
+    def is_immutable(self) -> bool:
+        """
+        Returns:
+            bool: Whether the configuration and all its sub-configurations are frozen
+                and hold no mutable values, so that they can be shared between configurations.
+        """
+        if not self.model_config.get("frozen", False):
+            return False
+        return all(_is_immutable_value(value) for value in self.__dict__.values())
+
+    def __eq__(self, other: object) -> bool:
+        # Compares the fields only, the cached hash is not part of the value
+        if self is other:
+            return True
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        if type(self) is not type(other):
+            return False
+        if isinstance(other, BaseConfig):
+            own_hash = self.__pydantic_private__.get("_structural_hash")
+            other_hash = other.__pydantic_private__.get("_structural_hash")
+            if own_hash is not None and other_hash is not None and own_hash != other_hash:
+                return False
+        return self.__dict__ == other.__dict__
+
+    def __hash__(self) -> int:
+        if not self.model_config.get("frozen", False):
+            raise TypeError(f"unhashable type: '{type(self).__name__}'")
+        return int(self.structural_hash()[:16], 16)
+
+    def structural_hash(self) -> str:
+        """
+        Returns a hash of the configuration class and of all its field values.
+        Every field takes part, including the ones excluded from serialization,
+        and sub-configurations contribute their own structural hash. The hash is
+        stable across Python processes and is computed once per frozen configuration.
+        Returns:
+            str: 32 hex characters of the blake2b digest.
+        """
+        # Read through __pydantic_private__, the attribute lookup of private fields is slow
+        cached = self.__pydantic_private__.get("_structural_hash")
+        if cached is not None:
+            return cached
+        cls = type(self)
+        digest = hashlib.blake2b(f"{cls.__module__}.{cls.__qualname__}".encode("utf-8"), digest_size=16)
+        for name, value in self.__dict__.items():
+            digest.update(_encode_hash_value(name))
+            digest.update(_encode_hash_value(value))
+        structural_hash = digest.hexdigest()
+        if self.model_config.get("frozen", False):
+            self._structural_hash = structural_hash
+        return structural_hash
+
     def validate(self) -> None:
         pass
     
@@ -35,4 +189,42 @@ class BaseConfig(BaseModel):
     
     @field_serializer("layer")
     def serialize_layer(self, layer: gf.typings.LayerSpec, _info):
-        return str(layer)
\ No newline at end of file
+        return str(layer)
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None))
+
+
+def _is_immutable_value(value: Any) -> bool:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, BaseConfig):
+        return value.is_immutable()
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable_value(item) for item in value)
+    return False
+
+
+def _encode_hash_value(value: Any) -> bytes:
+    # Values comparing equal (1, 1.0, True, int enums) encode to the same bytes
+    if isinstance(value, BaseConfig):
+        return b"C" + value.structural_hash().encode("ascii")
+    if value is None:
+        return b"0"
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, int):
+        text = str(int(value))
+        return b"I" + len(text).to_bytes(2, "little") + text.encode("ascii")
+    if isinstance(value, float):
+        text = repr(float(value))
+        return b"F" + len(text).to_bytes(2, "little") + text.encode("ascii")
+    if isinstance(value, str | bytes):
+        data = value.encode("utf-8") if isinstance(value, str) else bytes(value)
+        return b"S" + len(data).to_bytes(4, "little") + data
+    if isinstance(value, tuple | list):
+        return b"(" + b"".join(_encode_hash_value(item) for item in value) + b")"
+    if isinstance(value, dict):
+        return b"{" + b"".join(
+            _encode_hash_value(key) + _encode_hash_value(item) for key, item in sorted(value.items(), key=repr)
+        ) + b"}"
+    return _encode_hash_value(repr(value))
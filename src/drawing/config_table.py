@@ -0,0 +1,370 @@
+"""
+Columnar bulk loading of configurations from flat sweep tables.
+
+A sweep table holds one flat row per configuration, with columns named like the
+keys of TransmonConfig.load_from_flat_dict ("pad_width", "junction_gap_length")
+or as dotted paths ("junction.arm.width"). Loading a table row by row pays the
+prefix splitting and the full pydantic validation once per row. Here the
+columns are resolved to configuration fields once, their types and ranges are
+checked in one vectorized pass per column, every distinct sub-configuration is
+validated once and shared between the rows using it, and the rows are assembled
+without running pydantic validation again.
+
+CSV files are read with the standard library, Parquet files require pyarrow.
+"""
+
+import ast
+import csv
+from pathlib import Path
+from types import UnionType
+from typing import Any, Literal, NamedTuple, Sequence, Union, get_args, get_origin
+
+import numpy as np
+
+from .base_config import BaseConfig
+
+_MISSING_VALUES = ("", "nan", "NaN", "None", "null")
+_TRUE_VALUES = ("1", "true", "True", "TRUE", "yes")
+_FALSE_VALUES = ("0", "false", "False", "FALSE", "no")
+
+
+class LoadedConfigs(NamedTuple):
+    """
+    Result of loading a sweep table.
+
+    Attributes:
+        configs (list[BaseConfig | None]): One configuration per row, None for the rows that failed.
+        errors (dict[int, str]): Row index to the reason the row failed.
+    """
+    configs: list[BaseConfig | None]
+    errors: dict[int, str]
+
+
+def read_table(path: str | Path) -> dict[str, list]:
+    """
+    Reads a CSV or Parquet sweep table into columns.
+
+    Args:
+        path (str | Path): Path of a .csv or .parquet file.
+
+    Returns:
+        dict[str, list]: Column name to its values.
+
+    Raises:
+        ImportError: If the file is a Parquet file and pyarrow is not installed.
+        ValueError: If the file extension is not supported.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with path.open(newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            rows = list(reader)
+        return {name: [row[i] for row in rows] for i, name in enumerate(header)}
+    if suffix in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading Parquet sweep tables requires pyarrow (pip install pyarrow).") from e
+        return pq.read_table(path).to_pydict()
+    raise ValueError(f"Unsupported sweep table format {path.suffix!r}, expected .csv or .parquet.")
+
+
+def load_configs(
+    table: dict[str, Sequence] | str | Path,
+    base: BaseConfig,
+    ranges: dict[str, tuple[float | None, float | None]] | None = None,
+    validate: bool = True,
+) -> LoadedConfigs:
+    """
+    Builds one configuration per row of a sweep table.
+
+    Every row overrides the fields of the base configuration named by its columns;
+    missing cells keep the base value. Sub-configurations keep their class, e.g.
+    the junction of a TransmonConfig stays a SymmetricJunctionConfig.
+
+    Args:
+        table (dict[str, Sequence] | str | Path): Columns of the table, or the path of a CSV or Parquet file.
+        base (BaseConfig): Configuration the rows are applied to.
+        ranges (dict[str, tuple[float | None, float | None]] | None): Inclusive bounds per column,
+            None for an open side, checked in the vectorized pass.
+        validate (bool): Whether to run the validate() method of every distinct sub-configuration
+            and of every distinct configuration.
+
+    Returns:
+        LoadedConfigs: The configurations and the errors of the failed rows.
+
+    Raises:
+        KeyError: If a column does not resolve to a configuration field.
+        ValueError: If the columns do not have the same length.
+    """
+    if not isinstance(table, dict):
+        table = read_table(table)
+    ranges = ranges or {}
+
+    lengths = {len(values) for values in table.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Sweep table columns have different lengths: {sorted(lengths)}.")
+    row_count = lengths.pop() if lengths else 0
+
+    errors: dict[int, str] = {}
+    invalid = np.zeros(row_count, dtype=bool)
+
+    # Resolve the columns once and group them by the top level field they change
+    groups: dict[str, list[tuple[list[str], np.ndarray]]] = {}
+    for key, values in table.items():
+        path = key.split(".") if "." in key else resolve_flat_key(base, key)
+        column, column_invalid = _coerce_column(values, _field_annotation(base, path), _path_default(base, path))
+        if key in ranges:
+            if column.dtype.kind not in "fi":
+                raise ValueError(f"Column {key!r} is not numeric, it cannot have a range.")
+            low, high = ranges[key]
+            if low is not None:
+                column_invalid |= column < low
+            if high is not None:
+                column_invalid |= column > high
+        for row in np.flatnonzero(column_invalid & ~invalid):
+            errors[int(row)] = f"Invalid value {values[row]!r} in column {key!r}."
+        invalid |= column_invalid
+        groups.setdefault(path[0], []).append((path[1:], column))
+
+    # Every distinct value combination of a group is built and validated once
+    group_values: dict[str, list] = {}
+    group_inverse: dict[str, np.ndarray] = {}
+    for name, columns in groups.items():
+        first_rows, inverse = _unique_rows([column for _, column in columns])
+        values = []
+        for first_row in first_rows.tolist():
+            value = getattr(base, name)
+            try:
+                for path, column in columns:
+                    item = column[first_row].item() if isinstance(column[first_row], np.generic) else column[first_row]
+                    value = set_path(value, path, item) if path else item
+                if validate and isinstance(value, BaseConfig):
+                    value.validate()
+            except Exception as e:
+                value = e
+            values.append(value)
+
+        failed = np.array([isinstance(value, Exception) for value in values], dtype=bool)
+        for row in np.flatnonzero(failed[inverse] & ~invalid):
+            errors[int(row)] = f"{name}: {values[inverse[row]]}"
+        invalid |= failed[inverse]
+        group_values[name] = values
+        group_inverse[name] = inverse
+
+    # Rows sharing all their sub-configurations share the same configuration object
+    names = list(groups)
+    configs: list[BaseConfig | None] = [None] * row_count
+    rows = np.flatnonzero(~invalid)
+    if len(rows):
+        first_rows, inverse = _unique_rows([group_inverse[name][rows] for name in names])
+        # Rows sorted by combination, each combination owning a contiguous slice
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(first_rows) + 1))
+        for combination, first_row in enumerate(first_rows.tolist()):
+            row = rows[first_row]
+            members = rows[order[bounds[combination]:bounds[combination + 1]]].tolist()
+            config = base.model_copy(update={name: group_values[name][group_inverse[name][row]] for name in names})
+            if validate:
+                try:
+                    config.validate()
+                except Exception as e:
+                    errors.update(dict.fromkeys(members, str(e)))
+                    continue
+            for member in members:
+                configs[member] = config
+
+    return LoadedConfigs(configs, dict(sorted(errors.items())))
+
+
+def resolve_flat_key(config: BaseConfig, key: str) -> list[str]:
+    """
+    Resolves a flat prefixed key such as "junction_arm_width" to a field path.
+
+    Args:
+        config (BaseConfig): Configuration the key refers to.
+        key (str): The flat key.
+
+    Returns:
+        list[str]: Field names from the configuration down to the field.
+
+    Raises:
+        KeyError: If the key does not resolve to a field.
+    """
+    fields = type(config).model_fields
+    if key in fields:
+        return [key]
+    for name in fields:
+        sub_config = getattr(config, name)
+        if isinstance(sub_config, BaseConfig) and key.startswith(f"{name}_"):
+            return [name, *resolve_flat_key(sub_config, key[len(name) + 1:])]
+    raise KeyError(f"{key!r} is not a field of {type(config).__name__}.")
+
+
+def set_path(config: BaseConfig, path: list[str], value: Any) -> BaseConfig:
+    """
+    Returns a copy of a configuration with the field at a path replaced.
+
+    Untouched sub-configurations are shared with the original configuration.
+
+    Args:
+        config (BaseConfig): The configuration.
+        path (list[str]): Field names from the configuration down to the field.
+        value (Any): The new value.
+
+    Returns:
+        BaseConfig: The updated configuration.
+
+    Raises:
+        KeyError: If the path does not resolve to a field.
+    """
+    return config.with_updates({".".join(path): value})
+
+
+def _field_annotation(config: BaseConfig, path: list[str]) -> Any:
+    *parents, name = path
+    for parent in parents:
+        if parent not in type(config).model_fields:
+            raise KeyError(f"{parent!r} is not a field of {type(config).__name__}.")
+        config = getattr(config, parent)
+    if name not in type(config).model_fields:
+        raise KeyError(f"{name!r} is not a field of {type(config).__name__}.")
+    return type(config).model_fields[name].annotation
+
+
+def _path_default(config: BaseConfig, path: list[str]) -> Any:
+    for name in path:
+        config = getattr(config, name)
+    return config
+
+
+def _unique_rows(columns: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the distinct rows of a set of equally long columns.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Index of the first occurrence of every distinct row,
+            and the distinct row index of every row.
+    """
+    # Columns are folded one by one into a compact integer code of the rows, which
+    # keeps every np.unique call one-dimensional
+    inverse = np.zeros(len(columns[0]), dtype=np.int64)
+    for column in columns:
+        if column.dtype.kind == "O":
+            # Object cells, e.g. layer tuples next to layer names, need not be ordered
+            first_codes: dict[Any, int] = {}
+            codes = np.array([first_codes.setdefault(value, len(first_codes)) for value in column.tolist()], dtype=np.int64)
+            value_count = len(first_codes)
+        else:
+            values, codes = np.unique(column, return_inverse=True)
+            value_count = len(values)
+        inverse = np.unique(inverse * value_count + codes.reshape(-1), return_inverse=True)[1].reshape(-1)
+    first_rows = np.full(inverse.max(initial=-1) + 1, len(inverse), dtype=np.int64)
+    np.minimum.at(first_rows, inverse, np.arange(len(inverse)))
+    return first_rows, inverse
+
+
+def _column_array(values: Sequence) -> np.ndarray:
+    # Cells holding sequences, e.g. layer tuples, must not become a second dimension
+    raw = np.asarray(values)
+    if raw.ndim != 1:
+        raw = np.empty(len(values), dtype=object)
+        raw[:] = list(values)
+    return raw
+
+
+def _tuple_annotations(annotation: Any) -> list[Any]:
+    options = get_args(annotation) if get_origin(annotation) in (Union, UnionType) else (annotation,)
+    return [option for option in options if option is tuple or get_origin(option) is tuple]
+
+
+def _matches_tuple(value: tuple, annotation: Any) -> bool:
+    types = get_args(annotation)
+    if not types:
+        return True
+    if len(types) == 2 and types[1] is Ellipsis:
+        types = (types[0],) * len(value)
+    if len(types) != len(value):
+        return False
+    return all(
+        not isinstance(item, type) or (isinstance(element, item) and not (item is int and isinstance(element, bool)))
+        for element, item in zip(value, types)
+    )
+
+
+def _coerce_column(values: Sequence, annotation: Any, default: Any) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converts a column to the type of its field in one vectorized pass.
+
+    Missing cells take the default value.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The converted column and the mask of invalid cells.
+    """
+    raw = _column_array(values)
+    if raw.dtype.kind == "f":
+        missing = np.isnan(raw)
+    elif raw.dtype.kind in "iub":
+        missing = np.zeros(len(raw), dtype=bool)
+    elif raw.dtype.kind == "O":
+        missing = np.isin(np.array([str(value) for value in raw.tolist()], dtype=str), _MISSING_VALUES)
+    else:
+        missing = np.isin(raw.astype(str), _MISSING_VALUES)
+    if missing.any():
+        raw = raw.astype(object)
+        raw[missing] = default
+
+    if annotation is bool:
+        text = raw.astype(str)
+        true = np.isin(text, _TRUE_VALUES)
+        return true, ~(true | np.isin(text, _FALSE_VALUES))
+
+    if annotation in (float, int):
+        try:
+            column = raw.astype(float)
+            invalid = np.zeros(len(raw), dtype=bool)
+        except (TypeError, ValueError):
+            # Fall back to converting cell by cell to find the bad ones
+            column = np.empty(len(raw), dtype=float)
+            invalid = np.zeros(len(raw), dtype=bool)
+            for i, value in enumerate(raw.tolist()):
+                try:
+                    column[i] = float(value)
+                except (TypeError, ValueError):
+                    column[i] = np.nan
+                    invalid[i] = True
+        invalid |= ~np.isfinite(column)
+        if annotation is int:
+            invalid |= column != np.round(column)
+            return np.where(invalid, 0, column).astype(np.int64), invalid
+        return column, invalid
+
+    if get_origin(annotation) is Literal:
+        column = raw.astype(str)
+        return column.astype(object), ~np.isin(column, [str(choice) for choice in get_args(annotation)])
+
+    if annotation is str:
+        return raw.astype(str).astype(object), np.zeros(len(raw), dtype=bool)
+
+    tuple_annotations = _tuple_annotations(annotation)
+    if tuple_annotations:
+        # Tuples, e.g. layers, are written as "(1, 0)" in CSV files
+        column = np.empty(len(raw), dtype=object)
+        invalid = np.zeros(len(raw), dtype=bool)
+        for i, value in enumerate(raw.tolist()):
+            if isinstance(value, str) and value.strip().startswith(("(", "[")):
+                try:
+                    value = ast.literal_eval(value.strip())
+                except (ValueError, SyntaxError):
+                    invalid[i] = True
+            if isinstance(value, list):
+                value = tuple(value)
+            if isinstance(value, tuple) and not any(_matches_tuple(value, tuple_type) for tuple_type in tuple_annotations):
+                invalid[i] = True
+            column[i] = value
+        return column, invalid
+
+    # Other field types (layers, sub-configurations) are passed through and left to validate()
+    return raw, np.zeros(len(raw), dtype=bool)
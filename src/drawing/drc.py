@@ -0,0 +1,321 @@
+"""
+Design rule checking of components and configurations.
+
+The rules are checked with the KLayout region engine, which bins the edges of
+the polygons in a box tree so that only neighbouring edges are compared. Two
+modes are available:
+
+- Hierarchical (the default): every distinct cell is checked once, together with
+  the shapes of its neighbours reaching into it, and the results are shared by
+  all its instances. A step-and-repeat wafer costs little more than one die.
+- Tiled: the layout is cut into tiles processed in parallel threads, every tile
+  seeing its neighbourhood up to twice the largest checked distance, so a flat
+  layout is never processed as a whole. A violation is reported by the tile
+  containing the center of its bounding box, violations are neither lost nor
+  reported twice at the tile borders; violations along shapes longer than a
+  tile are reported once per tile.
+
+The result is a marker component, the checked layout with a marker box around
+every violation, and a table with one row per violation.
+"""
+
+import math
+import os
+import threading
+from typing import Any, NamedTuple
+
+import gdsfactory as gf
+from gdsfactory.typings import LayerSpec
+from kfactory import kdb
+from pydantic import BaseModel, ConfigDict
+
+from .base_config import BaseConfig
+from .shared import DRC_MARKER_LAYER
+
+# Margin of the marker boxes around the violations, in micrometers
+_MARKER_MARGIN = 0.1
+
+
+class DesignRules(BaseModel):
+    """
+    Design rules checked by `check_design_rules`.
+
+    Attributes:
+        min_width (dict[LayerSpec, float]): Layer to the minimum width of its shapes.
+        min_spacing (dict[LayerSpec, float]): Layer to the minimum spacing between its shapes.
+        min_enclosure (dict[tuple[LayerSpec, LayerSpec], float]): (inner layer, outer layer) to the
+            minimum enclosure of the inner shapes by the outer shapes, e.g.
+            {((1, 11), JUNCTION_PICTURE_LAYER): 1.0} for junction gaps inside their picture boxes.
+            Inner shapes not covered by the outer layer are violations as well.
+        grid (float | None): Manufacturing grid every vertex must lie on. None skips the check.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    min_width: dict[LayerSpec, float] = {}
+    min_spacing: dict[LayerSpec, float] = {}
+    min_enclosure: dict[tuple[LayerSpec, LayerSpec], float] = {}
+    grid: float | None = None
+
+    def validate(self) -> None:
+        if any(distance <= 0 for distance in self.distances()):
+            raise ValueError("Design rule distances must be positive.")
+        if self.grid is not None and self.grid <= 0:
+            raise ValueError("Design rule grid must be positive.")
+
+    def distances(self) -> list[float]:
+        """
+        Returns:
+            list[float]: The distances of the width, spacing and enclosure rules.
+        """
+        return [*self.min_width.values(), *self.min_spacing.values(), *self.min_enclosure.values()]
+
+
+class DrcResult(NamedTuple):
+    """
+    Result of a design rule check.
+
+    Attributes:
+        markers (gf.Component): The checked component with a box on the marker layer around every violation.
+        violations (list[dict]): One row per violation with the rule, the layer, the rule limit,
+            the measured value, the center and the bounding box in micrometers.
+    """
+    markers: gf.Component
+    violations: list[dict]
+
+
+class _Check(NamedTuple):
+    rule: str
+    label: str
+    limit: float
+    layers: tuple[int, ...]
+    distance: int
+
+
+def check_design_rules(
+    design: BaseConfig | gf.Component,
+    rules: DesignRules,
+    hierarchical: bool = True,
+    tile_size: float = 2000,
+    threads: int | None = None,
+    max_violations: int | None = 10000,
+    marker_layer: LayerSpec = DRC_MARKER_LAYER,
+) -> DrcResult:
+    """
+    Checks a component, or the component of a configuration, against design rules.
+
+    Shapes are merged per layer before the checks, so abutting and overlapping
+    shapes of a layer count as one shape. In the hierarchical mode a violation
+    inside a cell is reported once per instance of the cell.
+
+    Args:
+        design (BaseConfig | gf.Component): The component, or the configuration to build and check.
+        rules (DesignRules): The rules to check.
+        hierarchical (bool): Whether to check every distinct cell once instead of checking
+            the flattened layout tile by tile.
+        tile_size (float): Side length of the tiles in micrometers, in the tiled mode.
+        threads (int | None): Number of threads. Defaults to the number of CPUs.
+        max_violations (int | None): Maximum number of violations reported per rule and layer.
+            None reports all of them.
+        marker_layer (LayerSpec): Layer of the violation markers.
+
+    Returns:
+        DrcResult: The marker component and the violation table.
+
+    Raises:
+        ValueError: If the rules or the tile size are invalid, or the grid is not a multiple
+            of the database unit.
+    """
+    rules.validate()
+    if tile_size <= 0:
+        raise ValueError("Tile size must be positive.")
+    component = design.build() if isinstance(design, BaseConfig) else design
+    threads = threads or os.cpu_count() or 1
+    checks = _checks(component, rules)
+
+    if hierarchical:
+        violations = _check_hierarchical(component, checks, threads, max_violations)
+    else:
+        violations = _check_tiled(component, checks, rules, tile_size, threads, max_violations)
+
+    markers = gf.Component()
+    markers << component
+    marker_shapes = markers.kdb_cell.shapes(gf.get_layer(marker_layer))
+    for _, marker in violations:
+        marker_shapes.insert(marker)
+    return DrcResult(markers=markers, violations=[row for row, _ in violations])
+
+
+def _checks(component: gf.Component, rules: DesignRules) -> list[_Check]:
+    layout = component.kcl.layout
+    dbu = layout.dbu
+
+    def label(layer_index: int) -> str:
+        info = layout.get_info(layer_index)
+        return str((info.layer, info.datatype))
+
+    checks = []
+    for layer, width in rules.min_width.items():
+        layer_index = gf.get_layer(layer)
+        checks.append(_Check("width", label(layer_index), width, (layer_index,), _to_dbu(width, dbu)))
+    for layer, spacing in rules.min_spacing.items():
+        layer_index = gf.get_layer(layer)
+        checks.append(_Check("spacing", label(layer_index), spacing, (layer_index,), _to_dbu(spacing, dbu)))
+    for (inner_layer, outer_layer), enclosure in rules.min_enclosure.items():
+        layers = (gf.get_layer(inner_layer), gf.get_layer(outer_layer))
+        pair_label = f"{label(layers[0])} in {label(layers[1])}"
+        checks.append(_Check("enclosure", pair_label, enclosure, layers, _to_dbu(enclosure, dbu)))
+        checks.append(_Check("outside", pair_label, enclosure, layers, 0))
+    if rules.grid is not None:
+        grid = rules.grid / dbu
+        if not math.isclose(grid, round(grid)):
+            raise ValueError(f"Grid {rules.grid} is not a multiple of the database unit {dbu}.")
+        for layer_index in layout.layer_indexes():
+            if not component.kdb_cell.bbox(layer_index).empty():
+                checks.append(_Check("grid", label(layer_index), rules.grid, (layer_index,), round(grid)))
+    return checks
+
+
+def _check_hierarchical(
+    component: gf.Component,
+    checks: list[_Check],
+    threads: int,
+    max_violations: int | None,
+) -> list[tuple[dict, kdb.Polygon]]:
+    store = kdb.DeepShapeStore()
+    store.threads = threads
+    regions: dict[int, kdb.Region] = {}
+
+    def region(layer_index: int) -> kdb.Region:
+        if layer_index not in regions:
+            regions[layer_index] = kdb.Region(component.kdb_cell.begin_shapes_rec(layer_index), store)
+        return regions[layer_index]
+
+    violations = []
+    for check in checks:
+        first = region(check.layers[0])
+        if check.rule == "width":
+            result = first.width_check(check.distance)
+        elif check.rule == "spacing":
+            result = first.space_check(check.distance)
+        elif check.rule == "enclosure":
+            result = region(check.layers[1]).enclosing_check(first, check.distance)
+        elif check.rule == "outside":
+            result = first - region(check.layers[1])
+        else:
+            result = first.grid_check(check.distance, check.distance)
+        collector = _ViolationCollector(check, component.kcl.layout.dbu, max_violations)
+        collector.add(result)
+        violations.extend(collector.violations)
+    return violations
+
+
+def _check_tiled(
+    component: gf.Component,
+    checks: list[_Check],
+    rules: DesignRules,
+    tile_size: float,
+    threads: int,
+    max_violations: int | None,
+) -> list[tuple[dict, kdb.Polygon]]:
+    bbox = component.kdb_cell.bbox()
+    if not checks or bbox.empty():
+        return []
+    layout = component.kcl.layout
+    dbu = layout.dbu
+
+    processor = kdb.TilingProcessor()
+    processor.dbu = dbu
+    processor.threads = threads
+    inputs: dict[int, str] = {}
+    for check in checks:
+        for layer_index in check.layers:
+            if layer_index not in inputs:
+                inputs[layer_index] = f"layer{len(inputs)}"
+                processor.input(inputs[layer_index], layout, component.kdb_cell.cell_index(), layer_index)
+
+    # Region checks see the shapes clipped to their tile and its border, the cuts
+    # lie further than the checked distance from the tile and yield no violation
+    # reported by it. _tile is nil when the layout fits in a single tile.
+    tile_box = "(_tile ? _tile.bbox : extent)"
+    clip = f"{tile_box}.enlarged(border, border)"
+    scripts = {
+        "width": "({0} & {clip}).width_check({d})",
+        "spacing": "({0} & {clip}).space_check({d})",
+        "enclosure": "({1} & {clip}).enclosing_check({0} & {clip}, {d})",
+        # The tiles partition the uncovered parts, every piece belongs to one tile
+        "outside": "({0} & {tile}) - ({1} & {clip})",
+        # Vertices are checked on the unclipped shapes, the cuts would add vertices off the grid
+        "grid": "{0}.grid_check({d}, {d})",
+    }
+    collectors = []
+    for index, check in enumerate(checks):
+        collector = _ViolationCollector(check, dbu, max_violations)
+        expression = scripts[check.rule].format(
+            *(inputs[layer_index] for layer_index in check.layers), clip=clip, tile=tile_box, d=check.distance,
+        )
+        processor.output(f"output{index}", collector)
+        processor.queue(f"_output(output{index}, {expression}, false)")
+        collectors.append(collector)
+
+    border = 2 * max((_to_dbu(distance, dbu) for distance in rules.distances()), default=1)
+    tile = _to_dbu(tile_size, dbu)
+    # The tile field strictly contains the bounding box, so that no violation lies on its far edges
+    processor.tile_origin(bbox.left * dbu, bbox.bottom * dbu)
+    processor.tile_size(tile * dbu, tile * dbu)
+    processor.tiles(bbox.width() // tile + 1, bbox.height() // tile + 1)
+    processor.tile_border(border * dbu, border * dbu)
+    processor.var("border", border)
+    processor.var("extent", bbox)
+    processor.execute("Design rule check")
+    return [violation for collector in collectors for violation in collector.violations]
+
+
+class _ViolationCollector(kdb.TileOutputReceiver):
+    """
+    Collects the violations of one check, reported at once or tile by tile.
+    """
+
+    def __init__(self, check: _Check, dbu: float, max_violations: int | None):
+        super().__init__()
+        self.check = check
+        self.dbu = dbu
+        self.max_violations = max_violations
+        self.violations: list[tuple[dict, kdb.Polygon]] = []
+        self._lock = threading.Lock()
+
+    def put(self, ix: int, iy: int, tile: kdb.Box, obj: Any, dbu: float, clip: bool) -> None:
+        with self._lock:
+            self.add(obj, tile)
+
+    def add(self, result: kdb.EdgePairs | kdb.Region, tile: kdb.Box | None = None) -> None:
+        margin = _to_dbu(_MARKER_MARGIN, self.dbu)
+        for shape in result.each():
+            if self.max_violations is not None and len(self.violations) >= self.max_violations:
+                return
+            box = shape.bbox()
+            if isinstance(shape, kdb.EdgePair):
+                center = box.center()
+                # Tiles are half-open, a violation on a shared edge belongs to one tile only
+                if tile is not None and not (tile.left <= center.x < tile.right and tile.bottom <= center.y < tile.top):
+                    continue
+                value = None if self.check.rule == "grid" else shape.distance() * self.dbu
+                self.violations.append((self._row(box, value), kdb.Polygon(box.enlarged(margin, margin))))
+            else:
+                self.violations.append((self._row(box, None), shape))
+
+    def _row(self, box: kdb.Box, value: float | None) -> dict:
+        dbox = box.to_dtype(self.dbu)
+        center = dbox.center()
+        return {
+            "rule": self.check.rule,
+            "layer": self.check.label,
+            "limit": self.check.limit,
+            "value": value,
+            "x": center.x,
+            "y": center.y,
+            "bbox": (dbox.left, dbox.bottom, dbox.right, dbox.top),
+        }
+
+
+def _to_dbu(value: float, dbu: float) -> int:
+    return max(1, round(value / dbu))
@@ -1,12 +1,95 @@
-from typing import Literal
+"""
+Export of gdsfactory components to pyaedt.
+
+The polygons of a component are read from its polygon store as one
+offset-indexed vertex array, rotated into the HFSS frame with a single matrix
+multiply and only formatted into pyaedt expression strings at the very end. The
+rotation is looked up from a precomputed table of the 24 axis-aligned frames.
+"""
+
+from itertools import permutations
+from typing import Iterator, Literal, NamedTuple
+
 import gdsfactory as gf
-import shapely
 import numpy as np
+import shapely
+from numpy.typing import NDArray
+from shapely.geometry import LineString, Point
+from shapely.ops import nearest_points, polygonize
+
+from ..shared.polygon_store import PolygonStore
 from .config import ExportConfig
 
-from shapely.geometry import Point, LineString
-from shapely.ops import nearest_points, polygonize
-from numpy.typing import NDArray
+Direction = Literal['X', 'Y', 'Z', '-X', '-Y', '-Z']
+
+DIRECTION_TO_VECTOR: dict[str, NDArray] = {
+    "X": np.array([1, 0, 0]),
+    "-X": np.array([-1, 0, 0]),
+    "Y": np.array([0, 1, 0]),
+    "-Y": np.array([0, -1, 0]),
+    "Z": np.array([0, 0, 1]),
+    "-Z": np.array([0, 0, -1]),
+}
+
+# Surface orientation used when ExportConfig.surface_orientation is None
+DEFAULT_SURFACE_ORIENTATION: dict[str, str] = {
+    "X": 'Z',
+    "-X": 'Z',
+    "Y": 'Z',
+    "-Y": 'Z',
+    "Z": '-Y',
+    "-Z": 'Y',
+}
+
+_ORIENTATION_TO_DIRECTION = {0: "X", 1: "Y", 2: "-X", 3: "-Y"}
+# Layer index of the exported polygons in the layout
+_EXPORT_LAYER_INDEX = 1
+_DECIMALS = 10
+
+
+def _frame(first: NDArray, second: NDArray) -> NDArray:
+    """
+    Right-handed orthonormal frame whose first two axes are the given vectors.
+    """
+    return np.column_stack((first, second, np.cross(first, second))).astype(float)
+
+
+# Every ordered pair of perpendicular axis directions defines one of the 24 axis-aligned frames
+AXIS_FRAMES: dict[tuple[str, str], NDArray] = {
+    (first, second): _frame(DIRECTION_TO_VECTOR[first], DIRECTION_TO_VECTOR[second])
+    for first, second in permutations(DIRECTION_TO_VECTOR, 2)
+    if DIRECTION_TO_VECTOR[first] @ DIRECTION_TO_VECTOR[second] == 0
+}
+
+
+class ExportedGeometry(NamedTuple):
+    """
+    Numeric result of exporting a component, before any string formatting.
+
+    Attributes:
+        points (NDArray): (M, 3) rotated vertices of all polygons, relative to the alignment port.
+        offsets (NDArray): (P + 1,) start index of each polygon in `points`, followed by M.
+        ports (dict[str, NDArray]): Rotated position of every other port relative to the alignment port.
+        size (NDArray): Extent of all polygons along each axis.
+    """
+    points: NDArray
+    offsets: NDArray
+    ports: dict[str, NDArray]
+    size: NDArray
+
+
+class ExportChunk(NamedTuple):
+    """
+    One chunk of a streamed export.
+
+    Attributes:
+        polygons (list): Point expressions of each polygon in the chunk.
+        independent_variables (dict[str, str]): Variables not yet yielded by earlier chunks.
+        dependent_variables (dict[str, str]): Port variables not yet yielded by earlier chunks.
+    """
+    polygons: list[list[tuple[str, str, str]]]
+    independent_variables: dict[str, str]
+    dependent_variables: dict[str, str]
 
 
 def points_to_closed_forms(points):
@@ -34,9 +117,28 @@ def points_to_closed_forms(points):
 
 
 def construct_rotation(origin: NDArray, target: NDArray):
-    # origin = np.array([np.cos(origin_orientation_deg)]) * np.array([1, 0, 0])
+    """
+    Computes the smallest rotation taking one unit vector onto another.
+
+    Args:
+        origin (NDArray): Unit vector to rotate.
+        target (NDArray): Unit vector to rotate onto.
+
+    Returns:
+        NDArray: The 3x3 rotation matrix.
+    """
     v = np.cross(origin, target)
-    cosine_theta = np.dot(origin, target)  # 1 -cos(theta) / sin^2
+    cosine_theta = np.dot(origin, target)
+
+    if np.allclose(v, 0):
+        if cosine_theta > 0:
+            return np.identity(3)
+        # Anti-parallel vectors: half turn about any axis perpendicular to origin
+        axis = np.cross(origin, [1, 0, 0])
+        if np.allclose(axis, 0):
+            axis = np.cross(origin, [0, 1, 0])
+        axis = axis / np.linalg.norm(axis)
+        return 2 * np.outer(axis, axis) - np.identity(3)
 
     # Skew-symmetric matrix of v
     v_cross = np.array([
@@ -54,6 +156,44 @@ def construct_rotation(origin: NDArray, target: NDArray):
     return rotation
 
 
+def export_rotation(port_orientation: float, orientation: Direction, surface_orientation: Direction | None) -> NDArray:
+    """
+    Computes the rotation from the component frame to the HFSS frame.
+
+    The rotation takes the direction of the alignment port onto `orientation` and
+    the component normal (Z) onto `surface_orientation`.
+
+    Args:
+        port_orientation (float): Orientation of the alignment port in degrees.
+        orientation (Direction): Target direction of the alignment port.
+        surface_orientation (Direction | None): Target direction of the component normal,
+            defaults to DEFAULT_SURFACE_ORIENTATION[orientation].
+
+    Returns:
+        NDArray: The 3x3 rotation matrix.
+
+    Raises:
+        ValueError: If the surface orientation is not perpendicular to the orientation.
+    """
+    if surface_orientation is None:
+        surface_orientation = DEFAULT_SURFACE_ORIENTATION[orientation]
+
+    target = AXIS_FRAMES.get((orientation, surface_orientation))
+    if target is None:
+        raise ValueError(
+            f"Surface orientation {surface_orientation!r} must be perpendicular to orientation {orientation!r}."
+        )
+
+    quarter_turns, remainder = divmod(port_orientation, 90)
+    if np.isclose(remainder, 0):
+        source = AXIS_FRAMES[(_ORIENTATION_TO_DIRECTION[int(quarter_turns) % 4], "Z")]
+    else:
+        angle = np.deg2rad(port_orientation)
+        source = _frame(np.array([np.cos(angle), np.sin(angle), 0]), DIRECTION_TO_VECTOR["Z"])
+
+    return target @ source.T
+
+
 def find_new_port_location(original_port, simplified_polygon):
     """
     Finds the new location of a port after polygon simplification.
@@ -75,270 +215,275 @@ def find_new_port_location(original_port, simplified_polygon):
     return nearest_point_on_polygon.x, nearest_point_on_polygon.y
 
 
-def parse_component_multi(component: gf.Component, config: ExportConfig):
-    ports = component.ports
-    ports_to_center = dict(map(lambda x: (x.name, np.array(x.dcenter)), ports))
+def relocate_ports(
+    ports_to_center: dict[str, NDArray],
+    port_layers: dict[str, int],
+    polygons: NDArray,
+    polygon_layers: NDArray,
+) -> dict[str, NDArray]:
+    """
+    Moves every port onto the nearest polygon of its layer after simplification.
 
-    hfss_variables = {}
+    The polygons of each layer are bulk loaded into an STRtree and all ports of that
+    layer are resolved with a single nearest query. Ports on layers without polygons
+    keep their position.
 
-    polygons = component.get_polygons_points()[1]  # Get all polygons
-    all_rotated_points = []
+    Args:
+        ports_to_center (dict[str, NDArray]): Port name to its (x, y) center.
+        port_layers (dict[str, int]): Port name to its layer index.
+        polygons (NDArray): Simplified shapely polygons.
+        polygon_layers (NDArray): Layer index of each polygon.
 
-    if config.tolerance > 0:
-        # Simplify each polygon
-        simplified_polygons = [
-            shapely.simplify(shapely.Polygon(points), tolerance=config.tolerance)
-            for points in polygons
-        ]
-        polygons = [list(simplified.exterior.coords) for simplified in simplified_polygons]
+    Returns:
+        dict[str, NDArray]: Port name to its relocated center.
+    """
+    relocated = dict(ports_to_center)
+    for layer in set(port_layers.values()):
+        layer_polygons = polygons[polygon_layers == layer]
+        names = [name for name, port_layer in port_layers.items() if port_layer == layer]
+        if len(layer_polygons) == 0 or not names:
+            continue
+
+        points = shapely.points(np.array([ports_to_center[name] for name in names]))
+        input_index, tree_index = shapely.STRtree(layer_polygons).query_nearest(points)
+
+        # Keep the first polygon of equidistant matches
+        _, first = np.unique(input_index, return_index=True)
+        input_index, tree_index = input_index[first], tree_index[first]
+
+        lines = shapely.shortest_line(points[input_index], layer_polygons[tree_index])
+        nearest = shapely.get_coordinates(lines)[1::2]
+        relocated.update(zip((names[i] for i in input_index), nearest))
+    return relocated
+
+
+def export_geometry(
+    component: gf.Component,
+    config: ExportConfig,
+    polygons: list[NDArray] | PolygonStore | None = None,
+) -> ExportedGeometry:
+    """
+    Rotates and aligns the geometry of a component for export.
 
-        # Update ports to center after simplification
-        ports_to_center = dict(
-            map(
-                lambda x: (x[0], np.array(find_new_port_location(x[1], simplified_polygons[0]))),
-                ports_to_center.items(),
-            )
-        )
+    Args:
+        component (gf.Component): The component to export.
+        config (ExportConfig): Export settings.
+        polygons (list[NDArray] | PolygonStore | None): Polygons to export, or a polygon store of the
+            component, e.g. loaded memory mapped. Defaults to all polygons of the component.
 
-    # Align by port
-    center = ports_to_center.pop(config.port)
-    align_by_port_var_name = config.port
-    align_by_point = np.array(center)
-
-    # Get current orientation
-    origin_angle = component.ports[config.port].orientation / 180 * np.pi
-    origin = np.array([np.cos(origin_angle), np.sin(origin_angle), 0])
-    direction_to_vector = {
-        "X": np.array([1, 0, 0]),
-        "-X": np.array([-1, 0, 0]),
-        "Y": np.array([0, 1, 0]),
-        "-Y": np.array([0, -1, 0]),
-        "Z": np.array([0, 0, 1]),
-        "-Z": np.array([0, 0, -1]),
-    }
-    target = direction_to_vector[config.orientation]
-    rotation = construct_rotation(origin, target)
+    Returns:
+        ExportedGeometry: The aligned geometry and port positions.
+    """
+    points, offsets, ports, align_by_point, rotation = _prepare(component, config, polygons)
+    rotated_points = _rotate(points, align_by_point, rotation)
+    size = rotated_points.max(axis=0) - rotated_points.min(axis=0)
+    return ExportedGeometry(rotated_points, offsets, ports, size)
 
-    # Handle surface orientation
-    surface_orientation = config.surface_orientation
-    if surface_orientation is None:
-        surface_orientation_mapping = {
-            "X": 'Z',
-            "-X": 'Z',
-            "Y": 'Z',
-            "-Y": 'Z',
-            "Z": '-Y',
-            "-Z": 'Y',
-        }
-        surface_orientation = surface_orientation_mapping[config.orientation]
-
-    origin = rotation @ direction_to_vector['Z']
-    target = direction_to_vector[surface_orientation]
-    second_rotation = construct_rotation(origin, target)
-    rotation = second_rotation @ rotation
-
-    # Process each polygon
-    for points in polygons:
-        points = np.array(points)
-        points -= align_by_point
-
-        # Extend to 3D
-        length_of_points = points.shape[0]
-        points = np.hstack((points, np.zeros((length_of_points, 1))))
-
-        # Rotate
-        rotated_points = np.round(np.einsum('ij, kj -> ki', rotation, points), decimals=10)
-        # rotated_points = points
-        all_rotated_points.append(rotated_points)
-
-    # Compute offset values and HFSS variables
+
+def export_variables(ports: dict[str, NDArray], size: NDArray, config: ExportConfig) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Builds the HFSS variables of an exported geometry.
+
+    Args:
+        ports (dict[str, NDArray]): Rotated port positions relative to the alignment port.
+        size (NDArray): Extent of the exported geometry along each axis.
+        config (ExportConfig): Export settings.
+
+    Returns:
+        tuple[dict[str, str], dict[str, str]]: The independent variables (reference point and size)
+        and the dependent variables (port positions relative to the reference point).
+    """
     name = config.name
     unit = config.unit
-
-    for k, v in ports_to_center.items():
-        shifted_v = v - align_by_point
-        rotated_v = rotation @ np.array([shifted_v[0], shifted_v[1], 0])
-        hfss_variables[k] = tuple(rotated_v.tolist())
+    reference = f"{name}_{config.port}"
 
     # Convert HFSS variables to independent and dependent variables
     dependent_variables = {}
-    for k, v in hfss_variables.items():
-        dependent_variables[f"{name}_{k}_x"] = (
-            f"{name}_{align_by_port_var_name}_x + {v[0]}{unit}"
-        )
-        dependent_variables[f"{name}_{k}_y"] = (
-            f"{name}_{align_by_port_var_name}_y + {v[1]}{unit}"
-        )
-        dependent_variables[f"{name}_{k}_z"] = (
-            f"{name}_{align_by_port_var_name}_z + {v[2]}{unit}"
-        )
-
-    # need to get the smallest point in each direction for each polygon
-    flat_rotated_points = np.concatenate(all_rotated_points)
-    size = flat_rotated_points.max(axis=0) - flat_rotated_points.min(axis=0)
+    for k, v in ports.items():
+        x, y, z = v.tolist()
+        dependent_variables[f"{name}_{k}_x"] = f"{reference}_x + {x}{unit}"
+        dependent_variables[f"{name}_{k}_y"] = f"{reference}_y + {y}{unit}"
+        dependent_variables[f"{name}_{k}_z"] = f"{reference}_z + {z}{unit}"
 
-    # size = np.array([rotated_points.max(axis=0) - rotated_points.min(axis=0) for rotated_points in all_rotated_points])
     independent_variables = {
-        f"{name}_{align_by_port_var_name}_x": f"0{unit}",
-        f"{name}_{align_by_port_var_name}_y": f"0{unit}",
-        f"{name}_{align_by_port_var_name}_z": f"0{unit}",
+        f"{reference}_x": f"0{unit}",
+        f"{reference}_y": f"0{unit}",
+        f"{reference}_z": f"0{unit}",
         f"{name}_size_x": f"{size[0]}{unit}",
         f"{name}_size_y": f"{size[1]}{unit}",
         f"{name}_size_z": f"{size[2]}{unit}",
     }
+    return independent_variables, dependent_variables
 
-    # Yield points for each polygon
-    all_rotated_points_as_string = []
-    for rotated_points in all_rotated_points:
-        points_as_string = [
-            (
-                f"{name}_{align_by_port_var_name}_x + {float(x)}um",
-                f"{name}_{align_by_port_var_name}_y + {float(y)}um",
-                f"{name}_{align_by_port_var_name}_z + {float(z)}um",
-            )
-            for x, y, z in rotated_points
-        ]
 
-        all_rotated_points_as_string.append(points_as_string)
+def _prepare(component: gf.Component, config: ExportConfig, polygons: list[NDArray] | PolygonStore | None):
+    if polygons is None:
+        polygons = _export_store(component)
+    if isinstance(polygons, PolygonStore):
+        points, offsets = _store_polygons(polygons)
+    else:
+        points, offsets = _concatenate(polygons)
+    ports_to_center = {port.name: np.array(port.dcenter) for port in component.ports}
 
-    return all_rotated_points_as_string, independent_variables, dependent_variables
+    if config.tolerance > 0:
+        simplified_polygons = shapely.simplify(_to_shapely(points, offsets), tolerance=config.tolerance)
+        points, offsets = _exterior_coordinates(simplified_polygons)
 
+        # Update ports to center after simplification
+        ports_to_center = relocate_ports(
+            ports_to_center,
+            {port.name: gf.get_layer(port.layer) for port in component.ports},
+            simplified_polygons,
+            np.full(len(simplified_polygons), _EXPORT_LAYER_INDEX),
+        )
 
+    # Align by port
+    align_by_point = ports_to_center.pop(config.port)
+    rotation = export_rotation(component.ports[config.port].orientation, config.orientation, config.surface_orientation)
 
-def parse_component(component: gf.Component, config: ExportConfig):
-    ports = component.ports
-    ports_to_center = dict(map(lambda x: (x.name, np.array(x.dcenter)), ports))
+    ports = {}
+    if ports_to_center:
+        names = list(ports_to_center)
+        shifted_ports = np.array([ports_to_center[name] for name in names]) - align_by_point
+        ports = dict(zip(names, shifted_ports @ rotation[:, :2].T))
 
-    hfss_variables = {}
+    return points, offsets, ports, align_by_point, rotation
 
-    points = component.get_polygons_points()[1][0].tolist()
 
+def _export_store(component: gf.Component) -> PolygonStore:
+    # Hierarchical components keep their sub-cells as references, they are merged
+    # here where a single outline per shape is needed.
+    return PolygonStore.from_component(component, merge=len(component.insts) > 0)
 
 
-    if config.tolerance > 0:
-        simplified = shapely.simplify(
-            shapely.Polygon(points), tolerance=config.tolerance
-        )
-        points = list(simplified.exterior.coords)
+def _store_polygons(store: PolygonStore) -> tuple[NDArray, NDArray]:
+    flat = store.flatten(_EXPORT_LAYER_INDEX)
+    return flat.points * store.dbu, flat.offsets
 
-        ports_to_center = dict(
-            map(
-                lambda x: (x[0], np.array(find_new_port_location(x[1], simplified))),
-                ports_to_center.items(),
-            )
-        )
 
-    # if config.align_by == "port":
-    center = ports_to_center.pop(config.port)
-    align_by_port_var_name = config.port
-    align_by_point = np.array(center)
-    # elif config.align_by == "xmin":
-    #     align_by_point = min(points, key=lambda x: x[0])
-    #     align_by_port_var_name = "offset"
-    # else:
-    #     raise ValueError(f"Unidentified value for align by: {config.align_by=}")
-
-    points = np.array(points)
-    points -= align_by_point
-
-    # extending to 3d
-    length_of_points = points.shape[0]  # Number of vectors
-    points = np.hstack((points, np.zeros((length_of_points, 1))))
-
-    # get current orientation
-    origin_angle = component.ports[config.port].orientation / 180 * np.pi
-    origin = np.array([np.cos(origin_angle), np.sin(origin_angle), 0])
-    direction_to_vector = {
-        "X": np.array([1, 0, 0]),
-        "-X": np.array([-1, 0, 0]),
-        "Y": np.array([0, 1, 0]),
-        "-Y": np.array([0, -1, 0]),
-        "Z": np.array([0, 0, 1]),
-        "-Z": np.array([0, 0, -1])
-    }
+def _rotate(points: NDArray, align_by_point: NDArray, rotation: NDArray) -> NDArray:
+    # Extend to 3D and rotate every vertex at once.
+    # Adding 0.0 turns the -0.0 produced by the rotation into 0.0
+    return np.round((points - align_by_point) @ rotation[:, :2].T, decimals=_DECIMALS) + 0.0
 
-    target = direction_to_vector[config.orientation]
-    rotation = construct_rotation(origin, target)
 
-    # now do another rotation to align surface
-    surface_orientation = config.surface_orientation
-    if surface_orientation is None:
-        surface_orientation_mapping = {
-            "X": 'Z',
-            "-X": 'Z',
-            "Y": 'Z',
-            "-Y": 'Z',
-            "Z": '-Y',
-            "-Z": 'Y'
-        }
-        surface_orientation = surface_orientation_mapping[config.orientation]
-
-    origin = rotation @ direction_to_vector['Z']
-    target = direction_to_vector[surface_orientation]
-    second_rotation = construct_rotation(origin, target)
-    rotation = second_rotation @ rotation
-
-    # rotate
-    rotated_points = np.einsum('ij, kj -> ki', rotation, points)
-
-    # get offset value
-    name = config.name
-    unit = config.unit
+def format_points(points: NDArray, config: ExportConfig) -> list[tuple[str, str, str]]:
+    """
+    Formats rotated vertices as pyaedt expressions relative to the alignment port.
 
-    # adding all the ports to the hfss variables
-    for k, v in ports_to_center.items():
-        shifted_v = v - align_by_point
-        rotated_v = rotation @ np.array([shifted_v[0], shifted_v[1], 0])
-        hfss_variables[k] = tuple(rotated_v.tolist())
+    Args:
+        points (NDArray): (N, 3) rotated vertices.
+        config (ExportConfig): Export settings.
 
-    # converting hfss_variables to x direction and y direction
-    dependent_variables = {}
-    for k, v in hfss_variables.items():
-        dependent_variables[f"{name}_{k}_x"] = (
-            f"{name}_{align_by_port_var_name}_x + {v[0]}{unit}"
-        )
-        dependent_variables[f"{name}_{k}_y"] = (
-            f"{name}_{align_by_port_var_name}_y + {v[1]}{unit}"
-        )
+    Returns:
+        list[tuple[str, str, str]]: One (x, y, z) expression tuple per vertex.
+    """
+    reference = f"{config.name}_{config.port}"
+    columns = []
+    for i, axis in enumerate("xyz"):
+        # Layout coordinates sit on a grid and repeat a lot, so only unique values are formatted
+        values, inverse = np.unique(points[:, i], return_inverse=True)
+        expressions = np.array([f"{reference}_{axis} + {value}um" for value in values.tolist()], dtype=object)
+        columns.append(expressions[inverse].tolist())
+    return list(zip(*columns))
 
-        dependent_variables[f"{name}_{k}_z"] = (
-            f"{name}_{align_by_port_var_name}_z + {v[2]}{unit}"
-        )
 
-    # size
-    size = rotated_points.max(axis=0) - rotated_points.min(axis=0)
+def parse_component_multi(component: gf.Component, config: ExportConfig):
+    """
+    Exports every polygon of a component.
 
-    # adding the reference variable
-    independent_variables = {
-        f"{name}_{align_by_port_var_name}_x": f"0{unit}",
-        f"{name}_{align_by_port_var_name}_y": f"0{unit}",
-        f"{name}_{align_by_port_var_name}_z": f"0{unit}",
-        f"{name}_size_x": f"{size[0]}{unit}",
-        f"{name}_size_y": f"{size[1]}{unit}",
-        f"{name}_size_z": f"{size[2]}{unit}"
-    }
+    Args:
+        component (gf.Component): The component to export.
+        config (ExportConfig): Export settings.
 
+    Returns:
+        tuple: The point expressions of each polygon, the independent variables and the dependent variables.
+    """
+    geometry = export_geometry(component, config)
+    independent_variables, dependent_variables = export_variables(geometry.ports, geometry.size, config)
 
-    points_as_string = [
-        (
-            f"{name}_{align_by_port_var_name}_x + {float(x)}um",
-            f"{name}_{align_by_port_var_name}_y + {float(y)}um",
-            f"{name}_{align_by_port_var_name}_z + {float(z)}um",
-        )
-        for x, y, z in rotated_points
+    formatted = format_points(geometry.points, config)
+    all_rotated_points_as_string = [
+        formatted[start:end] for start, end in zip(geometry.offsets[:-1], geometry.offsets[1:])
     ]
+    return all_rotated_points_as_string, independent_variables, dependent_variables
+
+
+def parse_component(component: gf.Component, config: ExportConfig):
+    """
+    Exports the first polygon of a component.
 
-    return points_as_string, independent_variables, dependent_variables
+    Args:
+        component (gf.Component): The component to export.
+        config (ExportConfig): Export settings.
 
+    Returns:
+        tuple: The point expressions of the polygon, the independent variables and the dependent variables.
+    """
+    points, offsets = _store_polygons(_export_store(component))
+    geometry = export_geometry(component, config, polygons=[points[offsets[0]:offsets[1]]])
+    independent_variables, dependent_variables = export_variables(geometry.ports, geometry.size, config)
+    return format_points(geometry.points, config), independent_variables, dependent_variables
 
-if __name__ == '__main__':
-    origin = np.array([1, 0, 0])
-    target = np.array([0, 1, 0])
 
-    r = construct_rotation(origin, target)
+def iter_parse_component(component: gf.Component, config: ExportConfig, chunk_size: int = 1) -> Iterator[ExportChunk]:
+    """
+    Exports the polygons of a component as a stream of chunks.
 
-    points = np.array([[1, 0, 0], [0.5, 0, 0]])
+    Unlike parse_component_multi, the point expressions are only built for one chunk
+    at a time, so a consumer can push polygons to AEDT while the rest is still being
+    parsed and memory stays bounded by the chunk size. The first chunk carries all
+    the HFSS variables; later chunks carry empty variable dictionaries.
 
-    rotated_points = np.einsum('ij, kj -> ki', r, points)
+    Args:
+        component (gf.Component): The component to export.
+        config (ExportConfig): Export settings.
+        chunk_size (int): Number of polygons per chunk.
 
-    print(1)
+    Yields:
+        ExportChunk: The point expressions of up to `chunk_size` polygons and their variables.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+
+    points, offsets, ports, align_by_point, rotation = _prepare(component, config, None)
+    chunks = [offsets[first:first + chunk_size + 1] for first in range(0, len(offsets) - 1, chunk_size)]
+
+    # First pass: extent of the rotated geometry, without keeping the rotated vertices
+    low = np.full(3, np.inf)
+    high = np.full(3, -np.inf)
+    for chunk_offsets in chunks:
+        rotated_points = _rotate(points[chunk_offsets[0]:chunk_offsets[-1]], align_by_point, rotation)
+        if len(rotated_points):
+            low = np.minimum(low, rotated_points.min(axis=0))
+            high = np.maximum(high, rotated_points.max(axis=0))
+    independent_variables, dependent_variables = export_variables(ports, high - low, config)
+
+    if not chunks:
+        yield ExportChunk([], independent_variables, dependent_variables)
+        return
+
+    # Second pass: format and yield one chunk at a time
+    for chunk_offsets in chunks:
+        start = chunk_offsets[0]
+        formatted = format_points(_rotate(points[start:chunk_offsets[-1]], align_by_point, rotation), config)
+        polygons = [formatted[a - start:b - start] for a, b in zip(chunk_offsets[:-1], chunk_offsets[1:])]
+        yield ExportChunk(polygons, independent_variables, dependent_variables)
+        independent_variables, dependent_variables = {}, {}
+
+
+def _concatenate(polygons: list[NDArray]) -> tuple[NDArray, NDArray]:
+    counts = [len(points) for points in polygons]
+    offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+    points = np.concatenate([np.asarray(points, dtype=float) for points in polygons]) if polygons else np.empty((0, 2))
+    return points, offsets
+
+
+def _to_shapely(points: NDArray, offsets: NDArray) -> NDArray:
+    return np.array([shapely.Polygon(points[start:end]) for start, end in zip(offsets[:-1], offsets[1:])], dtype=object)
+
+
+def _exterior_coordinates(polygons: NDArray) -> tuple[NDArray, NDArray]:
+    coordinates, index = shapely.get_coordinates(shapely.get_exterior_ring(polygons), return_index=True)
+    counts = np.bincount(index, minlength=len(polygons))
+    return coordinates, np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
@@ -4,6 +4,7 @@ from .base_arm import BaseArmConfig
 from .regular_arm import RegularArmConfig
 from pydantic import ConfigDict, computed_field
 from functools import cached_property
+from ..shared import config_cell
 class AntisymmetricJunctionConfig(BaseJunctionConfig):
     """
     Base configuration for antisymmetric junction components.
@@ -33,9 +34,11 @@ class AntisymmetricJunctionConfig(BaseJunctionConfig):
     def get_right_arm_config(self) -> BaseArmConfig:
         return self.arm
 
+    @config_cell
     def build(self) -> gf.Component:
-        return AntisymmetricJunctionConfig._build(
-            arm=self.arm,
+        return AntisymmetricJunctionConfig.antisymmetricJunction(
+            arm=self.arm.build(),
+            arm_gap_port_name=self.arm.GAP_PORT_NAME,
             gap_length=self.gap_length,
             layer=self.layer,
             gap_layer=self.gap_layer,
@@ -49,22 +52,21 @@ class AntisymmetricJunctionConfig(BaseJunctionConfig):
     def antisymmetricJunction(arm: gf.Component, arm_gap_port_name: str, gap_length: float, layer, gap_layer, gap_create: bool, right_prefix: str, left_prefix: str) -> gf.Component:
         c = gf.Component()
         
-        # Create left and right arms using the same arm configuration
-        a = arm.build()
-        right_arm_ref = c << a.copy()
-        left_arm_ref = c << a.mirror_x().mirror_y()
+        # Both arms reference the same arm cell, the left one rotated by the connection
+        right_arm_ref = c << arm
+        left_arm_ref = c << arm
 
         # Connect the arms via ports
         left_arm_ref.connect(arm_gap_port_name, right_arm_ref.ports[arm_gap_port_name])
-        
-        # Position the right arm
-        right_arm_ref.move((arm.length + gap_length, 0))
+
+        # Open the gap between the arms
+        left_arm_ref.movex(-gap_length)
 
         if gap_create:
             # Create a gap in the junction
             gap = c << gf.components.rectangle(size=(gap_length, right_arm_ref.ymax - right_arm_ref.ymin), layer=gap_layer)
             gap.connect("e1", left_arm_ref.ports[arm_gap_port_name], allow_layer_mismatch=True)
-            gap.connect("e2", right_arm_ref.ports[arm_gap_port_name], allow_layer_mismatch=True)
+            gap.connect("e3", right_arm_ref.ports[arm_gap_port_name], allow_layer_mismatch=True)
 
         # Add ports for the arms
         c.add_ports(right_arm_ref.ports, prefix=right_prefix)
@@ -1,4 +1,4 @@
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from ..base_config import BaseConfig
 import gdsfactory as gf
 
@@ -11,17 +11,9 @@ class BaseArmConfig(BaseConfig):
 
     CONNECTION_PORT_NAME: str = Field("connection", exclude=True)
     GAP_PORT_NAME: str = Field("gap", exclude=True)
-    
-    def __eq__(self, other):
-        if not isinstance(other, BaseArmConfig):
-            return NotImplemented
-        # include layer if it affects build
-        return self.layer == other.layer
-
-    def __hash__(self):
-        # same fields as __eq__
-        return hash((self.layer))
 
+    model_config = ConfigDict(frozen=True)
+    
     def build(self) -> gf.Component:
         raise NotImplementedError("Subclasses should implement this method.")
 
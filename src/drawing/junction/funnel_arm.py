@@ -1,7 +1,6 @@
 import gdsfactory as gf
 import gdsfactory.components as gc
 from pydantic import ConfigDict, computed_field, model_validator
-from pyparsing import cached_property
 from .base_arm import BaseArmConfig
 
 class FunnelrArmConfig(BaseArmConfig):
@@ -20,18 +19,8 @@ class FunnelrArmConfig(BaseArmConfig):
     narrow_length: float = 10.0
     narrow_width: float = 2.0
 
-    def __eq__(self, other):
-        if not isinstance(other, FunnelrArmConfig):
-            return NotImplemented
-        # include layer if it affects build
-        return (self.wide_length, self.wide_width, self.narrow_length, self.narrow_width, self.layer) == (other.wide_length, other.wide_width, other.narrow_length, other.narrow_width, other.layer)
-
-    def __hash__(self):
-        # same fields as __eq__
-        return hash((self.wide_length, self.wide_width, self.narrow_length, self.narrow_width, self.layer))
-
     def build(self) -> gf.Component:
-        return FunnelrArmConfig._build(
+        return FunnelrArmConfig.funnelrArm(
             self.wide_length,
             self.wide_width,
             self.narrow_length,
@@ -4,7 +4,6 @@ from ..shared import DEFAULT_LAYER
 import gdsfactory as gf
 from .base_arm import BaseArmConfig
 from pydantic import ConfigDict, computed_field
-from pyparsing import cached_property
 
 class RegularArmConfig(BaseArmConfig):
     """
@@ -18,16 +17,6 @@ class RegularArmConfig(BaseArmConfig):
     length: float = 10.0
     width: float = 1.0
 
-    def __eq__(self, other):
-        if not isinstance(other, RegularArmConfig):
-            return NotImplemented
-        # include layer if it affects build
-        return (self.length, self.width, self.layer) == (other.length, other.width, other.layer)
-
-    def __hash__(self):
-        # same fields as __eq__
-        return hash((self.length, self.width, self.layer))
-
     def build(self) -> gf.Component:
         return RegularArmConfig.regularArm(
         self.length, 
@@ -1,4 +1,4 @@
-from drawing.shared.utilities import JUNCTION_PICTURE_LAYER
+from drawing.shared.utilities import JUNCTION_PICTURE_LAYER, config_cell
 import gdsfactory as gf
 from .base_junction import BaseJunctionConfig
 from .base_arm import BaseArmConfig
@@ -34,9 +34,10 @@ class SymmetricJunctionConfig(BaseJunctionConfig):
     def get_right_arm_config(self) -> BaseArmConfig:
         return self.arm
 
+    @config_cell
     def build(self) -> gf.Component:
         return SymmetricJunctionConfig.symmetricJunction(
-            arm=self.arm.build().copy(),
+            arm=self.arm.build(),
             arm_gap_port_name=self.arm.GAP_PORT_NAME,
             gap_length=self.gap_length,
             layer=self.layer,
@@ -51,18 +52,14 @@ class SymmetricJunctionConfig(BaseJunctionConfig):
     def symmetricJunction(arm: gf.Component, arm_gap_port_name: str, gap_length: float, layer, gap_layer, gap_create: bool, right_prefix: str, left_prefix: str) -> gf.Component:
         c = gf.Component()
 
-        arm.layer = layer
-
-        # Create left and right arms using the same arm configuration
-        # a = arm.build ()      
-
-        right_arm_ref = c << arm.copy()
-        left_arm_ref = c << arm.mirror_x()
+        # Both arms reference the same arm cell, the left one mirrored
+        right_arm_ref = c << arm
+        left_arm_ref = c << arm
 
         # Add validation that port "gap" exists in both arms
 
         # Connect the arms via ports
-        left_arm_ref.connect(arm_gap_port_name, right_arm_ref.ports[arm_gap_port_name])
+        left_arm_ref.connect(arm_gap_port_name, right_arm_ref.ports[arm_gap_port_name], mirror=True)
         # Position the right arm
         left_arm_ref.movex(-gap_length)
 
@@ -70,7 +67,7 @@ class SymmetricJunctionConfig(BaseJunctionConfig):
             # Create a gap in the junction
             gap = c << gf.components.rectangle(size=(gap_length, right_arm_ref.ymax - right_arm_ref.ymin), layer=gap_layer)
             gap.connect("e1", left_arm_ref.ports[arm_gap_port_name], allow_layer_mismatch=True)
-            gap.connect("e2", right_arm_ref.ports[arm_gap_port_name], allow_layer_mismatch=True)
+            gap.connect("e3", right_arm_ref.ports[arm_gap_port_name], allow_layer_mismatch=True)
 
         # Add ports for the arms
         c.add_ports(right_arm_ref.ports, prefix=right_prefix)
@@ -17,16 +17,6 @@ class TArmConfig(BaseArmConfig):
     vertical_length: float = 1.0
     vertical_width: float = 10.0
 
-    def __eq__(self, other):
-        if not isinstance(other, TArmConfig):
-            return NotImplemented
-        # include layer if it affects build
-        return (self.horizontal_length, self.horizontal_width, self.vertical_length ,self.vertical_width, self.layer) == (other.horizontal_length, other.horizontal_width, other.vertical_length ,other.vertical_width, other.layer)
-
-    def __hash__(self):
-        # same fields as __eq__
-        return hash((self.horizontal_length, self.horizontal_width, self.vertical_length ,self.vertical_width, self.layer))
-
     def build(self) -> gf.Component:
         return TArmConfig.tArm(
         self.horizontal_length, 
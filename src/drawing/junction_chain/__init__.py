@@ -0,0 +1 @@
+from .junction_chain import JunctionChainConfig
@@ -0,0 +1,71 @@
+from drawing.base_config import BaseConfig
+import gdsfactory as gf
+from ..junction import BaseJunctionConfig
+from ..shared import config_cell
+from ..snail import SnailConfig
+from ..squid import SquidConfig
+from pydantic import ConfigDict
+
+class JunctionChainConfig(BaseConfig):
+    """Configuration for a chain of SNAIL or SQUID elements, as used in parametric amplifiers.
+    The element is built once and placed as a single array reference, the flux hole
+    bars of neighbouring elements touching each other, so the chain costs one cell
+    and one instance whatever its length.
+    Attributes:
+        element (SnailConfig | SquidConfig): Configuration of the repeated element.
+        count (int): Number of elements in the chain.
+        LEFT_CONNECTING_PORT_NAME (str): Name of the port at the start of the chain.
+        RIGHT_CONNECTING_PORT_NAME (str): Name of the port at the end of the chain.
+    """
+    element: SnailConfig | SquidConfig = SnailConfig()
+    count: int = 10
+
+    LEFT_CONNECTING_PORT_NAME: str = "left_connection"
+    RIGHT_CONNECTING_PORT_NAME: str = "right_connection"
+
+    model_config = ConfigDict(frozen=True)
+
+    @config_cell
+    def build(self) -> gf.Component:
+        return JunctionChainConfig.junctionChain(
+            element=self.element.build(),
+            count=self.count,
+            left_port_name=self.LEFT_CONNECTING_PORT_NAME,
+            right_port_name=self.RIGHT_CONNECTING_PORT_NAME,
+            layer=self.layer,
+        )
+
+    @gf.cell
+    @staticmethod
+    def junctionChain(
+        element: gf.Component,
+        count: int,
+        left_port_name: str,
+        right_port_name: str,
+        layer,
+    ) -> gf.Component:
+        """
+        Builds the chain by placing the element as an array reference.
+        Returns:
+            gf.Component: The chain component, starting at the origin.
+        """
+        c: gf.Component = gf.Component()
+
+        pitch = element.xmax - element.xmin
+        chain_ref = c.add_ref(element, columns=count, column_pitch=pitch)
+        chain_ref.move((-element.xmin, -element.center[1]))
+
+        height = element.ymax - element.ymin
+        c.add_port(name=left_port_name, center=(0, 0), width=height, orientation=180, layer=layer, port_type="electrical")
+        c.add_port(name=right_port_name, center=(count * pitch, 0), width=height, orientation=0, layer=layer, port_type="electrical")
+
+        return c
+
+    def get_jopherson_junctions(self) -> list[BaseJunctionConfig]:
+        return self.element.get_jopherson_junctions() * self.count
+
+    def validate(self) -> None:
+        super().validate()
+        self.element.validate()
+        if self.count < 1:
+            raise ValueError("Junction chain must have at least one element.")
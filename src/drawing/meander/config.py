@@ -7,7 +7,7 @@ meander implementations.
 from typing import Literal
 from pydantic import BaseModel
 from gdsfactory.typings import LayerSpec
-from src.drawing.shared.utilities import DEFAULT_LAYER
+from ..shared.utilities import DEFAULT_LAYER
 
 
 class MeanderEulerConfig(BaseModel):
@@ -6,13 +6,12 @@ bends, suitable for high-performance GDS layouts.
 """
 
 import gdsfactory as gf
-import numpy as np
-from itertools import chain
 from gdsfactory.typings import LayerSpec
-from ..shared.utilities import DEFAULT_LAYER, merge_decorator
+from ..shared.utilities import DEFAULT_LAYER
+from ..shared.arc_tolerance import euler_npoints
+from .hierarchical import meander_from_corner
 
 
-@merge_decorator
 def meander_euler(
     wire_width: float = 0.2,
     height: float = 10,
@@ -21,10 +20,13 @@ def meander_euler(
     num_turns: int = 9,
     radius: float = 1,
     layer: LayerSpec = DEFAULT_LAYER,
+    npoints: int | None = None,
 ) -> gf.Component:
     """
     Creates a meander pattern with Euler bends for smooth transitions.
 
+    The meander is hierarchical: a single bend cell is placed at every corner.
+
     Args:
         wire_width (float): Width of the wire.
         height (float): Total height of the meander.
@@ -33,77 +35,69 @@ def meander_euler(
         num_turns (int): Number of turns in the meander.
         radius (float): Radius for the Euler bends.
         layer (LayerSpec): GDS layer specification.
+        npoints (int | None): Number of points of each Euler bend. Defaults to the
+            smallest number keeping the bends within the arc tolerance of the layer.
 
     Returns:
         gf.Component: The generated meander component.
     """
-    c = gf.Component()
-    points = _generate_meander_points(
+    # Resolved before the cell boundary, so that the arc tolerance is part of the cell key
+    if npoints is None:
+        npoints = euler_npoints(radius, angle=90, p=1, use_eff=True, width=wire_width, layer=layer)
+    return _meander_euler(
+        wire_width=wire_width,
         height=height,
         padding_length=padding_length,
         spacing=spacing,
         num_turns=num_turns,
-    )
-
-    path = gf.path.smooth(
-        points,
         radius=radius,
-        bend=gf.path.euler,
-        use_eff=True,
-        npoints=720,
-        p=1
+        layer=layer,
+        npoints=npoints,
     )
-    cross_section = gf.cross_section.strip(width=wire_width, layer=layer)
-    waveguide = gf.path.extrude(path, cross_section)
 
-    c.add_ref(waveguide)
-    start_port = gf.Port(
-        'e1',
-        center=tuple(points[0].tolist()),
-        layer=layer[0],
-        width=wire_width,
-        orientation=180
-    )
-    end_port = gf.Port(
-        'e2',
-        center=tuple(points[-1].tolist()),
-        layer=layer[0],
-        width=wire_width,
-        orientation=0
+
+@gf.cell(basename="meander_euler")
+def _meander_euler(
+    wire_width: float,
+    height: float,
+    padding_length: float,
+    spacing: float,
+    num_turns: int,
+    radius: float,
+    layer: LayerSpec,
+    npoints: int,
+) -> gf.Component:
+    return meander_from_corner(
+        corner=euler_corner(radius=radius, wire_width=wire_width, layer=layer, npoints=npoints),
+        leg=radius,
+        wire_width=wire_width,
+        layer=layer,
+        padding_length=padding_length - radius,
+        end_height_length=height / 2 - 2 * radius,
+        height_length=height - 2 * radius,
+        spacing_length=spacing - 2 * radius,
+        num_u_turns=num_turns + 1,
     )
-    c.add_port('e1', port=start_port)
-    c.add_port('e2', port=end_port)
-    return c
 
 
-def _generate_meander_points(
-    height: float, padding_length: float, spacing: float, num_turns: int
-) -> np.ndarray:
+@gf.cell
+def euler_corner(radius: float, wire_width: float, layer: LayerSpec, npoints: int) -> gf.Component:
     """
-    Generates a set of cumulative points for constructing a meander layout.
+    Creates a 90-degree Euler bend turning left, as used by gf.path.smooth.
+
+    The centerline enters heading east at (-radius, 0) and leaves heading north
+    at (0, radius).
 
     Args:
-        height (float): Total height of the meander.
-        padding_length (float): Length of the padding at the start and end.
-        spacing (float): Horizontal spacing between turns.
-        num_turns (int): Number of turns.
+        radius (float): Effective radius of the bend.
+        wire_width (float): Width of the wire.
+        layer (LayerSpec): GDS layer specification.
+        npoints (int): Number of points of the bend.
 
     Returns:
-        np.ndarray: Array of points representing the meander path.
+        gf.Component: The bend.
     """
-    step_up_edge = [0, height / 2]
-    step_down_edge = [0, -height / 2]
-    step_up = [0, height]
-    step_down = [0, -height]
-    step_horizontal = [spacing, 0]
-
-    steps = (step_down, step_up)
-    half_steps = (step_down_edge, step_up_edge)
-    turn_points = list(chain(*[[steps[i % 2], step_horizontal] for i in range(num_turns)]))
-    end_step = half_steps[num_turns % 2]
-    total_points = (
-        [[0, 0], [padding_length, 0], step_up_edge, step_horizontal] +
-        turn_points +
-        [end_step, [padding_length, 0]]
-    )
-    return np.array(total_points).cumsum(axis=0)
+    path = gf.path.euler(radius=radius, angle=90, p=1, use_eff=True, npoints=npoints)
+    path.move((-radius, 0))
+    cross_section = gf.cross_section.strip(width=wire_width, layer=layer)
+    return gf.path.extrude(path, cross_section)
@@ -0,0 +1,178 @@
+"""
+Hierarchical meander engine.
+
+A meander is a chain of straight segments joined by identical 90-degree corners.
+The engine builds the corner once, the few distinct straight segments once, and
+places them with precomputed transformations: the repeated U-turns and the
+vertical segments between them are each a single array reference. The number of
+cells and references does not grow with the number of turns, and the meander is
+never flattened, the exporter merges its shapes when it is written out.
+"""
+
+import gdsfactory as gf
+from gdsfactory.typings import LayerSpec
+from kfactory import kdb
+
+
+@gf.cell
+def straight_wire(length: float, wire_width: float, layer: LayerSpec) -> gf.Component:
+    """
+    Creates a straight wire segment along the x axis, starting at the origin.
+
+    Args:
+        length (float): Length of the segment.
+        wire_width (float): Width of the wire.
+        layer (LayerSpec): GDS layer specification.
+
+    Returns:
+        gf.Component: The wire segment.
+    """
+    c = gf.Component()
+    c.add_polygon(
+        [(0, -wire_width / 2), (length, -wire_width / 2), (length, wire_width / 2), (0, wire_width / 2)],
+        layer=layer,
+    )
+    c.add_port("e1", center=(0, 0), width=wire_width, orientation=180, layer=layer, port_type="electrical")
+    c.add_port("e2", center=(length, 0), width=wire_width, orientation=0, layer=layer, port_type="electrical")
+    return c
+
+
+@gf.cell
+def u_turn(
+    corner: gf.Component,
+    leg: float,
+    spacing_length: float,
+    wire_width: float,
+    layer: LayerSpec,
+) -> gf.Component:
+    """
+    Creates a U-turn made of two corners and the straight segment between them.
+
+    The U-turn enters heading north at (0, -leg) and leaves heading south at
+    (spacing_length + 2 * leg, -leg).
+
+    Args:
+        corner (gf.Component): Left turn corner, see `meander_from_corner`.
+        leg (float): Distance from the corner point to the ends of the corner.
+        spacing_length (float): Length of the straight segment between the corners.
+        wire_width (float): Width of the wire.
+        layer (LayerSpec): GDS layer specification.
+
+    Returns:
+        gf.Component: The U-turn.
+    """
+    c = gf.Component()
+
+    # North to east, the left turn mirrored and rotated
+    first = c << corner
+    first.dcplx_trans = kdb.DCplxTrans(1, 90, True, 0, 0)
+
+    if spacing_length > 0:
+        straight = c << straight_wire(spacing_length, wire_width, layer)
+        straight.dmove((leg, 0))
+
+    # East to south, the left turn mirrored
+    second = c << corner
+    second.dcplx_trans = kdb.DCplxTrans(1, 0, True, spacing_length + 2 * leg, 0)
+    return c
+
+
+@gf.cell
+def meander_from_corner(
+    corner: gf.Component,
+    leg: float,
+    wire_width: float,
+    layer: LayerSpec,
+    padding_length: float,
+    end_height_length: float,
+    height_length: float,
+    spacing_length: float,
+    num_u_turns: int,
+    start_x: float = 0,
+) -> gf.Component:
+    """
+    Creates a meander from a corner cell.
+
+    The meander starts heading east at (start_x, 0), turns up, then alternates
+    U-turns at the top and at the bottom, and leaves heading east after the last
+    vertical segment. The corner is a left turn whose centerline enters heading
+    east at (-leg, 0) and leaves heading north at (0, leg); the other corners are
+    its mirrored and rotated placements.
+
+    Args:
+        corner (gf.Component): The left turn corner.
+        leg (float): Distance from the corner point to the ends of the corner.
+        wire_width (float): Width of the wire.
+        layer (LayerSpec): GDS layer specification.
+        padding_length (float): Length of the straight segments at the start and end.
+        end_height_length (float): Length of the first and last vertical segments.
+        height_length (float): Length of the vertical segments between two U-turns.
+        spacing_length (float): Length of the straight segment of a U-turn.
+        num_u_turns (int): Number of U-turns.
+        start_x (float): x coordinate of the start of the meander.
+
+    Returns:
+        gf.Component: The meander, with ports e1 at its start and e2 at its end.
+
+    Raises:
+        ValueError: If a segment length is negative or there is no U-turn.
+    """
+    if min(padding_length, end_height_length, height_length, spacing_length) < 0:
+        raise ValueError("Meander segments must be at least as long as the corners they join.")
+    if num_u_turns < 1:
+        raise ValueError("Meander must have at least one U-turn.")
+
+    c = gf.Component()
+    pitch = spacing_length + 2 * leg
+    first_x = start_x + padding_length + leg
+    top = end_height_length + 2 * leg
+    bottom = top - height_length - 2 * leg
+
+    def add_straight(length: float, trans: kdb.DCplxTrans, columns: int = 1, column_pitch: float = 0) -> None:
+        if length > 0 and columns > 0:
+            ref = c.add_ref(straight_wire(length, wire_width, layer), columns=columns, column_pitch=column_pitch)
+            ref.dcplx_trans = trans
+
+    # Start: padding, left turn and the first vertical segment going up
+    add_straight(padding_length, kdb.DCplxTrans(start_x, 0))
+    first_corner = c << corner
+    first_corner.dcplx_trans = kdb.DCplxTrans(first_x, 0)
+    add_straight(end_height_length, kdb.DCplxTrans(1, 90, False, first_x, leg))
+
+    # U-turns alternate between the top and the bottom, vertical segments join them
+    turn = u_turn(corner, leg, spacing_length, wire_width, layer)
+    top_turns = c.add_ref(turn, columns=(num_u_turns + 1) // 2, column_pitch=2 * pitch)
+    top_turns.dcplx_trans = kdb.DCplxTrans(first_x, top)
+    if num_u_turns > 1:
+        bottom_turns = c.add_ref(turn, columns=num_u_turns // 2, column_pitch=2 * pitch)
+        bottom_turns.dcplx_trans = kdb.DCplxTrans(1, 0, True, first_x + pitch, bottom)
+    add_straight(
+        height_length,
+        kdb.DCplxTrans(1, 90, False, first_x + pitch, bottom + leg),
+        columns=num_u_turns - 1,
+        column_pitch=pitch,
+    )
+
+    # End: the last vertical segment, a turn to the east and padding
+    last_x = first_x + num_u_turns * pitch
+    end_corner = c << corner
+    if num_u_turns % 2:
+        end_y = top - end_height_length - 2 * leg
+        add_straight(end_height_length, kdb.DCplxTrans(1, 90, False, last_x, end_y + leg))
+        end_corner.dcplx_trans = kdb.DCplxTrans(1, 270, False, last_x, end_y)
+    else:
+        end_y = bottom + end_height_length + 2 * leg
+        add_straight(end_height_length, kdb.DCplxTrans(1, 90, False, last_x, bottom + leg))
+        end_corner.dcplx_trans = kdb.DCplxTrans(1, 90, True, last_x, end_y)
+    add_straight(padding_length, kdb.DCplxTrans(last_x + leg, end_y))
+
+    c.add_port("e1", center=(start_x, 0), width=wire_width, orientation=180, layer=layer, port_type="electrical")
+    c.add_port(
+        "e2",
+        center=(last_x + leg + padding_length, end_y),
+        width=wire_width,
+        orientation=0,
+        layer=layer,
+        port_type="electrical",
+    )
+    return c
@@ -0,0 +1,213 @@
+"""
+Analytic centerline length of meanders and a solver for target lengths.
+
+The centerline of a meander is a chain of straight segments joined by identical
+90-degree corners, so its length is a closed-form function of the meander
+parameters, linear in the height for a given number of turns. Resonator lengths
+are computed and solved for without building any geometry: the solver evaluates
+every number of turns fitting the bounding box at once and returns the
+configuration meeting the target length.
+"""
+
+import math
+from functools import lru_cache
+
+import gdsfactory as gf
+import gdsfactory.components as gc
+import numpy as np
+from numpy.typing import NDArray
+
+from .config import MeanderEulerConfig, MeanderOptimalTurnConfig
+
+MeanderConfig = MeanderEulerConfig | MeanderOptimalTurnConfig
+
+
+def euler_bend_length(radius: float, angle: float = 90, p: float = 1) -> float:
+    """
+    Returns the centerline length of an Euler bend with an effective radius.
+
+    The bend consists of two clothoids of length p * angle * Rmin and an arc of
+    length (1 - p) * angle * Rmin, Rmin being proportional to the effective radius.
+
+    Args:
+        radius (float): Effective radius of the bend, as passed to gf.path.euler with use_eff=True.
+        angle (float): Bend angle in degrees.
+        p (float): Fraction of the bend drawn as clothoids.
+
+    Returns:
+        float: Length of the bend.
+    """
+    return (1 + p) * math.radians(abs(angle)) * radius * _euler_min_radius_ratio(angle, p)
+
+
+def optimal_turn_leg(wire_width: float) -> float:
+    """
+    Returns the distance from the corner point to the ends of an optimal 90-degree turn.
+
+    Args:
+        wire_width (float): Width of the wire.
+
+    Returns:
+        float: Leg length of the turn, as used by meander_optimal_turn.
+    """
+    return _optimal_turn_size(wire_width) - wire_width / 2
+
+
+def centerline_length(config: MeanderConfig) -> float:
+    """
+    Returns the centerline length of a meander, from port e1 to port e2.
+
+    The centerline of an optimal turn is taken through its corner point.
+
+    Args:
+        config (MeanderConfig): The meander configuration.
+
+    Returns:
+        float: Length of the meander.
+    """
+    offset, slope = _length_coefficients(config, np.array([config.num_turns]))
+    return float(offset[0] + slope[0] * config.height)
+
+
+def meander_size(config: MeanderConfig) -> tuple[float, float]:
+    """
+    Returns the size of the bounding box of a meander.
+
+    Args:
+        config (MeanderConfig): The meander configuration.
+
+    Returns:
+        tuple[float, float]: Width and height of the meander.
+    """
+    num_turns = np.array([config.num_turns])
+    height = np.array([config.height], dtype=float)
+    return float(_width(config, num_turns)[0]), float(_bbox_height(config, num_turns, height)[0])
+
+
+def solve_meander_length(
+    config: MeanderConfig,
+    target_length: float,
+    max_width: float,
+    max_height: float,
+) -> MeanderConfig:
+    """
+    Finds the number of turns and the height of a meander of a given length.
+
+    The wire width, spacing, padding and bend radius of the configuration are
+    kept. Among the numbers of turns for which a height within the bounding box
+    meets the target, the smallest is chosen, i.e. the meander with the fewest
+    corners. The height is rounded to twice the database unit so that the
+    meander stays on grid, which changes the length by less than the database
+    unit per turn.
+
+    Args:
+        config (MeanderConfig): Configuration providing the fixed parameters.
+        target_length (float): Centerline length to meet.
+        max_width (float): Maximum width of the meander.
+        max_height (float): Maximum height of the meander.
+
+    Returns:
+        MeanderConfig: Copy of the configuration with num_turns and height set.
+
+    Raises:
+        ValueError: If no meander with these parameters fits the bounding box.
+    """
+    _check(config)
+    first_turns = 0 if isinstance(config, MeanderEulerConfig) else 1
+    num_turns = np.arange(first_turns, max(_max_turns(config, max_width), first_turns - 1) + 1)
+
+    offset, slope = _length_coefficients(config, num_turns)
+    grid = 2 * gf.kcl.dbu
+    height = np.round((target_length - offset) / slope / grid) * grid
+    feasible = (height >= _min_height(config)) & (_bbox_height(config, num_turns, height) <= max_height)
+
+    if not feasible.any():
+        raise ValueError(
+            f"No meander of length {target_length} fits in {max_width} x {max_height} "
+            f"with these wire, spacing and padding parameters."
+        )
+    best = np.flatnonzero(feasible)[0]
+    return config.model_copy(update={"num_turns": int(num_turns[best]), "height": float(height[best])})
+
+
+@lru_cache(maxsize=None)
+def _euler_min_radius_ratio(angle: float, p: float) -> float:
+    # Rmin scales with the effective radius, the ratio only depends on the bend shape
+    return float(gf.path.euler(radius=1, angle=angle, p=p, use_eff=True, npoints=3).info["Rmin"])
+
+
+@lru_cache(maxsize=None)
+def _optimal_turn_size(wire_width: float) -> float:
+    turn = gc.optimal_90deg(width=wire_width)
+    return turn.xmax - turn.xmin
+
+
+def _check(config: MeanderConfig) -> None:
+    if isinstance(config, MeanderEulerConfig):
+        if config.spacing < 2 * config.radius or config.padding_length < config.radius:
+            raise ValueError("Meander spacing and padding must leave room for the Euler bends.")
+    elif not isinstance(config, MeanderOptimalTurnConfig):
+        raise TypeError(f"Unsupported meander configuration {type(config).__name__}.")
+
+
+def _length_coefficients(config: MeanderConfig, num_turns: NDArray) -> tuple[NDArray, NDArray]:
+    """
+    Returns the length of meanders as offset + slope * height, per number of turns.
+    """
+    _check(config)
+    n = num_turns.astype(float)
+    if isinstance(config, MeanderEulerConfig):
+        radius = config.radius
+        bend = euler_bend_length(radius)
+        # Two padding and two half-height segments, n full-height segments,
+        # n + 1 spacing segments and 2 n + 4 bends
+        offset = (
+            2 * (config.padding_length - radius)
+            - 4 * radius
+            - 2 * radius * n
+            + (n + 1) * (config.spacing - 2 * radius)
+            + (2 * n + 4) * bend
+        )
+        return offset, n + 1
+
+    turn_size = _optimal_turn_size(config.wire_width)
+    leg = optimal_turn_leg(config.wire_width)
+    # Two padding and two half-height segments, n - 1 full-height segments,
+    # n spacing segments and 2 n + 2 turns
+    offset = (
+        2 * config.padding_length
+        - 4 * turn_size
+        - 2 * turn_size * (n - 1)
+        + n * config.spacing
+        + (2 * n + 2) * 2 * leg
+    )
+    return offset, n
+
+
+def _width(config: MeanderConfig, num_turns: NDArray) -> NDArray:
+    if isinstance(config, MeanderEulerConfig):
+        return 2 * config.padding_length + (num_turns + 1) * config.spacing
+    leg = optimal_turn_leg(config.wire_width)
+    return 2 * config.padding_length + num_turns * config.spacing + (2 * num_turns + 2) * leg
+
+
+def _max_turns(config: MeanderConfig, max_width: float) -> int:
+    if isinstance(config, MeanderEulerConfig):
+        return math.floor((max_width - 2 * config.padding_length) / config.spacing) - 1
+    leg = optimal_turn_leg(config.wire_width)
+    return math.floor((max_width - 2 * config.padding_length - 2 * leg) / (config.spacing + 2 * leg))
+
+
+def _min_height(config: MeanderConfig) -> float:
+    # The half-height segments must be at least as long as the two corners they join
+    if isinstance(config, MeanderEulerConfig):
+        return 4 * config.radius
+    return 4 * _optimal_turn_size(config.wire_width)
+
+
+def _bbox_height(config: MeanderConfig, num_turns: NDArray, height: NDArray) -> NDArray:
+    if isinstance(config, MeanderEulerConfig):
+        # Without turns the meander never reaches its bottom side
+        return np.where(num_turns >= 1, height + config.wire_width, height / 2 + config.wire_width)
+    # The optimal turns end half a wire width below the top, the bottom is reached from two turns on
+    return np.where(num_turns >= 2, height, height / 2)
@@ -42,8 +42,8 @@ class twoResonatorsTwoTransmonSampleConfig(BaseSampleConfig):
         num_turns = 6,
         radius = 100)
 
-        res_left_ref = c << res.copy()
-        res_right_ref = c << res.copy()
+        res_left_ref = c << res
+        res_right_ref = c << res
 
         # res_left_ref = c << ResonatorLeft
         # res_right_ref = c << ResonatorRight
@@ -1 +1,7 @@
-from .utilities import merge_decorator, smooth_corners, merge_referenced_shapes, DEFAULT_LAYER, JUNCTION_FOCUS_LAYER, JUNCTION_PICTURE_LAYER, ONE_INCH_IN_MICROMETER, array_mirror_x, array_mirror_y
+from .utilities import merge_decorator, preserve_hierarchy, hierarchy_preserved, config_cell, clear_config_cell_cache, smooth_corners, merge_referenced_shapes, DEFAULT_LAYER, JUNCTION_FOCUS_LAYER, JUNCTION_PICTURE_LAYER, DRC_MARKER_LAYER, ONE_INCH_IN_MICROMETER, array_mirror_x, array_mirror_y
+from .build_cache import BuildCache, default_build_cache
+from .build_graph import BuildGraph, BuildNode, default_build_graph
+from .arc_tolerance import set_arc_tolerance, get_arc_tolerance, reset_arc_tolerance, arc_points, circle_angle_resolution, euler_npoints
+from .profiling import BuildProfiler, profile_build, profiled
+from .layout_export import LayoutFileReport, write_layout, compare_layout_formats
+from .polygon_store import PolygonStore, FlatPolygons
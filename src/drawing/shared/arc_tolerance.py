@@ -0,0 +1,157 @@
+"""
+Tolerance driven discretization of curved geometry.
+
+Every curved primitive of the library (rounded corners, circles, euler bends)
+chooses its number of vertices from a maximum sagitta, i.e. the largest distance
+allowed between a chord and the arc it approximates. The tolerance is global and
+expressed in database units, and can be overridden per layer, e.g. to draw the
+wafer outline much coarser than the junctions.
+"""
+
+import math
+
+import gdsfactory as gf
+from gdsfactory.typings import LayerSpec
+
+DEFAULT_ARC_TOLERANCE = 5  # database units
+DEFAULT_LAYER_ARC_TOLERANCES: dict[tuple[int, int], float] = {
+    (60, 0): 5000,  # DEFAULT_WAFER_LAYER, only drawn as an outline
+}
+MAX_ARC_POINTS = 8000  # per full circle, below the GDS limit on polygon vertices
+MIN_CIRCLE_POINTS = 8
+
+_arc_tolerance: float = DEFAULT_ARC_TOLERANCE
+_layer_arc_tolerances: dict[tuple[int, int], float] = dict(DEFAULT_LAYER_ARC_TOLERANCES)
+
+
+def set_arc_tolerance(tolerance: float, layer: LayerSpec | None = None) -> None:
+    """
+    Sets the maximum sagitta of curved geometry.
+
+    Args:
+        tolerance (float): Maximum sagitta in database units.
+        layer (LayerSpec | None): Layer the tolerance applies to. None sets the global tolerance.
+
+    Raises:
+        ValueError: If the tolerance is not positive.
+    """
+    global _arc_tolerance
+    if tolerance <= 0:
+        raise ValueError("Arc tolerance must be greater than zero.")
+    if layer is None:
+        _arc_tolerance = tolerance
+    else:
+        _layer_arc_tolerances[_layer_key(layer)] = tolerance
+
+
+def reset_arc_tolerance() -> None:
+    """
+    Restores the default global tolerance and per-layer overrides.
+    """
+    global _arc_tolerance
+    _arc_tolerance = DEFAULT_ARC_TOLERANCE
+    _layer_arc_tolerances.clear()
+    _layer_arc_tolerances.update(DEFAULT_LAYER_ARC_TOLERANCES)
+
+
+def get_arc_tolerance(layer: LayerSpec | None = None) -> float:
+    """
+    Returns the maximum sagitta of curved geometry on a layer.
+
+    Args:
+        layer (LayerSpec | None): The layer. None returns the global tolerance.
+
+    Returns:
+        float: Maximum sagitta in microns.
+    """
+    tolerance = _arc_tolerance
+    if layer is not None:
+        tolerance = _layer_arc_tolerances.get(_layer_key(layer), tolerance)
+    return tolerance * gf.kcl.dbu
+
+
+def arc_tolerance_state() -> tuple:
+    """
+    Returns a hashable snapshot of the tolerance settings, used in build cache keys.
+
+    Returns:
+        tuple: The global tolerance and the sorted per-layer overrides.
+    """
+    return _arc_tolerance, tuple(sorted(_layer_arc_tolerances.items()))
+
+
+def arc_points(radius: float, angle: float = 360, layer: LayerSpec | None = None) -> int:
+    """
+    Returns the number of chords approximating a circular arc within the tolerance.
+
+    Args:
+        radius (float): Arc radius in microns.
+        angle (float): Arc angle in degrees.
+        layer (LayerSpec | None): Layer the arc is drawn on.
+
+    Returns:
+        int: Number of chords, at least 1.
+    """
+    tolerance = get_arc_tolerance(layer)
+    if radius <= tolerance:
+        return 1
+    step = 2 * math.acos(1 - tolerance / radius)
+    chords = math.ceil(math.radians(abs(angle)) / step)
+    return max(1, min(chords, math.ceil(MAX_ARC_POINTS * abs(angle) / 360)))
+
+
+def circle_angle_resolution(radius: float, layer: LayerSpec | None = None) -> float:
+    """
+    Returns the angle resolution of a circle of the given radius within the tolerance.
+
+    Args:
+        radius (float): Circle radius in microns.
+        layer (LayerSpec | None): Layer the circle is drawn on.
+
+    Returns:
+        float: Angle between consecutive vertices in degrees, as taken by gf.components.circle.
+    """
+    return 360 / max(arc_points(radius, 360, layer), MIN_CIRCLE_POINTS)
+
+
+def euler_npoints(
+    radius: float,
+    angle: float = 90,
+    p: float = 0.5,
+    use_eff: bool = False,
+    width: float = 0,
+    layer: LayerSpec | None = None,
+) -> int:
+    """
+    Returns the number of points of an euler bend within the tolerance.
+
+    The points of gf.path.euler are evenly spaced along the curve, so the spacing
+    is chosen for the tightest curvature of the bend, 1 / Rmin, on the outer edge
+    of the extruded wire. The bend consists of two clothoids of length
+    p * angle * Rmin and an arc of length (1 - p) * angle * Rmin.
+
+    Args:
+        radius (float): Bend radius in microns, as passed to gf.path.euler.
+        angle (float): Bend angle in degrees.
+        p (float): Fraction of the bend drawn as clothoids.
+        use_eff (bool): Whether the radius is the effective radius of the bend.
+        width (float): Width of the wire extruded along the bend in microns.
+        layer (LayerSpec | None): Layer the bend is drawn on.
+
+    Returns:
+        int: Value for the npoints argument of gf.path.euler.
+    """
+    # Two points would draw a straight segment, for which gf.path.euler reports no Rmin
+    min_radius = gf.path.euler(radius=radius, angle=angle, p=p, use_eff=use_eff, npoints=3).info["Rmin"]
+    length = (1 + p) * math.radians(abs(angle)) * min_radius
+    outer_radius = min_radius + width / 2
+    # Sagitta of a chord c on a circle of radius r: c ** 2 / (8 * r), scaled back to the center line
+    spacing = math.sqrt(8 * outer_radius * get_arc_tolerance(layer)) * min_radius / outer_radius
+    return max(math.ceil(length / spacing) + 1, 3)
+
+
+def _layer_key(layer: LayerSpec) -> tuple[int, int]:
+    if isinstance(layer, tuple):
+        return int(layer[0]), int(layer[1])
+    info = gf.kcl.get_info(gf.get_layer(layer))
+    return info.layer, info.datatype
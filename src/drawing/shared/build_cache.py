@@ -0,0 +1,289 @@
+"""
+Persistent, content-addressed build cache for configuration objects.
+
+Built cells are written to disk as a GDS file plus a JSON sidecar holding the
+ports, keyed by a stable hash of the configuration and of the geometry version:
+the library, gdsfactory, kfactory and KLayout versions and a hash of the library
+sources, so that a change of any builder code is never served stale geometry.
+Identical configurations built in a new Python process are then loaded from
+disk instead of being rebuilt. The cache is bounded in size and evicts the
+least recently used entries first.
+
+The cells of an entry are stored under their names suffixed with the cache key,
+so a loaded entry never shares a cell name with the same cell built in the process.
+"""
+
+import hashlib
+import json
+import os
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import gdsfactory as gf
+from kfactory import kdb
+
+from .utilities import build_settings
+
+if TYPE_CHECKING:
+    from ..base_config import BaseConfig
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("DRAWING_CACHE_DIR", Path.home() / ".cache" / "drawing"))
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+_GDS_SUFFIX = ".gds"
+_PORTS_SUFFIX = ".ports.json"
+# Number of key characters appended to the names of the cached cells
+_CELL_SUFFIX_LENGTH = 8
+
+
+def library_version() -> str:
+    """
+    Returns the installed version of the drawing library.
+
+    Returns:
+        str: The package version, or "0+unknown" when running from a source tree.
+    """
+    try:
+        return metadata.version("drawing")
+    except metadata.PackageNotFoundError:
+        return "0+unknown"
+
+
+@cache
+def geometry_version() -> str:
+    """
+    Returns the version of the code generating the cached geometry.
+
+    Computed once per process from the library, gdsfactory, kfactory and KLayout
+    versions and a hash of every source file of the drawing package, so that
+    editing a builder in a source tree invalidates the cache as well.
+
+    Returns:
+        str: Hex digest identifying the geometry code.
+    """
+    digest = hashlib.sha256(f"drawing=={library_version()}\n".encode("utf-8"))
+    for name in ("gdsfactory", "kfactory", "klayout"):
+        digest.update(f"{name}=={metadata.version(name)}\n".encode("utf-8"))
+    package_dir = Path(__file__).resolve().parent.parent
+    for path in sorted(package_dir.rglob("*.py")):
+        digest.update(path.relative_to(package_dir).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """
+    On-disk cache of built components keyed by configuration content.
+
+    Attributes:
+        directory (Path): Directory holding the cached GDS files and port sidecars.
+        max_bytes (int): Size limit of the cache directory, enforced by LRU eviction.
+    """
+
+    def __init__(self, directory: str | Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._loaded: dict[str, gf.Component] = {}
+
+    def key(self, config: "BaseConfig") -> str:
+        """
+        Computes the cache key of a configuration.
+
+        The key hashes the structural hash of the configuration (its class and every
+        field, including those of sub-config subclasses), the global build settings
+        and the geometry version, so neither a library or dependency upgrade nor a
+        change of the sources serves geometry built by older code.
+
+        Args:
+            config (BaseConfig): The configuration to key.
+
+        Returns:
+            str: Hex digest identifying the configuration.
+        """
+        payload = "\n".join((
+            config.structural_hash(),
+            repr(build_settings()),
+            geometry_version(),
+        ))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> gf.Component | None:
+        """
+        Loads a cached component.
+
+        Args:
+            key (str): Cache key as returned by `key`.
+
+        Returns:
+            gf.Component | None: The cached component, or None on a cache miss.
+        """
+        component = self._loaded.get(key)
+        # Components destroyed since they were loaded, e.g. by gf.clear_cache(), are read again
+        if component is not None and not component.destroyed():
+            return component
+        self._loaded.pop(key, None)
+
+        gds_path, ports_path = self._paths(key)
+        if not gds_path.exists() or not ports_path.exists():
+            return None
+
+        component = gf.import_gds(gds_path)
+        # Entries written before the cell names were suffixed
+        _suffix_cell_names(component.kcl.layout, component.kdb_cell, key)
+        for port in json.loads(ports_path.read_text(encoding="utf-8")):
+            component.add_port(
+                name=port["name"],
+                center=tuple(port["center"]),
+                width=port["width"],
+                orientation=port["orientation"],
+                layer=tuple(port["layer"]),
+                port_type=port["port_type"],
+            )
+
+        # Refresh the modification time, which is the recency used for eviction
+        os.utime(gds_path)
+        self._loaded[key] = component
+        return component
+
+    def put(self, key: str, component: gf.Component) -> None:
+        """
+        Stores a built component and evicts old entries if the cache is over its size limit.
+
+        Args:
+            key (str): Cache key as returned by `key`.
+            component (gf.Component): The built component.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        gds_path, ports_path = self._paths(key)
+
+        ports = []
+        for port in component.ports:
+            layer_info = gf.kcl.get_info(gf.get_layer(port.layer))
+            ports.append({
+                "name": port.name,
+                "center": [float(v) for v in port.dcenter],
+                "width": float(port.width),
+                "orientation": float(port.orientation),
+                "layer": [layer_info.layer, layer_info.datatype],
+                "port_type": port.port_type,
+            })
+
+        # Write to temporary names first so a crash never leaves a half written entry
+        tmp_gds_path = gds_path.with_name(f"{gds_path.stem}.{os.getpid()}.tmp{_GDS_SUFFIX}")
+        tmp_ports_path = ports_path.with_name(f"{ports_path.name}.{os.getpid()}.tmp")
+        _suffixed_layout(component, key).write(str(tmp_gds_path))
+        tmp_ports_path.write_text(json.dumps(ports), encoding="utf-8")
+        os.replace(tmp_ports_path, ports_path)
+        os.replace(tmp_gds_path, gds_path)
+
+        self._loaded[key] = component
+        self.evict()
+
+    def get_or_build(self, config: "BaseConfig") -> gf.Component:
+        """
+        Returns the cached component of a configuration, building and storing it on a miss.
+
+        Args:
+            config (BaseConfig): The configuration to build.
+
+        Returns:
+            gf.Component: The built or loaded component.
+        """
+        key = self.key(config)
+        component = self.get(key)
+        if component is None:
+            component = config.build()
+            self.put(key, component)
+        return component
+
+    def size(self) -> int:
+        """
+        Returns:
+            int: Total size in bytes of the cached entries.
+        """
+        return sum(path.stat().st_size for path in self._entry_files())
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits in `max_bytes`.
+        """
+        if not self.directory.exists():
+            return
+
+        entries = []
+        total = 0
+        for gds_path in self.directory.glob(f"*{_GDS_SUFFIX}"):
+            if ".tmp" in gds_path.name:
+                continue
+            ports_path = gds_path.with_name(gds_path.stem + _PORTS_SUFFIX)
+            stat = gds_path.stat()
+            size = stat.st_size + (ports_path.stat().st_size if ports_path.exists() else 0)
+            entries.append((stat.st_mtime, gds_path, ports_path, size))
+            total += size
+
+        entries.sort(key=lambda entry: entry[0])
+        for _, gds_path, ports_path, size in entries:
+            if total <= self.max_bytes:
+                break
+            gds_path.unlink(missing_ok=True)
+            ports_path.unlink(missing_ok=True)
+            self._loaded.pop(gds_path.stem, None)
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        for path in self._entry_files():
+            path.unlink(missing_ok=True)
+        self._loaded.clear()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}{_GDS_SUFFIX}", self.directory / f"{key}{_PORTS_SUFFIX}"
+
+    def _entry_files(self) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        return [*self.directory.glob(f"*{_GDS_SUFFIX}"), *self.directory.glob(f"*{_PORTS_SUFFIX}")]
+
+
+def _suffixed_layout(component: gf.Component, key: str) -> kdb.Layout:
+    # Copy of the cell hierarchy, so that the cells of the component keep their names
+    layout = kdb.Layout()
+    layout.dbu = component.kcl.layout.dbu
+    top = layout.create_cell(component.name)
+    top.copy_tree(component.kdb_cell)
+    _suffix_cell_names(layout, top, key)
+    return layout
+
+
+def _suffix_cell_names(layout: kdb.Layout, top: kdb.Cell, key: str) -> None:
+    suffix = f"_{key[:_CELL_SUFFIX_LENGTH]}"
+    for cell_index in [top.cell_index(), *top.called_cells()]:
+        cell = layout.cell(cell_index)
+        if cell.name.endswith(suffix):
+            continue
+        name = cell.name
+        # Kept within the cell name length, longer names are cut when writing layouts
+        if len(name) + len(suffix) > gf.CONF.max_cellname_length:
+            digest = hashlib.sha256(name.encode("utf-8")).hexdigest()[:_CELL_SUFFIX_LENGTH]
+            name = f"{name[:gf.CONF.max_cellname_length - len(suffix) - len(digest) - 1]}_{digest}"
+        cell.name = f"{name}{suffix}"
+
+
+_default_build_cache: BuildCache | None = None
+
+
+def default_build_cache() -> BuildCache:
+    """
+    Returns the process wide build cache located at DEFAULT_CACHE_DIR.
+
+    Returns:
+        BuildCache: The shared cache instance.
+    """
+    global _default_build_cache
+    if _default_build_cache is None:
+        _default_build_cache = BuildCache()
+    return _default_build_cache
@@ -0,0 +1,241 @@
+"""
+Dependency graph of configuration builds.
+
+Every BaseConfig.build call is recorded in a build graph, keyed on the build
+method, the structural hash of the configuration and the global build settings.
+A node holds the built cell and the configurations built while building it,
+i.e. the sub-configurations feeding the cell. Building a configuration whose
+node exists returns the recorded cell right away, without running the build or
+hashing any component. After a change deep inside a wafer, e.g. of a junction
+gap, only the cells of the changed configurations and of their ancestors are
+rebuilt; the unchanged siblings (pads, antennas, meanders, other dies) are the
+recorded cells and are placed by reference.
+
+Only immutable configurations are recorded, a mutable one could change after its
+build. Cells destroyed since they were recorded, e.g. by gf.clear_cache(), are
+rebuilt, and the least recently used builds are forgotten beyond `max_nodes`.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import TYPE_CHECKING, Callable
+
+import gdsfactory as gf
+
+from .utilities import build_settings
+
+if TYPE_CHECKING:
+    from ..base_config import BaseConfig
+
+NodeKey = tuple[str, str, tuple]
+
+# Number of builds kept by the default build graph
+DEFAULT_MAX_NODES = 4096
+
+
+@dataclass
+class BuildNode:
+    """
+    One recorded build.
+
+    Attributes:
+        config (BaseConfig): The built configuration.
+        component (gf.Component): The built cell.
+        children (list[NodeKey]): Keys of the builds called while building the cell, in call order.
+        parents (set[NodeKey]): Keys of the builds that called this build.
+    """
+    config: "BaseConfig"
+    component: gf.Component
+    children: list[NodeKey] = field(default_factory=list)
+    parents: set[NodeKey] = field(default_factory=set)
+
+
+class BuildGraph:
+    """
+    Records which configurations feed which cells and reuses the recorded cells.
+
+    Args:
+        max_nodes (int | None): Number of builds kept, the least recently used are
+            forgotten first. None keeps every build.
+    """
+
+    def __init__(self, max_nodes: int | None = DEFAULT_MAX_NODES):
+        if max_nodes is not None and max_nodes < 1:
+            raise ValueError("Build graph size must be positive.")
+        self.max_nodes = max_nodes
+        self._nodes: OrderedDict[NodeKey, BuildNode] = OrderedDict()
+        # Child keys collected by the builds in progress, innermost last
+        self._stack: list[list[NodeKey]] = []
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def build(self, config: "BaseConfig", build: Callable[["BaseConfig"], gf.Component], name: str) -> gf.Component:
+        """
+        Returns the recorded cell of a configuration, building and recording it if needed.
+
+        Mutable configurations are built without being recorded.
+
+        Args:
+            config (BaseConfig): The configuration to build.
+            build (Callable): The undecorated build method.
+            name (str): Name of the build method, e.g. "TransmonConfig.build".
+
+        Returns:
+            gf.Component: The cell of the configuration.
+        """
+        if not config.is_immutable():
+            return build(config)
+        key = (name, config.structural_hash(), build_settings())
+        if self._stack:
+            self._stack[-1].append(key)
+        node = self._nodes.get(key)
+        parents = set()
+        if node is not None:
+            if not node.component.destroyed():
+                self._nodes.move_to_end(key)
+                return node.component
+            parents = node.parents
+            self._forget(key)
+
+        self._stack.append([])
+        try:
+            component = build(config)
+        finally:
+            children = list(dict.fromkeys(self._stack.pop()))
+        node = BuildNode(config=config, component=component, children=children, parents=parents)
+        for child in children:
+            child_node = self._nodes.get(child)
+            if child_node is not None:
+                child_node.parents.add(key)
+        self._nodes[key] = node
+        while self.max_nodes is not None and len(self._nodes) > self.max_nodes:
+            self._forget(next(iter(self._nodes)))
+        return component
+
+    def node(self, config: "BaseConfig") -> BuildNode | None:
+        """
+        Returns the recorded build of a configuration with the current build settings.
+
+        Args:
+            config (BaseConfig): The configuration.
+
+        Returns:
+            BuildNode | None: The recorded build, None if the configuration was not built.
+        """
+        return self._nodes.get(self._key(config))
+
+    def dependencies(self, config: "BaseConfig", recursive: bool = False) -> list["BaseConfig"]:
+        """
+        Returns the configurations feeding the cell of a configuration.
+
+        Args:
+            config (BaseConfig): The configuration.
+            recursive (bool): Whether to include the dependencies of the dependencies.
+
+        Returns:
+            list[BaseConfig]: The configurations built while building the cell, nearest first.
+        """
+        return [self._nodes[key].config for key in self._walk(self._key(config), "children", recursive)]
+
+    def dependents(self, config: "BaseConfig", recursive: bool = False) -> list["BaseConfig"]:
+        """
+        Returns the configurations whose cells use the cell of a configuration.
+
+        These are the cells rebuilt when the configuration changes.
+
+        Args:
+            config (BaseConfig): The configuration.
+            recursive (bool): Whether to include the dependents of the dependents, up to the roots.
+
+        Returns:
+            list[BaseConfig]: The dependent configurations, nearest first.
+        """
+        return [self._nodes[key].config for key in self._walk(self._key(config), "parents", recursive)]
+
+    def prune(self, *roots: "BaseConfig") -> int:
+        """
+        Forgets every recorded build not used by the builds of the given configurations.
+
+        Useful when iterating on a design, so that the graph does not keep the cells
+        of every previous iteration alive.
+
+        Args:
+            *roots (BaseConfig): The configurations whose builds are kept.
+
+        Returns:
+            int: Number of forgotten builds.
+        """
+        kept = set()
+        for root in roots:
+            key = self._key(root)
+            if key in self._nodes:
+                kept.add(key)
+                kept.update(self._walk(key, "children", recursive=True))
+        forgotten = [key for key in self._nodes if key not in kept]
+        for key in forgotten:
+            del self._nodes[key]
+        for node in self._nodes.values():
+            node.parents.intersection_update(kept)
+        return len(forgotten)
+
+    def clear(self) -> None:
+        """
+        Forgets every recorded build.
+        """
+        self._nodes.clear()
+
+    def _forget(self, key: NodeKey) -> None:
+        node = self._nodes.pop(key)
+        for child in node.children:
+            child_node = self._nodes.get(child)
+            if child_node is not None:
+                child_node.parents.discard(key)
+
+    def _key(self, config: "BaseConfig") -> NodeKey:
+        return (getattr(type(config).build, "build_name", ""), config.structural_hash(), build_settings())
+
+    def _walk(self, key: NodeKey, direction: str, recursive: bool) -> list[NodeKey]:
+        node = self._nodes.get(key)
+        if node is None:
+            return []
+        found = dict.fromkeys(other for other in getattr(node, direction) if other in self._nodes)
+        if recursive:
+            pending = list(found)
+            while pending:
+                for other in getattr(self._nodes[pending.pop(0)], direction):
+                    if other in self._nodes and other not in found and other != key:
+                        found[other] = None
+                        pending.append(other)
+        return list(found)
+
+
+_default_build_graph = BuildGraph()
+
+
+def default_build_graph() -> BuildGraph:
+    """
+    Returns:
+        BuildGraph: The build graph recording every BaseConfig.build call.
+    """
+    return _default_build_graph
+
+
+def tracked(build: Callable, name: str) -> Callable:
+    """
+    Records a build method in the default build graph.
+
+    Args:
+        build (Callable): The build method.
+        name (str): Name of the build method, e.g. "TransmonConfig.build".
+
+    Returns:
+        The recording build method.
+    """
+    @wraps(build)
+    def foo(config):
+        return _default_build_graph.build(config, build, name)
+
+    foo.build_name = name
+    return foo
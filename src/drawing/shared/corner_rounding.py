@@ -0,0 +1,110 @@
+"""
+Batched corner rounding of polygons.
+
+All polygons of a layer are concatenated into a single vertex array and every
+corner is replaced by a circular fillet in one NumPy pass. The number of arc
+vertices of each fillet is derived from a maximum chord error (sagitta), so
+small fillets get few vertices and large ones get as many as they need.
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+_COLLINEAR_ANGLE = 1e-9
+
+
+def arc_segments(radius: NDArray | float, angle: NDArray | float, tolerance: float, max_points: int) -> NDArray:
+    """
+    Computes the number of chords needed to approximate circular arcs.
+
+    Args:
+        radius (NDArray | float): Arc radii.
+        angle (NDArray | float): Arc angles in radians.
+        tolerance (float): Maximum distance between a chord and its arc, in the radius units.
+        max_points (int): Upper bound on points per full circle.
+
+    Returns:
+        NDArray: Number of chords of each arc, at least 1 for non-empty arcs and 0 otherwise.
+    """
+    radius = np.asarray(radius, dtype=float)
+    angle = np.abs(np.asarray(angle, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Sagitta of a chord spanning `step` radians: r * (1 - cos(step / 2))
+        step = 2 * np.arccos(np.clip(1 - tolerance / radius, -1.0, 1.0))
+        segments = np.ceil(angle / step)
+    segments = np.minimum(segments, np.ceil(max_points * angle / (2 * np.pi)))
+    segments = np.where((radius > 0) & (angle > _COLLINEAR_ANGLE), np.maximum(segments, 1), 0)
+    return segments.astype(np.int64)
+
+
+def round_corners_batch(
+    polygons: list[NDArray],
+    radius: float,
+    tolerance: float,
+    max_points: int,
+) -> list[NDArray]:
+    """
+    Rounds every corner of a batch of polygons with the given radius.
+
+    The fillet radius of a corner is reduced when the adjacent edges are too
+    short to fit it, as in klayout's round_corners.
+
+    Args:
+        polygons (list[NDArray]): Polygon hulls as (N, 2) arrays of points.
+        radius (float): Rounding radius.
+        tolerance (float): Maximum chord error of the fillet arcs, in the same units as the points.
+        max_points (int): Upper bound on arc points per full circle.
+
+    Returns:
+        list[NDArray]: The rounded polygons, in the input order.
+    """
+    if len(polygons) == 0:
+        return []
+
+    counts = np.array([len(p) for p in polygons], dtype=np.int64)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    points = np.concatenate([np.asarray(p, dtype=float) for p in polygons])
+
+    # Neighbour indices within each polygon
+    polygon_of = np.repeat(np.arange(len(polygons)), counts)
+    local = np.arange(len(points)) - starts[polygon_of]
+    prev_idx = starts[polygon_of] + (local - 1) % counts[polygon_of]
+    next_idx = starts[polygon_of] + (local + 1) % counts[polygon_of]
+
+    d_in = points - points[prev_idx]
+    d_out = points[next_idx] - points
+    len_in = np.maximum(np.hypot(d_in[:, 0], d_in[:, 1]), np.finfo(float).tiny)
+    len_out = np.maximum(np.hypot(d_out[:, 0], d_out[:, 1]), np.finfo(float).tiny)
+    u_in = d_in / len_in[:, None]
+    u_out = d_out / len_out[:, None]
+
+    # Signed turning angle at each vertex, positive for left turns
+    cross = u_in[:, 0] * u_out[:, 1] - u_in[:, 1] * u_out[:, 0]
+    dot = np.einsum("ij,ij->i", u_in, u_out)
+    turn = np.arctan2(cross, dot)
+    tan_half = np.tan(np.abs(turn) / 2)
+
+    # Tangent length, limited to half of the shorter adjacent edge
+    tangent = np.minimum(radius * tan_half, np.minimum(len_in, len_out) / 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fillet_radius = np.where(tan_half > _COLLINEAR_ANGLE, tangent / tan_half, 0.0)
+
+    segments = arc_segments(fillet_radius, turn, tolerance, max_points)
+
+    # Fillet centers and start angles
+    tangent_in = points - u_in * tangent[:, None]
+    normal = np.stack((-u_in[:, 1], u_in[:, 0]), axis=1) * np.sign(cross)[:, None]
+    centers = tangent_in + normal * fillet_radius[:, None]
+    start_angle = np.arctan2(tangent_in[:, 1] - centers[:, 1], tangent_in[:, 0] - centers[:, 0])
+
+    # Expand every corner into segments + 1 arc points (a single point for sharp-free corners)
+    per_corner = segments + 1
+    corner_of = np.repeat(np.arange(len(points)), per_corner)
+    step = np.arange(len(corner_of)) - np.repeat(np.cumsum(per_corner) - per_corner, per_corner)
+    fraction = step / np.maximum(segments, 1)[corner_of]
+    angle = start_angle[corner_of] + turn[corner_of] * fraction
+    arc = centers[corner_of] + fillet_radius[corner_of, None] * np.stack((np.cos(angle), np.sin(angle)), axis=1)
+    rounded = np.where((segments[corner_of] > 0)[:, None], arc, points[corner_of])
+
+    polygon_sizes = np.add.reduceat(per_corner, starts)
+    return np.split(rounded, np.cumsum(polygon_sizes)[:-1])
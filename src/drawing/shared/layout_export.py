@@ -0,0 +1,135 @@
+"""
+Writing of components to GDS and OASIS files.
+
+OASIS files store repeated placements and shapes as repetitions and compress
+their tables in CBLOCKs, so wafer layouts full of repeated dies, alignment marks
+and test junctions are much smaller than their GDS and faster to load in mask
+preparation tools. The format of a file is chosen from its extension.
+"""
+
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import gdsfactory as gf
+from gdsfactory.component import save_layout_options
+from kfactory import kdb
+
+LAYOUT_FORMATS = {".gds": "GDS2", ".oas": "OASIS"}
+
+# Highest repetition detection effort of the KLayout OASIS writer
+DEFAULT_OASIS_COMPRESSION_LEVEL = 10
+
+
+class LayoutFileReport(NamedTuple):
+    """
+    Outcome of writing a layout file.
+
+    Attributes:
+        path (Path): The written file.
+        format (str): "GDS2" or "OASIS".
+        size (int): Size of the file in bytes.
+        write_time (float): Wall time of the write in seconds.
+    """
+    path: Path
+    format: str
+    size: int
+    write_time: float
+
+
+def layout_save_options(
+    layout_format: str,
+    with_metadata: bool = False,
+    compression_level: int = DEFAULT_OASIS_COMPRESSION_LEVEL,
+) -> kdb.SaveLayoutOptions:
+    """
+    Returns the save options of a layout format.
+
+    Args:
+        layout_format (str): "GDS2" or "OASIS".
+        with_metadata (bool): Whether to write the gdsfactory metadata (ports, settings).
+        compression_level (int): OASIS repetition detection effort from 0 (none) to 10.
+
+    Returns:
+        kdb.SaveLayoutOptions: The save options.
+    """
+    options = save_layout_options()
+    options.format = layout_format
+    options.write_context_info = with_metadata
+    if layout_format == "OASIS":
+        options.oasis_compression_level = compression_level
+        options.oasis_write_cblocks = True
+        options.oasis_strict_mode = True
+    return options
+
+
+def write_layout(
+    component: gf.Component,
+    path: str | Path,
+    with_metadata: bool = False,
+    compression_level: int = DEFAULT_OASIS_COMPRESSION_LEVEL,
+) -> LayoutFileReport:
+    """
+    Writes a component to a GDS or OASIS file, chosen from the file extension.
+
+    Args:
+        component (gf.Component): The component to write.
+        path (str | Path): Path of a .gds or .oas file.
+        with_metadata (bool): Whether to write the gdsfactory metadata (ports, settings).
+        compression_level (int): OASIS repetition detection effort from 0 (none) to 10.
+
+    Returns:
+        LayoutFileReport: The written file with its size and write time.
+
+    Raises:
+        ValueError: If the file extension is not .gds or .oas.
+    """
+    path = Path(path)
+    layout_format = LAYOUT_FORMATS.get(path.suffix.lower())
+    if layout_format is None:
+        raise ValueError(f"Unsupported layout file extension {path.suffix!r}, expected one of {list(LAYOUT_FORMATS)}.")
+    options = layout_save_options(layout_format, with_metadata=with_metadata, compression_level=compression_level)
+    start = time.perf_counter()
+    component.write_gds(path, save_options=options, with_metadata=with_metadata)
+    write_time = time.perf_counter() - start
+    return LayoutFileReport(path=path, format=layout_format, size=path.stat().st_size, write_time=write_time)
+
+
+def compare_layout_formats(
+    component: gf.Component,
+    directory: str | Path,
+    name: str | None = None,
+    compression_level: int = DEFAULT_OASIS_COMPRESSION_LEVEL,
+) -> list[dict]:
+    """
+    Writes a component as GDS and as OASIS and compares the two files.
+
+    Args:
+        component (gf.Component): The component to write.
+        directory (str | Path): Directory the files are written to.
+        name (str | None): Stem of the file names. Defaults to the component name.
+        compression_level (int): OASIS repetition detection effort from 0 (none) to 10.
+
+    Returns:
+        list[dict]: One row per format with the path, the size in bytes, the write time
+            in seconds and both relative to the GDS file.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    name = name or component.name
+    reports = [
+        write_layout(component, directory / f"{name}{suffix}", compression_level=compression_level)
+        for suffix in LAYOUT_FORMATS
+    ]
+    gds = reports[0]
+    return [
+        {
+            "format": report.format,
+            "path": str(report.path),
+            "size": report.size,
+            "write time": report.write_time,
+            "size vs GDS": report.size / gds.size if gds.size else None,
+            "write time vs GDS": report.write_time / gds.write_time if gds.write_time else None,
+        }
+        for report in reports
+    ]
@@ -0,0 +1,393 @@
+"""
+Columnar storage of the polygons of built cells.
+
+A polygon store keeps the polygons of every distinct cell of a hierarchy once,
+in a few flat arrays instead of one object per polygon:
+
+- points: (N, 2) int32 vertices of all polygons in database units, in the
+  coordinates of their cell,
+- offsets: (P + 1,) int64 index of the first vertex of every polygon, the last
+  entry being N,
+- layer_ids: (P,) int32 index of the layer of every polygon in `layers`,
+- cell_ids: (P,) int32 index of the cell of every polygon in `cell_names`,
+
+together with the flattened cell instances, one per placement of a cell in the
+top cell, arrays expanded:
+
+- instance_cells: (I,) int32 index of the placed cell,
+- instance_transforms: (I, 6) float64 matrix (m00, m01, m10, m11) and
+  displacement (dx, dy) mapping cell to top coordinates in database units.
+
+Polygons are sorted by cell and layer, so the polygons of a cell on a layer are
+one contiguous slice of the arrays and are read without copying. Areas, vertex
+counts and bounding boxes are computed per distinct cell and weighted by the
+instances, without flattening. A store is saved as one .npy file per array and
+loaded memory mapped, so reading the geometry of a wafer neither parses a layout
+nor loads the arrays into memory up front.
+
+Polygons with holes are stored as simple polygons whose holes are connected to
+the hull by cut lines, like gdsfactory's get_polygons_points.
+"""
+
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+import gdsfactory as gf
+import numpy as np
+from gdsfactory.typings import LayerSpec
+from kfactory import kdb
+from numpy.typing import NDArray
+
+_ARRAYS = ("points", "offsets", "layer_ids", "cell_ids", "instance_cells", "instance_transforms")
+_META_FILE = "polygon_store.json"
+
+
+class FlatPolygons(NamedTuple):
+    """
+    Polygons flattened into the coordinates of the top cell.
+
+    Attributes:
+        points (NDArray): (N, 2) int32 vertices in database units.
+        offsets (NDArray): (P + 1,) int64 index of the first vertex of every polygon.
+        instance_ids (NDArray): (P,) int32 index of the cell instance every polygon comes from.
+    """
+    points: NDArray
+    offsets: NDArray
+    instance_ids: NDArray
+
+
+class PolygonStore:
+    """
+    Polygons of a cell hierarchy in contiguous arrays.
+
+    Attributes:
+        points (NDArray): (N, 2) int32 vertices in database units, in cell coordinates.
+        offsets (NDArray): (P + 1,) int64 index of the first vertex of every polygon.
+        layer_ids (NDArray): (P,) int32 index of the layer of every polygon in `layers`.
+        cell_ids (NDArray): (P,) int32 index of the cell of every polygon in `cell_names`.
+        instance_cells (NDArray): (I,) int32 index of the cell of every instance in `cell_names`.
+        instance_transforms (NDArray): (I, 6) float64 matrix and displacement of every instance.
+        layers (list[tuple[int, int]]): (layer, datatype) of every layer.
+        cell_names (list[str]): Name of every cell, the top cell first.
+        dbu (float): Database unit in micrometers.
+    """
+
+    def __init__(
+        self,
+        points: NDArray,
+        offsets: NDArray,
+        layer_ids: NDArray,
+        cell_ids: NDArray,
+        instance_cells: NDArray,
+        instance_transforms: NDArray,
+        layers: list[tuple[int, int]],
+        cell_names: list[str],
+        dbu: float,
+    ):
+        self.points = points
+        self.offsets = offsets
+        self.layer_ids = layer_ids
+        self.cell_ids = cell_ids
+        self.instance_cells = instance_cells
+        self.instance_transforms = instance_transforms
+        self.layers = layers
+        self.cell_names = cell_names
+        self.dbu = dbu
+
+    def __len__(self) -> int:
+        return len(self.layer_ids)
+
+    @classmethod
+    def from_component(cls, component: gf.Component, merge: bool = False) -> "PolygonStore":
+        """
+        Extracts the polygons of a component.
+
+        Args:
+            component (gf.Component): The component.
+            merge (bool): Whether to flatten the component and merge the polygons of every
+                layer, giving a store with a single cell. Otherwise every distinct cell is
+                stored once, with its own polygons.
+
+        Returns:
+            PolygonStore: The polygons of the component.
+        """
+        layout = component.kcl.layout
+        top = component.kdb_cell
+        layer_indexes = [index for index in layout.layer_indexes() if not top.bbox(index).empty()]
+        layers = [(layout.get_info(index).layer, layout.get_info(index).datatype) for index in layer_indexes]
+
+        if merge:
+            cells = [top]
+            transforms = {top.cell_index(): (np.eye(2)[None], np.zeros((1, 2)))}
+        else:
+            cells, transforms = _flatten_instances(layout, top)
+
+        points, counts, layer_ids, cell_ids = [], [], [], []
+        for cell_id, cell in enumerate(cells):
+            for layer_id, layer_index in enumerate(layer_indexes):
+                if merge:
+                    region = kdb.Region(cell.begin_shapes_rec(layer_index)).merged()
+                else:
+                    region = kdb.Region(cell.shapes(layer_index))
+                for polygon in region.each():
+                    vertices = [(point.x, point.y) for point in polygon.to_simple_polygon().each_point()]
+                    points.extend(vertices)
+                    counts.append(len(vertices))
+                    layer_ids.append(layer_id)
+                    cell_ids.append(cell_id)
+
+        instance_cells = np.concatenate(
+            [np.full(len(transforms[cell.cell_index()][0]), cell_id, dtype=np.int32) for cell_id, cell in enumerate(cells)]
+        )
+        instance_transforms = np.concatenate([
+            np.column_stack((matrices.reshape(-1, 4), displacements))
+            for matrices, displacements in (transforms[cell.cell_index()] for cell in cells)
+        ])
+        return cls(
+            points=np.array(points, dtype=np.int32).reshape(-1, 2),
+            offsets=np.concatenate(([0], np.cumsum(counts, dtype=np.int64))).astype(np.int64),
+            layer_ids=np.array(layer_ids, dtype=np.int32),
+            cell_ids=np.array(cell_ids, dtype=np.int32),
+            instance_cells=instance_cells,
+            instance_transforms=instance_transforms.astype(np.float64),
+            layers=layers,
+            cell_names=[cell.name for cell in cells],
+            dbu=layout.dbu,
+        )
+
+    def save(self, directory: str | Path) -> Path:
+        """
+        Saves the store as one .npy file per array and a JSON file with the tables.
+
+        Args:
+            directory (str | Path): Directory of the store, created if needed.
+
+        Returns:
+            Path: The directory.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in _ARRAYS:
+            array = getattr(self, name)
+            # Written through a memory map, so a loaded store is never copied into memory
+            target = np.lib.format.open_memmap(directory / f"{name}.npy", mode="w+", dtype=array.dtype, shape=array.shape)
+            target[...] = array
+            target.flush()
+            del target
+        meta = {"layers": self.layers, "cell_names": self.cell_names, "dbu": self.dbu}
+        (directory / _META_FILE).write_text(json.dumps(meta, indent=2))
+        return directory
+
+    @classmethod
+    def load(cls, directory: str | Path, mmap: bool = True) -> "PolygonStore":
+        """
+        Loads a store saved by `save`.
+
+        Args:
+            directory (str | Path): Directory of the store.
+            mmap (bool): Whether to memory map the arrays read-only instead of reading them.
+
+        Returns:
+            PolygonStore: The loaded store.
+        """
+        directory = Path(directory)
+        meta = json.loads((directory / _META_FILE).read_text())
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None) for name in _ARRAYS}
+        return cls(
+            **arrays,
+            layers=[tuple(layer) for layer in meta["layers"]],
+            cell_names=meta["cell_names"],
+            dbu=meta["dbu"],
+        )
+
+    def layer_id(self, layer: LayerSpec) -> int | None:
+        """
+        Args:
+            layer (LayerSpec): A (layer, datatype) tuple, or any layer specification of the active PDK.
+
+        Returns:
+            int | None: Index of the layer in `layers`, None if the store has no polygon on it.
+        """
+        if not (isinstance(layer, tuple) and len(layer) == 2):
+            info = gf.kcl.layout.get_info(gf.get_layer(layer))
+            layer = (info.layer, info.datatype)
+        try:
+            return self.layers.index(tuple(layer))
+        except ValueError:
+            return None
+
+    def polygons(self, layer: LayerSpec, cell: int = 0) -> tuple[NDArray, NDArray]:
+        """
+        Returns the own polygons of one cell on one layer, in the coordinates of the cell.
+
+        The points are a view of the stored array, they are neither copied nor, for a
+        memory mapped store, read before they are used.
+
+        Args:
+            layer (LayerSpec): The layer.
+            cell (int): Index of the cell in `cell_names`. Defaults to the top cell.
+
+        Returns:
+            tuple[NDArray, NDArray]: (N, 2) int32 vertices in database units and (P + 1,)
+                offsets of the polygons into them.
+        """
+        layer_id = self.layer_id(layer)
+        if layer_id is None:
+            return np.empty((0, 2), dtype=np.int32), np.zeros(1, dtype=np.int64)
+        start, stop = self._polygon_range(cell, layer_id)
+        first, last = self.offsets[start], self.offsets[stop]
+        return self.points[first:last], np.asarray(self.offsets[start:stop + 1]) - first
+
+    def flatten(self, layer: LayerSpec) -> FlatPolygons:
+        """
+        Returns the polygons of every instance on one layer, in the coordinates of the top cell.
+
+        Args:
+            layer (LayerSpec): The layer.
+
+        Returns:
+            FlatPolygons: The flattened vertices in database units, the polygon offsets and
+                the instance of every polygon.
+        """
+        points, counts, instance_ids = [], [], []
+        for cell in range(len(self.cell_names)):
+            cell_points, cell_offsets = self.polygons(layer, cell)
+            if len(cell_offsets) < 2:
+                continue
+            instances = np.flatnonzero(np.asarray(self.instance_cells) == cell)
+            matrices, displacements = self._transforms(instances)
+            # (instances, vertices, 2), every instance transforming every vertex at once
+            transformed = np.einsum("kij,nj->kni", matrices, cell_points) + displacements[:, None]
+            points.append(np.rint(transformed).reshape(-1, 2))
+            counts.append(np.tile(np.diff(cell_offsets), len(instances)))
+            instance_ids.append(np.repeat(instances, len(cell_offsets) - 1))
+        if not points:
+            return FlatPolygons(np.empty((0, 2), dtype=np.int32), np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int32))
+        return FlatPolygons(
+            points=np.concatenate(points).astype(np.int32),
+            offsets=np.concatenate(([0], np.cumsum(np.concatenate(counts), dtype=np.int64))),
+            instance_ids=np.concatenate(instance_ids).astype(np.int32),
+        )
+
+    def layer_statistics(self) -> list[dict]:
+        """
+        Computes the polygon count, vertex count and area of every layer of the flattened layout.
+
+        Areas are summed polygon by polygon, overlapping polygons count more than once.
+
+        Returns:
+            list[dict]: One row per layer with the layer, the number of polygons and of
+                vertices, and the area in square micrometers.
+        """
+        offsets = np.asarray(self.offsets)
+        points = np.asarray(self.points, dtype=np.float64)
+        counts = np.diff(offsets)
+        areas = np.zeros(len(counts))
+        if len(points):
+            # Shoelace formula over all polygons at once, x_i * y_(i+1) - x_(i+1) * y_i per vertex
+            following = np.arange(1, len(points) + 1)
+            following[offsets[1:] - 1] = offsets[:-1]
+            cross = points[:, 0] * points[following, 1] - points[following, 0] * points[:, 1]
+            areas = np.abs(np.add.reduceat(cross, offsets[:-1])) / 2
+
+        # Instances per cell, weighted by the area scaling of their transformation
+        transforms = np.asarray(self.instance_transforms)
+        scales = np.abs(transforms[:, 0] * transforms[:, 3] - transforms[:, 1] * transforms[:, 2])
+        cells = len(self.cell_names)
+        instance_counts = np.bincount(self.instance_cells, minlength=cells)
+        instance_scales = np.bincount(self.instance_cells, weights=scales, minlength=cells)
+
+        layer_ids = np.asarray(self.layer_ids)
+        cell_ids = np.asarray(self.cell_ids)
+        rows = []
+        for layer_id, layer in enumerate(self.layers):
+            selected = layer_ids == layer_id
+            weights = instance_counts[cell_ids[selected]]
+            rows.append({
+                "layer": layer,
+                "polygons": int(weights.sum()),
+                "vertices": int((counts[selected] * weights).sum()),
+                "area": float((areas[selected] * instance_scales[cell_ids[selected]]).sum() * self.dbu ** 2),
+            })
+        return rows
+
+    def bbox(self, layer: LayerSpec | None = None) -> tuple[float, float, float, float] | None:
+        """
+        Returns the bounding box of the flattened layout, from the bounding boxes of the cells.
+
+        Args:
+            layer (LayerSpec | None): Layer to bound. None bounds every layer.
+
+        Returns:
+            tuple[float, float, float, float] | None: (xmin, ymin, xmax, ymax) in micrometers,
+                None if there is no polygon.
+        """
+        layer_id = None if layer is None else self.layer_id(layer)
+        if layer is not None and layer_id is None:
+            return None
+        corners = []
+        for cell in range(len(self.cell_names)):
+            start, stop = self._polygon_range(cell, layer_id)
+            if start == stop:
+                continue
+            cell_points = self.points[self.offsets[start]:self.offsets[stop]]
+            (xmin, ymin), (xmax, ymax) = cell_points.min(axis=0), cell_points.max(axis=0)
+            box = np.array([(xmin, ymin), (xmin, ymax), (xmax, ymin), (xmax, ymax)], dtype=np.float64)
+            matrices, displacements = self._transforms(np.flatnonzero(np.asarray(self.instance_cells) == cell))
+            corners.append((np.einsum("kij,nj->kni", matrices, box) + displacements[:, None]).reshape(-1, 2))
+        if not corners:
+            return None
+        corners = np.concatenate(corners)
+        (xmin, ymin), (xmax, ymax) = corners.min(axis=0), corners.max(axis=0)
+        return (float(xmin * self.dbu), float(ymin * self.dbu), float(xmax * self.dbu), float(ymax * self.dbu))
+
+    def _polygon_range(self, cell: int, layer_id: int | None) -> tuple[int, int]:
+        start, stop = np.searchsorted(self.cell_ids, [cell, cell + 1])
+        if layer_id is not None:
+            first, last = np.searchsorted(self.layer_ids[start:stop], [layer_id, layer_id + 1])
+            start, stop = start + first, start + last
+        return int(start), int(stop)
+
+    def _transforms(self, instances: NDArray) -> tuple[NDArray, NDArray]:
+        transforms = np.asarray(self.instance_transforms[instances])
+        return transforms[:, :4].reshape(-1, 2, 2), transforms[:, 4:]
+
+
+def _flatten_instances(layout: kdb.Layout, top: kdb.Cell) -> tuple[list[kdb.Cell], dict[int, tuple[NDArray, NDArray]]]:
+    # Parents come before their children top-down, so all placements of a cell are
+    # known when its instances are expanded.
+    pending: dict[int, list[tuple[NDArray, NDArray]]] = {top.cell_index(): [(np.eye(2)[None], np.zeros((1, 2)))]}
+    cells = []
+    transforms = {}
+    for cell_index in layout.each_cell_top_down():
+        if cell_index not in pending:
+            continue
+        cell = layout.cell(cell_index)
+        matrices = np.concatenate([matrix for matrix, _ in pending[cell_index]])
+        displacements = np.concatenate([displacement for _, displacement in pending[cell_index]])
+        cells.append(cell)
+        transforms[cell_index] = (matrices, displacements)
+        for instance in cell.each_inst():
+            local_matrix, local_displacements = _instance_transforms(instance)
+            child_matrices = np.einsum("kij,jl->kil", matrices, local_matrix)
+            child_displacements = np.einsum("kij,aj->kai", matrices, local_displacements) + displacements[:, None]
+            child = pending.setdefault(instance.cell_index, [])
+            child.append((np.repeat(child_matrices, len(local_displacements), axis=0), child_displacements.reshape(-1, 2)))
+    return cells, transforms
+
+
+def _instance_transforms(instance: kdb.Instance) -> tuple[NDArray, NDArray]:
+    trans = instance.cplx_trans
+    angle = np.radians(trans.angle)
+    rotation = trans.mag * np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    # KLayout mirrors at the x axis before rotating
+    matrix = rotation @ np.diag([1.0, -1.0]) if trans.is_mirror() else rotation
+    # Multiples of 90 degrees map the integer grid onto itself exactly
+    matrix = np.where(np.abs(matrix - np.round(matrix)) < 1e-12, np.round(matrix), matrix)
+    displacement = np.array([trans.disp.x, trans.disp.y], dtype=np.float64)
+    if not instance.is_regular_array():
+        return matrix, displacement[None]
+    a, b = instance.a, instance.b
+    steps = np.array([(i * a.x + j * b.x, i * a.y + j * b.y) for i in range(instance.na) for j in range(instance.nb)])
+    return matrix, displacement + steps
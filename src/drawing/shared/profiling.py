@@ -0,0 +1,258 @@
+"""
+Opt-in profiling of component builds.
+
+Inside `profile_build()`, every BaseConfig.build, every gf.cell builder of a
+configuration class and the shared helpers (smooth_corners,
+merge_referenced_shapes) record a span with their wall time, self time, whether
+the cell came from a cache and the number of polygons and vertices of the cells
+they produced. Outside of a profiling context the hooks only cost one global
+lookup per call.
+
+The recorded spans can be exported as a Chrome trace (chrome://tracing,
+Perfetto, speedscope), as folded stacks for flamegraph.pl, or summarized per
+cell in a table.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Iterator
+
+import gdsfactory as gf
+
+
+@dataclass
+class BuildSpan:
+    """
+    One profiled call.
+
+    Attributes:
+        name (str): Name of the profiled function, e.g. "TransmonConfig.build".
+        start (float): Start time in seconds, relative to the profiler start.
+        duration (float): Wall time in seconds.
+        child_time (float): Wall time spent in profiled callees in seconds.
+        cache_hit (bool | None): Whether the returned cell existed before the call, None if unknown.
+        polygons (int): Number of polygons of the produced cell, 0 for cache hits.
+        vertices (int): Number of vertices of the produced cell, 0 for cache hits.
+        stack (tuple[str, ...]): Names of the enclosing spans, outermost first, including this one.
+    """
+    name: str
+    start: float
+    stack: tuple[str, ...]
+    duration: float = 0.0
+    child_time: float = 0.0
+    cache_hit: bool | None = None
+    polygons: int = 0
+    vertices: int = 0
+
+    @property
+    def self_time(self) -> float:
+        return self.duration - self.child_time
+
+
+@dataclass
+class CellStats:
+    """
+    Aggregated statistics of all spans sharing a name.
+    """
+    name: str
+    calls: int = 0
+    total_time: float = 0.0
+    self_time: float = 0.0
+    hits: int = 0
+    misses: int = 0
+    polygons: int = 0
+    vertices: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class BuildProfiler:
+    """
+    Collects the spans of the profiled calls.
+
+    Attributes:
+        count_geometry (bool): Whether to count the polygons and vertices of produced cells.
+        spans (list[BuildSpan]): Finished spans, in completion order.
+    """
+    count_geometry: bool = True
+    spans: list[BuildSpan] = field(default_factory=list)
+    _stack: list[BuildSpan] = field(default_factory=list, repr=False)
+    _origin: float = field(default_factory=time.perf_counter, repr=False)
+
+    def call(self, name: str, func: Callable, *args, **kwargs):
+        """
+        Calls a function and records its span.
+
+        Args:
+            name (str): Name of the span.
+            func (Callable): The function, returning a component.
+
+        Returns:
+            The return value of the function.
+        """
+        parent_names = self._stack[-1].stack if self._stack else ()
+        span = BuildSpan(name=name, start=time.perf_counter() - self._origin, stack=(*parent_names, name))
+        cells_before = gf.kcl.layout.cells()
+
+        self._stack.append(span)
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            self._stack.pop()
+            span.duration = time.perf_counter() - self._origin - span.start
+            if self._stack:
+                self._stack[-1].child_time += span.duration
+            self.spans.append(span)
+
+        if isinstance(result, gf.Component):
+            span.cache_hit = result.cell_index() < cells_before
+            if not span.cache_hit and self.count_geometry:
+                span.polygons, span.vertices = _count_geometry(result)
+        return result
+
+    def summary(self) -> list[CellStats]:
+        """
+        Aggregates the spans per name.
+
+        Returns:
+            list[CellStats]: One entry per profiled name, by decreasing self time.
+        """
+        stats: dict[str, CellStats] = {}
+        for span in self.spans:
+            entry = stats.setdefault(span.name, CellStats(span.name))
+            entry.calls += 1
+            # Recursive calls of the same name are only counted once in the total
+            if span.name not in span.stack[:-1]:
+                entry.total_time += span.duration
+            entry.self_time += span.self_time
+            entry.hits += span.cache_hit is True
+            entry.misses += span.cache_hit is False
+            entry.polygons += span.polygons
+            entry.vertices += span.vertices
+        return sorted(stats.values(), key=lambda entry: entry.self_time, reverse=True)
+
+    def format_summary(self) -> str:
+        """
+        Returns:
+            str: The summary as a fixed width text table.
+        """
+        header = f"{'cell':<48} {'calls':>6} {'total ms':>10} {'self ms':>10} {'hit rate':>9} {'polygons':>9} {'vertices':>10}"
+        lines = [header, "-" * len(header)]
+        for entry in self.summary():
+            lines.append(
+                f"{entry.name:<48} {entry.calls:>6} {entry.total_time * 1000:>10.2f} {entry.self_time * 1000:>10.2f}"
+                f" {entry.hit_rate:>8.0%} {entry.polygons:>9} {entry.vertices:>10}"
+            )
+        return "\n".join(lines)
+
+    def to_chrome_trace(self, path: str | Path) -> None:
+        """
+        Writes the spans in the Chrome trace event format.
+
+        Args:
+            path (str | Path): Output JSON file.
+        """
+        events = [
+            {
+                "name": span.name,
+                "cat": "cache hit" if span.cache_hit else "build",
+                "ph": "X",
+                "ts": span.start * 1e6,
+                "dur": span.duration * 1e6,
+                "pid": 0,
+                "tid": 0,
+                "args": {
+                    "self_ms": span.self_time * 1000,
+                    "cache_hit": span.cache_hit,
+                    "polygons": span.polygons,
+                    "vertices": span.vertices,
+                },
+            }
+            for span in self.spans
+        ]
+        Path(path).write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+
+    def to_folded(self, path: str | Path) -> None:
+        """
+        Writes the self time of every stack in the folded format of flamegraph.pl.
+
+        Args:
+            path (str | Path): Output text file, one "a;b;c microseconds" line per stack.
+        """
+        folded: dict[str, float] = {}
+        for span in self.spans:
+            key = ";".join(span.stack)
+            folded[key] = folded.get(key, 0.0) + span.self_time
+        lines = [f"{stack} {round(seconds * 1e6)}" for stack, seconds in folded.items()]
+        Path(path).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+_active_profiler: BuildProfiler | None = None
+
+
+@contextmanager
+def profile_build(count_geometry: bool = True) -> Iterator[BuildProfiler]:
+    """
+    Context manager profiling the builds run inside it.
+
+    Args:
+        count_geometry (bool): Whether to count the polygons and vertices of produced cells.
+
+    Yields:
+        BuildProfiler: The profiler collecting the spans.
+    """
+    global _active_profiler
+    previous = _active_profiler
+    _active_profiler = BuildProfiler(count_geometry=count_geometry)
+    try:
+        yield _active_profiler
+    finally:
+        _active_profiler = previous
+
+
+def profiled(func: Callable | None = None, *, name: str | None = None) -> Callable:
+    """
+    Decorator recording the calls of a component builder while a profiler is active.
+
+    Args:
+        func (Callable): The builder.
+        name (str | None): Name of the spans. Defaults to the qualified name of the builder.
+
+    Returns:
+        The instrumented builder.
+    """
+    if func is None:
+        return lambda f: profiled(f, name=name)
+    if getattr(func, "is_profiled", False):
+        return func
+
+    span_name = name or func.__qualname__
+
+    @wraps(func)
+    def foo(*args, **kwargs):
+        if _active_profiler is None:
+            return func(*args, **kwargs)
+        return _active_profiler.call(span_name, func, *args, **kwargs)
+
+    foo.is_profiled = True
+    return foo
+
+
+def _count_geometry(component: gf.Component) -> tuple[int, int]:
+    polygons = 0
+    vertices = 0
+    for layer_index in component.kcl.layer_indexes():
+        for polygon in component.begin_shapes_rec(layer_index).each():
+            shape = polygon.shape()
+            if shape.is_polygon() or shape.is_box() or shape.is_path():
+                polygons += 1
+                vertices += shape.polygon.num_points()
+    return polygons, vertices
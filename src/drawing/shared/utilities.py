@@ -1,14 +1,22 @@
 """
 Shared utility functions for GDS component creation and manipulation.
 
-This module contains functions for merging shapes, smoothing corners, and
-a decorator to automatically merge referenced shapes in a component.
+This module contains functions for merging shapes, smoothing corners,
+a decorator to automatically merge referenced shapes in a component, a
+hierarchy preserving build mode, and a decorator caching component builders
+on their configuration.
 """
 
 import gdsfactory as gf
+import numpy as np
 from gdsfactory.typings import LayerSpec
-from typing import Tuple
+from typing import Iterator, Tuple
+from contextlib import contextmanager
 from functools import wraps
+from kfactory import kdb
+from .corner_rounding import round_corners_batch
+from .arc_tolerance import MAX_ARC_POINTS, arc_tolerance_state, get_arc_tolerance
+from .profiling import profiled
 
 # Type aliases
 Coordinate = Tuple[float, float]
@@ -19,11 +27,12 @@ DEFAULT_WAFER_LAYER = (60, 0)
 JUNCTION_FOCUS_LAYER = (33, 0)
 JUNCTION_PICTURE_LAYER = (50, 0)
 SAMPLE_AREA_INDICATOR_LAYER = (40, 0)
-DEFAULT_NUM_POINTS = 300
+DRC_MARKER_LAYER = (99, 0)
 
 ONE_INCH_IN_MICROMETER = 25400
 
 
+@profiled
 @gf.cell
 def merge_referenced_shapes(
     component: gf.Component,
@@ -43,46 +52,152 @@ def merge_referenced_shapes(
         gf.Component: A component with merged geometries.
     """
     merged_component = gf.Component()
-    for lyr, polygons in component.get_polygons(merge=True).items():
+    # Component.get_polygons refuses to merge locked (cached) cells although merging
+    # only reads them, which breaks merge_decorator on top of gf.cell builders
+    for lyr, polygons in gf.functions.get_polygons(component, merge=True).items():
         for polygon in polygons:
             merged_component.add_polygon(polygon, layer=lyr)
     merged_component.add_ports(component.ports)
     return merged_component
 
 
+@profiled
 @gf.cell
 def smooth_corners(
     component: gf.Component,
     radius: float = 1.0,
-    num_points: int = DEFAULT_NUM_POINTS,
+    num_points: int = MAX_ARC_POINTS,
     layer: LayerSpec = DEFAULT_LAYER,
+    tolerance: float | None = None,
 ) -> gf.Component:
     """
     Smooths all corners in a component with a given radius.
 
+    The polygons of each layer are rounded together in one batched pass, the hull
+    and every hole of a polygon as separate rings, and the number of points of
+    each fillet is chosen so that its chord error stays below the tolerance.
+
     Args:
         component (gf.Component): The component whose corners will be smoothed.
         radius (float): Rounding radius in microns.
-        num_points (int): Points per full circle for rounding.
+        num_points (int): Maximum points per full circle for rounding.
         layer (LayerSpec): GDS layer for the smoothed component.
+        tolerance (float | None): Maximum chord error of the rounded corners in microns.
+            Defaults to the arc tolerance of the layer.
 
     Returns:
         gf.Component: A new component with rounded corners.
     """
+    if tolerance is None:
+        tolerance = get_arc_tolerance(layer)
+
     c = gf.Component()
-    radius_db = int(round(radius * 1000))
-    for _, polygons in component.get_polygons().items():
+    dbu = component.kcl.dbu
+    for _, polygons in gf.functions.get_polygons(component).items():
+        # The hull and the holes of every polygon are rounded as separate rings
+        polygons = [polygon.to_dtype(dbu) for polygon in polygons]
+        rings = []
+        for polygon in polygons:
+            rings.append(_ring_points(polygon.each_point_hull()))
+            rings.extend(_ring_points(polygon.each_point_hole(hole)) for hole in range(polygon.holes()))
+        rounded = iter(round_corners_batch(rings, radius, tolerance, num_points))
         for polygon in polygons:
-            p_round = polygon.round_corners(radius_db, radius_db, num_points)
+            p_round = kdb.DPolygon(_to_dpoints(next(rounded)), True)
+            for _ in range(polygon.holes()):
+                p_round.insert_hole(_to_dpoints(next(rounded)), True)
             c.add_polygon(p_round, layer=layer)
     c.add_ports(component.ports)
     return c
 
 
+def _ring_points(points: Iterator[kdb.DPoint]) -> np.ndarray:
+    return np.array([(point.x, point.y) for point in points], dtype=float)
+
+
+def _to_dpoints(points: np.ndarray) -> list[kdb.DPoint]:
+    return [kdb.DPoint(x, y) for x, y in points]
+
+
+_preserve_hierarchy = False
+
+
+@contextmanager
+def preserve_hierarchy(enabled: bool = True) -> Iterator[None]:
+    """
+    Context manager switching builders to the hierarchy preserving build mode.
+
+    In this mode builders keep references to their sub-cells instead of merging
+    them into flat polygons, so a cell placed many times is stored once. Merging
+    is left to the steps that need it, such as the pyaedt export.
+
+    Args:
+        enabled (bool): Whether to preserve the hierarchy inside the context.
+    """
+    global _preserve_hierarchy
+    previous = _preserve_hierarchy
+    _preserve_hierarchy = enabled
+    try:
+        yield
+    finally:
+        _preserve_hierarchy = previous
+
+
+def hierarchy_preserved() -> bool:
+    """
+    Returns:
+        bool: Whether builders currently keep references instead of merging.
+    """
+    return _preserve_hierarchy
+
+
+def build_settings() -> tuple:
+    """
+    Returns a hashable snapshot of the global settings changing the built geometry.
+
+    Returns:
+        tuple: The arc tolerance settings and the hierarchy preserving flag.
+    """
+    return arc_tolerance_state(), _preserve_hierarchy
+
+
+def config_cell(func):
+    """
+    Decorator caching a component builder on the configuration it is called with.
+
+    The builds are recorded in the default build graph (see
+    drawing.shared.BuildGraph), keyed on the structural hash of the configuration
+    and the global build settings (see `build_settings`), instead of on the
+    components passed to the underlying gf.cell builders. Equal immutable
+    configurations return the recorded cell right away, without copying or hashing
+    any component; mutable ones are built uncached. The cells are released by
+    the size limit of the graph, BuildGraph.prune and clear_config_cell_cache.
+
+    Args:
+        func: A function (or build method) taking a configuration and returning a component.
+
+    Returns:
+        The caching builder.
+    """
+    from .build_graph import tracked
+
+    return tracked(func, name=func.__qualname__)
+
+
+def clear_config_cell_cache() -> None:
+    """
+    Drops every cell recorded in the default build graph.
+    """
+    from .build_graph import default_build_graph
+
+    default_build_graph().clear()
+
+
 def merge_decorator(func):
     """
     Decorator that merges referenced shapes after the decorated function returns a component.
 
+    The component is returned as is in the hierarchy preserving build mode.
+
     Args:
         func: The function that builds a component.
 
@@ -92,6 +207,8 @@ def merge_decorator(func):
     @wraps(func)
     def foo(*args, **kwargs):
         c = func(*args, **kwargs)
+        if _preserve_hierarchy:
+            return c
         return merge_referenced_shapes(c)
     return foo
 
@@ -2,8 +2,8 @@ from drawing.base_config import BaseConfig
 from drawing.junction.regular_arm import RegularArmConfig
 import gdsfactory as gf
 from ..junction import BaseJunctionConfig, SymmetricJunctionConfig
+from ..shared import config_cell
 from pydantic import ConfigDict, computed_field
-from pyparsing import cached_property
 
 class SnailConfig(BaseConfig):
     """Configuration for a squid component.
@@ -32,15 +32,16 @@ class SnailConfig(BaseConfig):
 
     model_config = ConfigDict(frozen=True)
 
+    @config_cell
     def build(self) -> gf.Component:
         return SnailConfig.snail(
             flux_hole_width=self.flux_hole_width,
             flux_hole_bar_length=self.flux_hole_bar_length,
 
-            top_left_junction=self.top_left_junction.build().copy(),
-            top_middle_junction=self.top_middle_junction.build().copy(),
-            top_right_junction=self.top_right_junction.build().copy(),
-            bottom_junction=self.bottom_junction.build().copy(),
+            top_left_junction=self.top_left_junction.build(),
+            top_middle_junction=self.top_middle_junction.build(),
+            top_right_junction=self.top_right_junction.build(),
+            bottom_junction=self.bottom_junction.build(),
             layer=self.layer,
 
             # Port names from their respective configs
@@ -155,7 +156,9 @@ class SnailConfig(BaseConfig):
 
     def validate(self) -> None:
         super().validate()
-        self.top_junction.validate()
+        self.top_left_junction.validate()
+        self.top_middle_junction.validate()
+        self.top_right_junction.validate()
         self.bottom_junction.validate()
         if self.flux_hole_width <= 0:
             raise ValueError("Flux hole width must be positive.")
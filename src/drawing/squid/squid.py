@@ -1,6 +1,7 @@
 from drawing.base_config import BaseConfig
 import gdsfactory as gf
 from ..junction import BaseJunctionConfig, SymmetricJunctionConfig
+from ..shared import config_cell
 from pydantic import ConfigDict
 
 class SquidConfig(BaseConfig):
@@ -25,13 +26,14 @@ class SquidConfig(BaseConfig):
 
     model_config = ConfigDict(frozen=True)
 
+    @config_cell
     def build(self) -> gf.Component:
         return SquidConfig.squid(
             flux_hole_width=self.flux_hole_width,
             flux_hole_length=self.flux_hole_length,
             flux_hole_bar_length=self.flux_hole_bar_length,
-            top_junction=self.top_junction.build().copy(),
-            bottom_junction=self.bottom_junction.build().copy(),
+            top_junction=self.top_junction.build(),
+            bottom_junction=self.bottom_junction.build(),
             left_port_name=self.LEFT_CONNECTING_PORT_NAME,
             right_port_name=self.RIGHT_CONNECTING_PORT_NAME,
             layer=self.layer,
@@ -1,22 +1,131 @@
 from drawing.test_junctions.base_test_junctions import BaseTestJunctionsConfig
 from drawing.transmon.transmon import TransmonConfig
+import numpy as np
 import gdsfactory as gf
 
 class FiveTestJunctionsConfig(BaseTestJunctionsConfig):
-    
+    """
+    Configuration for a field of junction test structures.
+
+    Every test structure is the transmon of transmonConfig, whose pads serve as
+    probe pads, with its junction gap and arm width changed. The gap lengths
+    span gap_start_length to gap_end_length along the columns and the arm widths
+    span the rows. Each distinct structure is built once and placed by reference.
+    The design table of the field is computed from the configuration alone, the
+    centers of the structures together with the layout.
+
+    Attributes:
+        gap_start_length (float): Junction gap length of the first column.
+        gap_end_length (float): Junction gap length of the last column.
+        gap_count (int): Number of gap lengths, i.e. of columns.
+        arm_widths (tuple[float, ...]): Arm width of every row. Empty for a single row
+            keeping the arm width of transmonConfig.
+        width_path (str): Dotted path of the arm width field in transmonConfig.
+        lead_width_path (str | None): Dotted path of the lead width following the arm width,
+            so that the arms stay connected to the probe pads. None keeps the lead width.
+        spacing (float): Spacing between neighbouring test structures in micrometers.
+        transmonConfig (TransmonConfig): Configuration of the test structures.
+    """
+
     gap_start_length: float = 1.0
     gap_end_length: float = 5.0
+    gap_count: int = 5
+    arm_widths: tuple[float, ...] = ()
+    width_path: str = "junction.arm.width"
+    lead_width_path: str | None = "taper.narrow_width"
+    spacing: float = 200
     transmonConfig: TransmonConfig = TransmonConfig()
 
     def build(self) -> gf.Component:
-        return FiveTestJunctionsConfig.fiveTestJunctionsConfig()
-    
+        return self.compose()[0]
+
+    def compose(self) -> tuple[gf.Component, list[dict]]:
+        """
+        Builds the test junction field and computes its design table.
+
+        Returns:
+            tuple[gf.Component, list[dict]]: The field component, centered on the origin,
+                and the design table of `design_table` with the center of every test structure.
+        """
+        configs = self.structure_configs()
+        unique_configs = list(dict.fromkeys(config for row in configs for config in row))
+        structures = tuple(config.build() for config in unique_configs)
+        structure_index = {config: index for index, config in enumerate(unique_configs)}
+
+        pitch_x = max(structure.xmax - structure.xmin for structure in structures) + self.spacing
+        pitch_y = max(structure.ymax - structure.ymin for structure in structures) + self.spacing
+        rows, columns = len(configs), len(configs[0])
+
+        placements = []
+        table = self.design_table(configs)
+        for entry in table:
+            config = configs[entry["row"]][entry["column"]]
+            x = (entry["column"] - (columns - 1) / 2) * pitch_x
+            y = ((rows - 1) / 2 - entry["row"]) * pitch_y
+            placements.append((structure_index[config], x, y))
+            entry["center"] = (x, y)
+
+        component = FiveTestJunctionsConfig.fiveTestJunctionsConfig(
+            structures=structures,
+            placements=tuple(placements),
+        )
+        return component, table
+
     @gf.cell
     @staticmethod
-    def fiveTestJunctionsConfig() -> gf.Component:
+    def fiveTestJunctionsConfig(
+        structures: tuple[gf.Component, ...],
+        placements: tuple[tuple[int, float, float], ...],
+    ) -> gf.Component:
         c = gf.Component()
+        for index, x, y in placements:
+            structure = structures[index]
+            ref = c << structure
+            ref.move((x - structure.center[0], y - structure.center[1]))
         return c
 
+    def design_table(self, configs: list[list[TransmonConfig]] | None = None) -> list[dict]:
+        """
+        Computes the design table of the field without building it.
+
+        Args:
+            configs (list[list[TransmonConfig]] | None): The test structure configurations
+                of `structure_configs`, computed if None.
+
+        Returns:
+            list[dict]: One row per test structure with its name, grid row and column,
+                junction type, gap length and arm width.
+        """
+        configs = configs if configs is not None else self.structure_configs()
+        return [
+            {
+                "name": f"R{row}C{column}",
+                "row": row,
+                "column": column,
+                "type": config.junction.junction_type,
+                "gap": config.junction.gap_length,
+                "arm width": _path_value(config, self.width_path),
+            }
+            for row, row_configs in enumerate(configs)
+            for column, config in enumerate(row_configs)
+        ]
+
+    def structure_configs(self) -> list[list[TransmonConfig]]:
+        """
+        Returns:
+            list[list[TransmonConfig]]: Configuration of every test structure, per row and column.
+        """
+        gaps = np.linspace(self.gap_start_length, self.gap_end_length, self.gap_count).tolist()
+        widths = self.arm_widths or (_path_value(self.transmonConfig, self.width_path),)
+        configs = []
+        for width in widths:
+            width_updates = {self.width_path: width}
+            if self.lead_width_path is not None:
+                width_updates[self.lead_width_path] = width
+            row_config = self.transmonConfig.with_updates(width_updates)
+            configs.append([row_config.with_updates({"junction.gap_length": gap}) for gap in gaps])
+        return configs
+
     def getData(self) -> dict:
         # test junctions:
         #   type:
@@ -30,13 +139,28 @@ class FiveTestJunctionsConfig(BaseTestJunctionsConfig):
         rtn["type"] = self.transmonConfig.junction.junction_type
         rtn["BRIDGE START GAP"] = self.gap_start_length
         rtn["BRIDGE END GAP"] = self.gap_end_length
-        leftFinger = self.transmonConfig.junction.get_left_arm_config().to_json()
-        print(leftFinger)
-        rtn["LEFT FINGER"] = leftFinger
-        rightFinger = self.transmonConfig.junction.get_right_arm_config().to_json()
-        print(rightFinger)
-        rtn["RIGHT FINGER"] = rightFinger
+        rtn["LEFT FINGER"] = self.transmonConfig.junction.get_left_arm_config().model_dump(mode="json")
+        rtn["RIGHT FINGER"] = self.transmonConfig.junction.get_right_arm_config().model_dump(mode="json")
+        rtn["JUNCTIONS"] = self.design_table()
         return rtn
 
     def validate(self) -> None:
-        pass
\ No newline at end of file
+        super().validate()
+        self.transmonConfig.validate()
+        if self.gap_start_length <= 0 or self.gap_end_length <= 0:
+            raise ValueError("Test junction gap lengths must be positive.")
+        if self.gap_count < 1:
+            raise ValueError("Test junction field must have at least one gap length.")
+        if any(width <= 0 for width in self.arm_widths):
+            raise ValueError("Test junction arm widths must be positive.")
+        if self.spacing < 0:
+            raise ValueError("Test junction spacing must be greater than or equal to zero.")
+        for row in self.structure_configs():
+            for config in row:
+                config.validate()
+
+
+def _path_value(config, path: str):
+    for name in path.split("."):
+        config = getattr(config, name)
+    return config
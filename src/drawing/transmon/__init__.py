@@ -1,4 +1,5 @@
 from .pad import PadConfig
 from .taper import TaperConfig
 from .antenna import AntennaConfig
-from .transmon import TransmonConfig
\ No newline at end of file
+from .transmon import TransmonConfig
+from .sweep import SweepResult, sweep_transmon, expand_grid, apply_flat_overrides
\ No newline at end of file
@@ -2,6 +2,7 @@ import gdsfactory.components as gc
 import gdsfactory as gf
 from pydantic import ConfigDict, Field
 from ..base_config import BaseConfig
+from ..shared import circle_angle_resolution
 import gdsfactory as gf
 
 class AntennaConfig(BaseConfig):
@@ -32,6 +33,7 @@ class AntennaConfig(BaseConfig):
             width=self.width,
             radius=self.radius,
             layer=self.layer,
+            angle_resolution=circle_angle_resolution(self.radius, self.layer),
             start_port_name=self.ANTENNA_START_PORT,
         )
 
@@ -42,13 +44,14 @@ class AntennaConfig(BaseConfig):
         width: float,
         radius: float,
         layer: tuple[int, int],
+        angle_resolution: float,
         start_port_name: str,
     ) -> gf.Component:
         c = gf.Component()
 
         # Rectangular pad (compass shape)
         compass = gc.compass(size=(length, width), layer=layer)
-        circle = gc.circle(radius=radius, layer=layer).copy()
+        circle = gc.circle(radius=radius, angle_resolution=angle_resolution, layer=layer).copy()
 
         circle.add_port(
             name="center",
@@ -1,7 +1,7 @@
 from pydantic import ConfigDict, Field
 from ..base_config import BaseConfig
 import gdsfactory as gf
-from ..shared import smooth_corners
+from ..shared import smooth_corners, get_arc_tolerance
 
 class PadConfig(BaseConfig):
     """
@@ -27,6 +27,7 @@ class PadConfig(BaseConfig):
             length=self.length,
             radius=self.radius,
             layer=self.layer,
+            tolerance=get_arc_tolerance(self.layer),
             left_port_name=self.LEFT_CONNECTING_PORT_NAME,
             right_port_name=self.RIGHT_CONNECTING_PORT_NAME,
         )
@@ -38,6 +39,7 @@ class PadConfig(BaseConfig):
         length: float,
         radius: float,
         layer: tuple[int, int],
+        tolerance: float,
         left_port_name: str,
         right_port_name: str,
     ) -> gf.Component:
@@ -55,7 +57,7 @@ class PadConfig(BaseConfig):
         c.add_port(name=right_port_name, center=(length, width / 2), width=width, orientation=0, layer=layer, port_type="electrical")
 
         if radius > 0:
-            c = smooth_corners(c, radius=radius, layer=layer)
+            c = smooth_corners(c, radius=radius, layer=layer, tolerance=tolerance)
 
         return c
 
@@ -64,8 +66,8 @@ class PadConfig(BaseConfig):
         Validates the pad configuration.
 
         Raises:
-            ValueError: If the pad width or height is non-positive.
+            ValueError: If the pad width or length is non-positive.
             TypeError: If the layer is not of type LayerSpec.
         """
-        if self.width <= 0 or self.height <= 0:
-            raise ValueError("Pad width and height must be positive.")
\ No newline at end of file
+        if self.width <= 0 or self.length <= 0:
+            raise ValueError("Pad width and length must be positive.")
\ No newline at end of file
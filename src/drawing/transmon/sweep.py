@@ -0,0 +1,206 @@
+"""
+Parallel parameter sweeps over transmon configurations.
+
+A sweep takes a base TransmonConfig and a set of points, each point being a flat
+dictionary of overrides in the format used by TransmonConfig.load_from_flat_dict
+(e.g. {"pad_width": 60, "junction_gap_length": 0.2}) or dotted paths
+(e.g. {"junction.arm.width": 0.2}). Every unique point is built, validated and
+written to GDS in a process pool, and results are streamed back as soon as each
+point finishes. The workers activate the PDK active in the calling process, or
+the generic PDK if none is, so sweeps run under the spawn start method as well.
+"""
+
+import itertools
+import os
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import gdsfactory as gf
+from pydantic import BaseModel
+
+from ..base_config import BaseConfig
+from ..config_table import resolve_flat_key
+from .transmon import TransmonConfig
+
+
+class SweepResult(BaseModel):
+    """
+    Outcome of a single sweep point.
+
+    Attributes:
+        index (int): Index of the point in the sweep input.
+        point (dict): The overrides of the point.
+        key (str): Stable identifier of the resulting configuration, also used in the GDS file name.
+        gds_path (Path | None): Path of the written GDS file, None if the point failed.
+        error (str | None): Traceback of the failure, None if the point succeeded.
+        duplicates (list[int]): Indices of later points resolving to the same configuration.
+    """
+    index: int
+    point: dict
+    key: str = ""
+    gds_path: Path | None = None
+    error: str | None = None
+    duplicates: list[int] = []
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def expand_grid(grid: dict[str, Iterable[Any]]) -> list[dict]:
+    """
+    Expands a grid of parameter values into the list of all its points.
+
+    Args:
+        grid (dict[str, Iterable]): Parameter name to the values it takes.
+
+    Returns:
+        list[dict]: One flat dictionary per grid point.
+    """
+    names = list(grid.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def apply_flat_overrides(config: BaseConfig, point: dict) -> BaseConfig:
+    """
+    Returns a copy of a configuration with the overrides of a sweep point applied.
+
+    Keys are either dotted paths ("junction.arm.width") or flat prefixed names
+    ("junction_arm_width"), resolved against the configuration fields. Untouched
+    sub-configurations are shared with the original configuration.
+
+    Args:
+        config (BaseConfig): The base configuration.
+        point (dict): Overrides to apply.
+
+    Returns:
+        BaseConfig: The updated configuration.
+
+    Raises:
+        KeyError: If a key does not resolve to a configuration field.
+    """
+    updates = {
+        key if "." in key else ".".join(resolve_flat_key(config, key)): value
+        for key, value in point.items()
+    }
+    return config.with_updates(updates)
+
+
+def sweep_transmon(
+    base: TransmonConfig,
+    points: Iterable[dict] | dict[str, Iterable[Any]],
+    output_dir: str | Path,
+    max_workers: int | None = None,
+    validate: bool = True,
+) -> Iterator[SweepResult]:
+    """
+    Builds, validates and writes GDS files for every point of a sweep in parallel.
+
+    Identical points are built once, each unique configuration is written to a
+    stable file name derived from its content, and failures are reported per point
+    without stopping the sweep.
+
+    Args:
+        base (TransmonConfig): Configuration the overrides are applied to.
+        points (Iterable[dict] | dict[str, Iterable]): Flat override dictionaries, or a grid
+            mapping parameter names to values which is expanded with `expand_grid`.
+        output_dir (str | Path): Directory the GDS files are written to.
+        max_workers (int | None): Size of the process pool. Defaults to the number of CPUs.
+            With 1 the sweep runs in the current process.
+        validate (bool): Whether to validate each configuration before building it.
+
+    Yields:
+        SweepResult: One result per unique point, in completion order.
+    """
+    if isinstance(points, dict):
+        points = expand_grid(points)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    pending: dict[str, tuple[SweepResult, TransmonConfig]] = {}
+    for index, point in enumerate(points):
+        try:
+            config = apply_flat_overrides(base, point)
+        except Exception:
+            yield SweepResult(index=index, point=point, error=traceback.format_exc())
+            continue
+
+        key = sweep_key(config)
+        if key in pending:
+            pending[key][0].duplicates.append(index)
+            continue
+        result = SweepResult(index=index, point=point, key=key)
+        pending[key] = (result, config)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    pdk = _sweep_pdk()
+    if max_workers <= 1:
+        pdk.activate()
+        for key, (result, config) in pending.items():
+            yield _finish(result, _build_point(config, output_dir / f"transmon_{key}.gds", validate))
+        return
+
+    executor: Executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_activate_pdk, initargs=(pdk,))
+    try:
+        futures = {
+            executor.submit(_build_point, config, output_dir / f"transmon_{key}.gds", validate): result
+            for key, (result, config) in pending.items()
+        }
+        for future in as_completed(futures):
+            result = futures[future]
+            try:
+                outcome = future.result()
+            except Exception:
+                # The worker process itself died, e.g. the pool broke
+                outcome = (None, traceback.format_exc())
+            yield _finish(result, outcome)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def sweep_key(config: BaseConfig) -> str:
+    """
+    Returns a short, stable identifier of a configuration's content.
+
+    Args:
+        config (BaseConfig): The configuration.
+
+    Returns:
+        str: The first 16 hex characters of the structural hash of the configuration.
+    """
+    return config.structural_hash()[:16]
+
+
+def _sweep_pdk() -> gf.Pdk:
+    try:
+        return gf.get_active_pdk()
+    except ValueError:
+        return gf.gpdk.PDK
+
+
+def _activate_pdk(pdk: gf.Pdk) -> None:
+    pdk.activate()
+
+
+def _build_point(config: TransmonConfig, gds_path: Path, validate: bool) -> tuple[str | None, str | None]:
+    try:
+        if validate:
+            config.validate()
+        config.build().write_gds(gds_path, with_metadata=False)
+    except Exception:
+        return None, traceback.format_exc()
+    return str(gds_path), None
+
+
+def _finish(result: SweepResult, outcome: tuple[str | None, str | None]) -> SweepResult:
+    gds_path, error = outcome
+    return result.model_copy(update={
+        "gds_path": Path(gds_path) if gds_path is not None else None,
+        "error": error,
+    })
+
@@ -1,15 +1,16 @@
 from drawing.junction import BaseJunctionConfig, SymmetricJunctionConfig
-from drawing.shared.utilities import JUNCTION_PICTURE_LAYER
+from drawing.shared.utilities import DEFAULT_LAYER, JUNCTION_PICTURE_LAYER
 import gdsfactory as gf
 import gdsfactory.components as gc
-from ..shared import smooth_corners, merge_referenced_shapes
-from typing import TypeVar, Type
-import matplotlib.pyplot as plt
+from ..shared import smooth_corners, merge_referenced_shapes, config_cell, get_arc_tolerance, hierarchy_preserved
+from functools import lru_cache
+from pathlib import Path
+from typing import Sequence, TypeVar, Type
 from typing_extensions import Self
 from pydantic import ConfigDict, Field, model_validator
 from pydantic import computed_field
-from pyparsing import cached_property
 from ..base_config import BaseConfig
+from ..config_table import LoadedConfigs, load_configs
 from . import TaperConfig, PadConfig
 from .antenna import AntennaConfig
 import gdsfactory as gf
@@ -27,21 +28,30 @@ T = TypeVar('T', bound=BaseConfig)
 
 def load_relevant_parameters(parameters: dict, cls: Type[T], with_prefix: str = None) -> T:
     if with_prefix:
-        parameters = {k[len(with_prefix):]: v
-                      for k, v in filter(lambda x: x[0].startswith(with_prefix), parameters.items())}
+        parameters = {k[len(with_prefix):]: v for k, v in parameters.items() if k.startswith(with_prefix)}
 
-    relevant_parameters_names = set(cls.model_fields.keys()) & set(parameters.keys())
-    relevant_parameters = {k: parameters[k] for k in relevant_parameters_names}
+    field_names = _field_names(cls)
+    relevant_parameters = {k: v for k, v in parameters.items() if k in field_names}
     return cls(**relevant_parameters)
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls: Type[BaseConfig]) -> frozenset[str]:
+    return frozenset(cls.model_fields)
+
+
 def create_nested_from_flat_by_prefix(prefixes: list[str], d: dict):
-    result = {}
-    for prefix in prefixes:
-        parameters = {k.replace(f'{prefix}_', ''): d[k] for k in filter(lambda x: x.startswith(f'{prefix}_'), d.keys())}
-        # filter none
-        parameters = {k: v for k, v in parameters.items() if v is not None}
-        result[prefix] = parameters
+    result = {prefix: {} for prefix in prefixes}
+    # Longest prefixes first, so "integration_config_x" is not taken by an "integration" prefix
+    ordered_prefixes = sorted(((f'{prefix}_', prefix) for prefix in prefixes), key=lambda p: len(p[0]), reverse=True)
+    # Single pass over the dictionary; None values are filtered
+    for k, v in d.items():
+        if v is None:
+            continue
+        for full_prefix, prefix in ordered_prefixes:
+            if k.startswith(full_prefix):
+                result[prefix][k[len(full_prefix):]] = v
+                break
     return result
 
 
@@ -78,19 +88,20 @@ class TransmonConfig(BaseConfig):
 
     model_config = ConfigDict(frozen=True)
 
+    @config_cell
     def build(self) -> gf.Component:
         return TransmonConfig.transmon(
             # integration_config=self.integration_config,
-            pad=self.pad.build().copy(),
-            taper=self.taper.build().copy(),
-            junction=self.junction.build().copy(),
-            antenna=self.antenna.build().copy(),
+            pad=self.pad.build(),
+            taper=self.taper.build(),
+            junction=self.junction.build(),
+            antenna=self.antenna.build(),
             layer=self.layer,
             juction_taper_overlap=self.juction_taper_overlap,
             taper_narrow_width=self.taper.narrow_width,
             pad_width=self.pad.width,
+            rounding_tolerance=get_arc_tolerance(DEFAULT_LAYER),
 
-            
             junction_right_connecting_port=self.junction.RIGHT_CONNECTING_PORT_NAME,
             junction_left_connecting_port=self.junction.LEFT_CONNECTING_PORT_NAME,
             pad_right_connecting_port=self.pad.RIGHT_CONNECTING_PORT_NAME,
@@ -101,7 +112,8 @@ class TransmonConfig(BaseConfig):
             junction_box_image_add_top=self.junction_box_image_add_top,
             junction_box_image_add_bottom=self.junction_box_image_add_bottom,
             junction_box_image_add_left=self.junction_box_image_add_left,
-            junction_box_image_add_right=self.junction_box_image_add_right
+            junction_box_image_add_right=self.junction_box_image_add_right,
+            merge=not hierarchy_preserved(),
         )
 
     @gf.cell
@@ -122,10 +134,12 @@ class TransmonConfig(BaseConfig):
         antenna_start_port: str ,
         taper_narrow_width: float,
         pad_width: float,
+        rounding_tolerance: float,
         junction_box_image_add_top: float,
         junction_box_image_add_bottom: float,
         junction_box_image_add_left: float,
-        junction_box_image_add_right: float
+        junction_box_image_add_right: float,
+        merge: bool = True,
     ) -> gf.Component:
         pt = gf.Component()
 
@@ -135,18 +149,16 @@ class TransmonConfig(BaseConfig):
         pad_ref.connect(pad_right_connecting_port, taper_ref.ports[taper_wide_connecting_port], allow_width_mismatch=True)
 
 
-        pt = smooth_corners(merge_referenced_shapes(pt)).copy()
-        
-        pt_right = pt.copy().mirror_x()
-
-        pt_right.add_port(name="right_junction_connection", center=(pt_right.xmin,0), width=taper_narrow_width, orientation=180, layer=layer, port_type="electrical")
-        pt_right.add_port(name="antenna_connection", center=(pt_right.xmax,0), width=pad_width, layer=layer, port_type="electrical")
+        pt = smooth_corners(merge_referenced_shapes(pt), tolerance=rounding_tolerance).copy()
 
         pt.add_port(name="left_junction_connection", port=taper_ref.ports[taper_narrow_connecting_port])
+        # Ports of the mirrored copy on the right side of the junction
+        pt.add_port(name="right_junction_connection", center=(pt.xmax, 0), width=taper_narrow_width, orientation=0, layer=layer, port_type="electrical")
+        pt.add_port(name="antenna_connection", center=(pt.xmin, 0), width=pad_width, orientation=180, layer=layer, port_type="electrical")
 
         c = gf.Component()
 
-        pt_right_ref = c << pt_right
+        pt_right_ref = c << pt
         pt_left_ref = c << pt
 
         junction_ref = c << junction
@@ -154,7 +166,7 @@ class TransmonConfig(BaseConfig):
         c << gf.components.bbox(junction_ref, layer=JUNCTION_PICTURE_LAYER, top=junction_box_image_add_top, bottom=junction_box_image_add_bottom, right=junction_box_image_add_right, left=junction_box_image_add_left)
 
         pt_left_ref.connect("left_junction_connection", junction_ref.ports[junction_right_connecting_port], allow_layer_mismatch=True)
-        pt_right_ref.connect("right_junction_connection", junction_ref.ports[junction_left_connecting_port], allow_layer_mismatch=True)
+        pt_right_ref.connect("right_junction_connection", junction_ref.ports[junction_left_connecting_port], allow_layer_mismatch=True, mirror=True)
 
         pt_left_ref.movex(-juction_taper_overlap)
         pt_right_ref.movex(juction_taper_overlap)
@@ -163,6 +175,8 @@ class TransmonConfig(BaseConfig):
 
         antenna_ref.connect(antenna_start_port, pt_right_ref.ports["antenna_connection"], allow_width_mismatch=True)
 
+        if not merge:
+            return c.mirror_x()
         return merge_referenced_shapes(c.mirror_x())
 
     @classmethod
@@ -186,6 +200,41 @@ class TransmonConfig(BaseConfig):
         nested_dict['junction']['type'] = nested_dict['junction'].get('type', 'regular')
         return TransmonConfig(**nested_dict)
 
+    @classmethod
+    def load_from_table(
+        cls,
+        table: dict[str, Sequence] | str | Path,
+        base: "TransmonConfig | None" = None,
+        ranges: dict[str, tuple[float | None, float | None]] | None = None,
+    ) -> LoadedConfigs:
+        """
+        Creates one TransmonConfig per row of a flat sweep table, e.g. a CSV or Parquet sweep plan.
+
+        Columns use the keys of load_from_flat_dict or dotted paths. Columns are
+        validated in bulk and identical sub-configurations are shared between rows,
+        see drawing.config_table.load_configs.
+
+        Args:
+            table (dict[str, Sequence] | str | Path): Columns of the table, or the path of a CSV or Parquet file.
+            base (TransmonConfig | None): Configuration the rows are applied to. Defaults to TransmonConfig().
+            ranges (dict[str, tuple[float | None, float | None]] | None): Inclusive bounds per column.
+
+        Returns:
+            LoadedConfigs: The configurations, None for failed rows, and the errors per row.
+        """
+        return load_configs(table, base if base is not None else cls(), ranges=ranges)
+
+    def validate(self) -> None:
+        """
+        Validates the pad, taper, junction and antenna configurations.
+        Raises:
+            ValueError: If any of the validation checks fail.
+        """
+        self.pad.validate()
+        self.taper.validate()
+        self.junction.validate()
+        self.antenna.validate()
+
     @model_validator(mode='after')
     def validate_components(self) -> Self:
         """
@@ -200,9 +249,6 @@ class TransmonConfig(BaseConfig):
             return self
         
         # Validate individual components
-        self.pad.validate()
-        self.taper.validate()
-        self.junction.validate()
-        self.antenna.validate()
+        self.validate()
 
         return self
\ No newline at end of file
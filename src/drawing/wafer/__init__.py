@@ -4,4 +4,5 @@ from .uniform_cut_indicator import UniformCutIndicatorConfig
 from .wafer_regular_split import WaferRegularSplitConfig
 from .base_align_cross  import BaseAlignCrossConfig
 from .ebeam_base_align_cross import EBeamAlignCrossConfig
-from .laser_align_cross import LaserAlignCrossConfig
\ No newline at end of file
+from .laser_align_cross import LaserAlignCrossConfig
+from .step_and_repeat_wafer import StepAndRepeatWaferConfig
@@ -0,0 +1,153 @@
+import numpy as np
+from .wafer import WaferConfig
+from ..base_config import BaseConfig
+import gdsfactory as gf
+
+class StepAndRepeatWaferConfig(WaferConfig):
+    """
+    Wafer configuration placing its samples and test junctions in a step-and-repeat die grid.
+
+    The die pitch is the largest die size plus the street width, and the grid is
+    centered on the wafer with a die center at the origin (shifted by grid_offset).
+    Rows cycle through the die configurations, samples first then test junctions.
+    Every row is placed as a single array reference spanning the dies of that row
+    lying entirely inside the safe radius, so the dies are never copied.
+
+    Attributes:
+        street (float): Spacing between neighbouring dies in micrometers.
+        grid_offset (tuple[float, float]): Offset of the die grid from the wafer center in micrometers.
+    """
+
+    street: float = 200
+    grid_offset: tuple[float, float] = (0, 0)
+
+    def build(self) -> gf.Component:
+        return self.compose()[0]
+
+    def compose(self) -> tuple[gf.Component, list[dict]]:
+        """
+        Builds the wafer and computes its die table.
+
+        Returns:
+            tuple[gf.Component, list[dict]]: The wafer component and one row per placed die
+                with its grid row and column, the die configuration name and its center.
+        """
+        die_configs = self.die_configs
+        if len(die_configs) == 0:
+            return super().build(), []
+
+        dies = tuple(config.build() for config in die_configs)
+        pitch = self._pitch(dies)
+        placements = self._row_placements(pitch, len(dies))
+
+        component = StepAndRepeatWaferConfig.stepAndRepeatWafer(
+            wafer=super().build(),
+            dies=dies,
+            placements=tuple(placements),
+            column_pitch=pitch[0],
+        )
+
+        table = []
+        for row, die_index, first_column, columns, x, y in placements:
+            for column in range(first_column, first_column + columns):
+                table.append({
+                    "row": row,
+                    "column": column,
+                    "name": getattr(die_configs[die_index], "name", "") or type(die_configs[die_index]).__name__,
+                    "x": x + (column - first_column) * pitch[0],
+                    "y": float(y),
+                })
+        return component, table
+
+    @staticmethod
+    @gf.cell
+    def stepAndRepeatWafer(
+        wafer: gf.Component,
+        dies: tuple[gf.Component, ...],
+        placements: tuple[tuple[int, int, int, int, float, float], ...],
+        column_pitch: float,
+    ) -> gf.Component:
+        c = gf.Component()
+
+        c << wafer
+
+        for _, die_index, _, columns, x, y in placements:
+            die = dies[die_index]
+            row_ref = c.add_ref(die, columns=columns, rows=1, column_pitch=column_pitch)
+            # Move the die center of the first column to its grid position
+            row_ref.move((x - die.dbbox().center().x, y - die.dbbox().center().y))
+
+        return c
+
+    @property
+    def die_configs(self) -> list[BaseConfig]:
+        return [*self.samples, *self.testJunctions]
+
+    def _pitch(self, dies: tuple[gf.Component, ...]) -> tuple[float, float]:
+        return (
+            max(die.dbbox().width() for die in dies) + self.street,
+            max(die.dbbox().height() for die in dies) + self.street,
+        )
+
+    def _row_placements(
+        self,
+        pitch: tuple[float, float],
+        die_count: int,
+    ) -> list[tuple[int, int, int, int, float, float]]:
+        """
+        Finds the dies of each grid row lying entirely inside the safe radius.
+
+        A die is kept when its four corners are inside the safe circle, which is
+        exact since the circle is convex. The kept dies of a row are contiguous
+        for the same reason.
+
+        Args:
+            pitch (tuple[float, float]): Column and row pitch of the grid.
+            die_count (int): Number of distinct die configurations cycled through the rows.
+
+        Returns:
+            list[tuple[int, int, int, int, float, float]]: Per non-empty row, the row index,
+                the die configuration index, the first column index, the column count,
+                the x coordinate of the first die center and the y coordinate of the die centers.
+        """
+        pitch_x, pitch_y = pitch
+        half_x, half_y = (pitch_x - self.street) / 2, (pitch_y - self.street) / 2
+        offset_x, offset_y = self.grid_offset
+
+        max_columns = int(np.ceil((self.safe_radius + abs(offset_x)) / pitch_x))
+        max_rows = int(np.ceil((self.safe_radius + abs(offset_y)) / pitch_y))
+        columns = np.arange(-max_columns, max_columns + 1)
+        rows = np.arange(-max_rows, max_rows + 1)
+
+        # The farthest corner of a die from the wafer center decides its inclusion
+        center_x = columns * pitch_x + offset_x
+        center_y = rows * pitch_y + offset_y
+        far_x = np.abs(center_x) + half_x
+        far_y = np.abs(center_y) + half_y
+        inside = far_x[None, :] ** 2 + far_y[:, None] ** 2 <= self.safe_radius ** 2
+
+        placements = []
+        for row_number, (row, y) in enumerate(zip(rows, center_y)):
+            kept = np.flatnonzero(inside[row_number])
+            if len(kept) == 0:
+                continue
+            placements.append((
+                int(row),
+                int(row) % die_count,
+                int(columns[kept[0]]),
+                len(kept),
+                float(center_x[kept[0]]),
+                float(y),
+            ))
+        return placements
+
+    def validate(self) -> None:
+        super().validate()
+        if self.street < 0:
+            raise ValueError(
+                "Step and repeat wafer street must be greater than or equal to zero."
+            )
+        if self.safe_radius > self.radius:
+            raise ValueError(
+                "Step and repeat wafer safe radius must be less than or equal to the wafer radius."
+            )
@@ -3,6 +3,7 @@ import json
 from drawing.sample.base_sample import BaseSampleConfig
 from drawing.test_junctions.base_test_junctions import BaseTestJunctionsConfig
 from drawing.shared.utilities import DEFAULT_WAFER_LAYER
+from drawing.shared.arc_tolerance import circle_angle_resolution
 
 from create_directory import create_design_json
 from ..base_config import BaseConfig
@@ -36,7 +37,10 @@ class WaferConfig(BaseConfig):
             radius=self.radius,
             safe_radius=self.safe_radius,
             layer=self.layer,
-            safe_layer=self.safe_layer
+            safe_layer=self.safe_layer,
+            angle_resolution=circle_angle_resolution(self.radius, self.layer),
+            # The safe area is an outline like the wafer itself, drawn with the wafer layer tolerance
+            safe_angle_resolution=circle_angle_resolution(self.safe_radius, self.layer),
         )
 
     @staticmethod
@@ -46,12 +50,14 @@ class WaferConfig(BaseConfig):
         safe_radius: float,
         layer: gf.typings.LayerSpec,
         safe_layer: gf.typings.LayerSpec | None,
+        angle_resolution: float = 2.5,
+        safe_angle_resolution: float = 2.5,
     ) -> gf.Component:
         c = gf.Component()
 
-        c << gf.components.circle(radius=radius, layer=layer)
+        c << gf.components.circle(radius=radius, angle_resolution=angle_resolution, layer=layer)
         if safe_layer != None:
-            c << gf.components.circle(radius=safe_radius, layer=safe_layer)
+            c << gf.components.circle(radius=safe_radius, angle_resolution=safe_angle_resolution, layer=safe_layer)
 
         return c
     